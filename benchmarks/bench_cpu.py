@@ -0,0 +1,166 @@
+"""
+Offline CPU benchmarks for the calc helpers, FX price extraction and model export.
+
+Runs on synthetic price histories (no network), reports the best wall time and the tracemalloc peak per operation
+and optionally compares both against a stored JSON baseline. benchmarks/baseline.json holds the results for the
+default arguments; compare against it, and regenerate it on the same machine when a change is meant to move the
+numbers:
+
+    python benchmarks/bench_cpu.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_cpu.py --save-baseline benchmarks/baseline.json
+
+Wall times depend on the machine, so a baseline from another machine is only indicative; peak memory is not.
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from equicast_pyutils.extractors import FxDataExtractor  # noqa: E402
+from equicast_pyutils.extractors.calc_helpers import CalcHelpers  # noqa: E402
+from equicast_pyutils.extractors.rate_limiter import RateLimiter, set_default_rate_limiter  # noqa: E402
+from equicast_pyutils.models import ParquetDatasetWriter  # noqa: E402
+
+
+def synthetic_history(bars: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.2 * np.exp(np.cumsum(rng.normal(0, 0.005, bars)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, bars))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, bars))
+    idx = pd.date_range(end="2025-01-03", periods=bars, freq="B", tz="Europe/London")
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close, "Volume": 0}, index=idx)
+
+
+class FakeTicker:
+    """Stands in for yf.Ticker so extraction runs without the network."""
+
+    def __init__(self, ticker: str, history: pd.DataFrame):
+        self.ticker = ticker
+        self._history = history
+
+    def history(self, **kwargs):
+        return self._history
+
+
+def fx_extractor(history: pd.DataFrame, from_currency="GBP", to_currency="USD") -> FxDataExtractor:
+    extractor = FxDataExtractor(from_currency=from_currency, to_currency=to_currency, period="max")
+    extractor._yf_obj = FakeTicker(extractor.symbol, history)
+    return extractor
+
+
+def measure(func, repeat: int) -> dict:
+    func()  # warm-up
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak}
+
+
+def operations(bars: int, universe: int, workdir: Path) -> dict:
+    history = synthetic_history(bars)
+    close = history["Close"]
+    model = fx_extractor(history).extract_fx_prices()
+    models = [fx_extractor(synthetic_history(bars, seed=i), "C%02d" % i, "USD").extract_fx_prices()
+              for i in range(universe)]
+    matrix = pd.concat({m.pair: pd.Series(m.prices.close, index=m.prices.index) for m in models}, axis=1)
+
+    return {
+        "calc.volatility": lambda: CalcHelpers.calculate_volatility(close),
+        "calc.sharpe_ratio": lambda: CalcHelpers.calculate_sharpe_ratio(close),
+        "calc.max_drawdown": lambda: CalcHelpers.calculate_max_drawdown(close),
+        "calc.cagr": lambda: CalcHelpers.calculate_cagr(close),
+        "calc.rolling_metrics": lambda: CalcHelpers.calculate_rolling_metrics(close),
+        "calc.rolling_cagr": lambda: CalcHelpers.calculate_rolling_cagr(close),
+        "calc.cross_sectional_metrics": lambda: CalcHelpers.calculate_cross_sectional_metrics(matrix),
+        "calc.forecast_fx_prices": lambda: CalcHelpers.forecast_fx_prices(history, requested_days=bars),
+        "fx.extract_fx_prices": lambda: fx_extractor(history).extract_fx_prices(),
+        "model.to_dataframe": lambda: model._to_dataframe(),
+        "model.to_json": lambda: model.to_json(),
+        "model.to_parquet": lambda: model.to_parquet("prices.parquet", str(workdir / "single")),
+        "dataset.write": lambda: ParquetDatasetWriter(str(workdir / "dataset")).write(models),
+    }
+
+
+def run(bars_list, universe: int, repeat: int) -> dict:
+    set_default_rate_limiter(RateLimiter(rate=1e6, burst=1e6, max_rate=1e6))
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for bars in bars_list:
+            for name, func in operations(bars, universe, Path(tmp)).items():
+                results[f"{name}[bars={bars},universe={universe}]"] = measure(func, repeat)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float, memory_tolerance: float) -> list:
+    """(operation, metric, before, after) for every wall time or peak memory beyond its tolerance."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result["seconds"] > base["seconds"] * tolerance:
+            regressions.append((name, "seconds", base["seconds"], result["seconds"]))
+        if result["peak_bytes"] > base["peak_bytes"] * memory_tolerance:
+            regressions.append((name, "peak_bytes", base["peak_bytes"], result["peak_bytes"]))
+    return regressions
+
+
+def _format(metric: str, value: float) -> str:
+    return f"{value * 1000:.2f} ms" if metric == "seconds" else f"{value / 2 ** 20:.2f} MiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run offline CPU benchmarks for calc helpers and model export.")
+    parser.add_argument("--bars", type=int, nargs="+", default=[1000, 5000, 20000], help="History lengths")
+    parser.add_argument("--universe", type=int, default=20, help="Number of pairs for batch operations")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per operation (best is reported)")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="Write the results as a new baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="Allowed slowdown factor vs the baseline")
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=1.25, help="Allowed peak memory growth factor vs the baseline"
+    )
+    args = parser.parse_args()
+
+    results = run(args.bars, args.universe, args.repeat)
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else {}
+
+    print(f"{'operation':<70} {'ms':>10} {'peak MiB':>10} {'time vs base':>13} {'mem vs base':>12}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        time_ratio = f"{result['seconds'] / base['seconds']:.2f}x" if base else "-"
+        mem_ratio = f"{result['peak_bytes'] / max(base['peak_bytes'], 1):.2f}x" if base else "-"
+        print(
+            f"{name:<70} {result['seconds'] * 1000:>10.2f} {result['peak_bytes'] / 2 ** 20:>10.2f} "
+            f"{time_ratio:>13} {mem_ratio:>12}"
+        )
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(results, indent=4), encoding="utf-8")
+        print(f"✅ Baseline written to {args.save_baseline}")
+
+    regressions = compare(results, baseline, args.tolerance, args.memory_tolerance)
+    for name, metric, before, after in regressions:
+        print(f"❌ {name} regressed: {_format(metric, before)} -> {_format(metric, after)}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
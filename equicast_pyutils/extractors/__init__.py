@@ -1,7 +1,17 @@
 __all__ = [
+    "BatchFxDataExtractor",
+    "BatchResult",
+    "BatchStockDataExtractor",
+    "DataSource",
     "FxDataExtractor",
-    "StockDataExtractor"
+    "FxMatrixExtractor",
+    "MirrorSource",
+    "RecordReplaySource",
+    "StockDataExtractor",
+    "YFinanceSource"
 ]
 
+from .batch_data_extractor import BatchFxDataExtractor, BatchResult, BatchStockDataExtractor, FxMatrixExtractor
+from .data_sources import DataSource, MirrorSource, RecordReplaySource, YFinanceSource
 from .fx_data_extractor import FxDataExtractor
 from .stock_data_extractor import StockDataExtractor
@@ -0,0 +1,49 @@
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
+
+@dataclass
+class AsyncHelpers:
+    """Runs blocking upstream fetches off the event loop, capping how many are in flight at once."""
+    max_concurrency = 16
+    _executor = None
+    _semaphores = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def configure(max_concurrency: int = 16):
+        """Set the in-flight request cap; takes effect for event loops that have not run a fetch yet."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        if AsyncHelpers._executor is not None:
+            AsyncHelpers._executor.shutdown(wait=False)
+        AsyncHelpers.max_concurrency = max_concurrency
+        AsyncHelpers._executor = None
+        AsyncHelpers._semaphores = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _semaphore() -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = AsyncHelpers._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(AsyncHelpers.max_concurrency)
+            AsyncHelpers._semaphores[loop] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        if AsyncHelpers._executor is None:
+            AsyncHelpers._executor = ThreadPoolExecutor(
+                max_workers=AsyncHelpers.max_concurrency, thread_name_prefix="equicast-fetch"
+            )
+        return AsyncHelpers._executor
+
+    @staticmethod
+    async def run(func, *args, **kwargs):
+        """Run a blocking fetch in the shared worker pool once a concurrency slot is free."""
+        async with AsyncHelpers._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(AsyncHelpers._get_executor(), partial(func, *args, **kwargs))
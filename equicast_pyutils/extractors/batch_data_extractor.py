@@ -0,0 +1,314 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from equicast_pyutils.extractors.calc_helpers import CalcHelpers
+from equicast_pyutils.extractors.data_sources import DataSource
+from equicast_pyutils.extractors.exceptions import NoDataError
+from equicast_pyutils.extractors.fx_data_extractor import FxDataExtractor
+from equicast_pyutils.extractors.get_helpers import GetHelpers
+from equicast_pyutils.extractors.stock_data_extractor import StockDataExtractor
+from equicast_pyutils.models import MetadataModel, OHLCSeries, ParquetDatasetWriter
+from equicast_pyutils.models.fx import FxCalculationModel, FxPriceModel
+
+
+@dataclass
+class BatchResult:
+    """Per-symbol outcome of a batch extraction: the models that were built and the symbols that failed."""
+    models: Dict[str, object] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        return not self.models
+
+
+def _group_by_last_date(symbols: Iterable[str], last_dates: Dict[str, object], key=lambda symbol: symbol):
+    """Group symbols by their last stored date (None when nothing is stored) so each group is one bulk download."""
+    groups: Dict[object, List[str]] = {}
+    for symbol in symbols:
+        last_date = last_dates.get(key(symbol))
+        groups.setdefault(None if last_date is None else last_date.date(), []).append(symbol)
+    return groups
+
+
+@dataclass
+class BatchStockDataExtractor:
+    """
+    Stock Data Extractor for many tickers, fetching price history in grouped bulk downloads. The quote currency
+    comes from ``currencies`` when given, else from each ticker's (cached) info, fetched ``max_workers`` at a time,
+    and is remembered there.
+    """
+    tickers: List[str]
+    period: str = "max"
+    chunk_size: int = 100
+    currencies: Dict[str, str] = field(default_factory=dict)
+    max_workers: int = field(default=8, repr=False)
+    source: Optional[DataSource] = field(default=None, repr=False)
+
+    def extract_stock_price_data(self) -> BatchResult:
+        return self._extract_stock_price_data(self.tickers, period=self.period)
+
+    def update_stock_price_data(self, writer: ParquetDatasetWriter) -> BatchResult:
+        """
+        Incremental refresh: fetch each ticker only from its last stored date (full history for new tickers) and
+        upsert the new bars into the affected ``ticker=``/``year=`` partitions of ``writer``'s dataset.
+        """
+        result = BatchResult()
+        for since, tickers in _group_by_last_date(self.tickers, writer.last_dates()).items():
+            price_range = {"period": self.period} if since is None else {"start": since}
+            partial = self._extract_stock_price_data(tickers, **price_range)
+            result.models.update(partial.models)
+            result.errors.update(partial.errors)
+
+        writer.upsert(result.models.values())
+        return result
+
+    def _extract_stock_price_data(self, tickers: List[str], **price_range) -> BatchResult:
+        result = BatchResult()
+        for i in range(0, len(tickers), self.chunk_size):
+            chunk = tickers[i:i + self.chunk_size]
+            histories, errors = GetHelpers.get_history_bulk(chunk, source=self.source, **price_range)
+            result.errors.update(errors)
+
+            extractors = {ticker: StockDataExtractor(ticker=ticker, source=self.source) for ticker in histories}
+            result.errors.update(self._resolve_currencies(extractors.values()))
+
+            for ticker, history in histories.items():
+                if ticker in result.errors:
+                    continue
+                try:
+                    result.models[ticker] = extractors[ticker].price_model_from_history(
+                        history, currency=self.currencies[ticker]
+                    )
+                except Exception as e:
+                    result.errors[ticker] = str(e)
+
+        return result
+
+    def _resolve_currencies(self, extractors: Iterable[StockDataExtractor]) -> Dict[str, str]:
+        """
+        Look up the currencies missing from ``currencies``, ``max_workers`` info requests at a time. Returns error
+        messages keyed by ticker for those that could not be resolved.
+        """
+        missing = [extractor for extractor in extractors if extractor.ticker not in self.currencies]
+        if not missing:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(missing)))) as executor:
+            futures = {extractor.ticker: executor.submit(self._currency, extractor) for extractor in missing}
+
+        errors = {}
+        for ticker, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                errors[ticker] = str(e)
+        return errors
+
+    def _currency(self, extractor: StockDataExtractor) -> str:
+        ticker = extractor.ticker
+        if ticker not in self.currencies:
+            currency = extractor._get_info().get("currency")
+            if not currency:
+                raise NoDataError(f"No currency found for {ticker}.")
+            self.currencies[ticker] = currency
+        return self.currencies[ticker]
+
+
+@dataclass
+class BatchFxDataExtractor:
+    """FX Data Extractor for many currency pairs, fetching price history in grouped bulk downloads."""
+    pairs: List[Tuple[str, str]]
+    period: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    chunk_size: int = 100
+    source: Optional[DataSource] = field(default=None, repr=False)
+    _extractors: Dict[str, FxDataExtractor] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        for from_currency, to_currency in self.pairs:
+            extractor = FxDataExtractor(
+                from_currency=from_currency,
+                to_currency=to_currency,
+                period=self.period,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                source=self.source,
+            )
+            self._extractors[extractor.symbol] = extractor
+
+        first = next(iter(self._extractors.values()), None)
+        if first is not None:
+            self.period, self.start_date, self.end_date = first.period, first.start_date, first.end_date
+
+    def extract_fx_prices(self) -> BatchResult:
+        """Return FxPriceModel instances keyed by pair (e.g. "EURUSD")."""
+        return self._extract_fx_prices(list(self._extractors), **self._price_range())
+
+    def update_fx_prices(self, writer: ParquetDatasetWriter) -> BatchResult:
+        """
+        Incremental refresh: fetch each pair only from its last stored date (the configured range for new pairs)
+        and upsert the new bars into the affected ``fx=``/``year=`` partitions of ``writer``'s dataset.
+        """
+        result = BatchResult()
+        groups = _group_by_last_date(self._extractors, writer.last_dates(), key=lambda s: self._extractors[s].pair)
+        for since, symbols in groups.items():
+            price_range = self._price_range() if since is None else {"start": since}
+            partial = self._extract_fx_prices(symbols, **price_range)
+            result.models.update(partial.models)
+            result.errors.update(partial.errors)
+
+        writer.upsert(result.models.values())
+        return result
+
+    def _price_range(self) -> dict:
+        if self.period:
+            return {"period": self.period}
+        return {"start": self.start_date, "end": self.end_date}
+
+    def extract_fx_calculations(self) -> BatchResult:
+        """
+        Return FxCalculationModel instances keyed by pair, computed for all pairs at once on an aligned date x pair
+        close matrix built from the full ("max") histories.
+        """
+        histories, errors = self._get_histories(list(self._extractors), period="max")
+        result = BatchResult(errors=errors)
+        if not histories:
+            return result
+
+        closes = pd.concat({symbol: history["Close"] for symbol, history in histories.items()}, axis=1)
+        metrics = CalcHelpers.calculate_cross_sectional_metrics(closes, cagr_periods=(1, 5))
+        metrics = metrics.astype(object).where(metrics.notna(), None)
+
+        for symbol, row in metrics.iterrows():
+            extractor = self._extractors[symbol]
+            result.models[extractor.pair] = FxCalculationModel(
+                from_currency=extractor.from_currency,
+                to_currency=extractor.to_currency,
+                volatility=row["volatility"],
+                sharpe_ratio=row["sharpe_ratio"],
+                max_drawdown=row["max_drawdown"],
+                cagr_1y=row["cagr_1y"],
+                cagr_5y=row["cagr_5y"],
+                metadata=MetadataModel(source="yfinance"),
+            )
+
+        return result
+
+    def _get_histories(self, symbols: List[str], **price_range) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+        """Bulk-download ``symbols`` in chunks; returns histories keyed by symbol and errors keyed by pair."""
+        histories, errors = {}, {}
+        for i in range(0, len(symbols), self.chunk_size):
+            chunk = symbols[i:i + self.chunk_size]
+            chunk_histories, chunk_errors = GetHelpers.get_history_bulk(chunk, source=self.source, **price_range)
+            histories.update(chunk_histories)
+            for symbol, error in chunk_errors.items():
+                errors[self._extractors[symbol].pair] = error
+
+        return histories, errors
+
+    def _extract_fx_prices(self, symbols: List[str], **price_range) -> BatchResult:
+        histories, errors = self._get_histories(symbols, **price_range)
+        result = BatchResult(errors=errors)
+        for symbol, history in histories.items():
+            extractor = self._extractors[symbol]
+            try:
+                result.models[extractor.pair] = extractor.price_model_from_history(history)
+            except Exception as e:
+                result.errors[extractor.pair] = str(e)
+
+        return result
+
+
+@dataclass
+class FxMatrixExtractor:
+    """
+    FX Data Extractor for every ordered pair of ``currencies``, fetching only the USD legs (``{ccy}=X``) and
+    deriving each cross ``A/B`` as the date-aligned ratio ``(USD->B) / (USD->A)``.
+
+    Open and close are exact ratios. High and low are the widest values the legs allow (``highB / lowA`` and
+    ``lowB / highA``), widened if needed to contain open and close.
+    """
+    currencies: List[str]
+    period: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    chunk_size: int = 100
+    source: Optional[DataSource] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self.currencies = list(dict.fromkeys(self.currencies))
+        if self.period is None and self.start_date is None and self.end_date is None:
+            self.period = "max"
+
+    def _price_range(self) -> dict:
+        if self.period:
+            return {"period": self.period}
+        return {"start": self.start_date, "end": self.end_date}
+
+    def _get_legs(self) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+        symbols = {FxDataExtractor.symbol_for("USD", ccy): ccy for ccy in self.currencies if ccy != "USD"}
+        histories, errors = {}, {}
+        leg_symbols = list(symbols)
+        for i in range(0, len(leg_symbols), self.chunk_size):
+            chunk = leg_symbols[i:i + self.chunk_size]
+            chunk_histories, chunk_errors = GetHelpers.get_history_bulk(
+                chunk, source=self.source, **self._price_range()
+            )
+            histories.update({symbols[symbol]: history for symbol, history in chunk_histories.items()})
+            errors.update({symbols[symbol]: error for symbol, error in chunk_errors.items()})
+        return histories, errors
+
+    def extract_fx_prices(self) -> BatchResult:
+        """Return FxPriceModel instances for every ordered pair of currencies, keyed by pair (e.g. "EURGBP")."""
+        legs, leg_errors = self._get_legs()
+        result = BatchResult()
+        for ccy, error in leg_errors.items():
+            for other in self.currencies:
+                if other != ccy:
+                    result.errors[f"{ccy}{other}"] = result.errors[f"{other}{ccy}"] = error
+        if not legs:
+            return result
+
+        frame = pd.concat(
+            {ccy: history[["Open", "High", "Low", "Close"]] for ccy, history in legs.items()}, axis=1
+        ).sort_index()
+        currencies = [ccy for ccy in self.currencies if ccy == "USD" or ccy in legs]
+        # (dates, currencies) matrices of USD -> ccy; the USD leg is the constant 1.
+        ohlc = {
+            field_name: np.column_stack([
+                np.ones(len(frame)) if ccy == "USD" else frame[(ccy, field_name)].to_numpy(dtype=np.float64)
+                for ccy in currencies
+            ])
+            for field_name in ("Open", "High", "Low", "Close")
+        }
+
+        for i, base in enumerate(currencies):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                open_ = ohlc["Open"] / ohlc["Open"][:, [i]]
+                close = ohlc["Close"] / ohlc["Close"][:, [i]]
+                high = np.maximum(ohlc["High"] / ohlc["Low"][:, [i]], np.maximum(open_, close))
+                low = np.minimum(ohlc["Low"] / ohlc["High"][:, [i]], np.minimum(open_, close))
+
+            for j, quote in enumerate(currencies):
+                if i == j:
+                    continue
+                rows = ~np.isnan(close[:, j]) & ~np.isnan(open_[:, j])
+                history = pd.DataFrame(
+                    {"Open": open_[rows, j], "High": high[rows, j], "Low": low[rows, j], "Close": close[rows, j]},
+                    index=frame.index[rows],
+                )
+                result.models[f"{base}{quote}"] = FxPriceModel(
+                    from_currency=base,
+                    to_currency=quote,
+                    prices=OHLCSeries.from_history(history),
+                    metadata=MetadataModel(source="yfinance"),
+                )
+
+        return result
@@ -1,7 +1,8 @@
 import math
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, Sequence
 
 import numpy as np
 import pandas as pd
@@ -110,6 +111,84 @@ class CalcHelpers:
             return abs(mdd) * 100
         return mdd
 
+    @staticmethod
+    def _rolling_window_sums(values: np.ndarray, window: int) -> np.ndarray:
+        """Sum of every ``window``-long run of ``values``, taken from a single cumulative sum."""
+        cumsum = np.concatenate(([0.0], np.cumsum(values)))
+        return cumsum[window:] - cumsum[:-window]
+
+    @staticmethod
+    def _rolling_max_drawdown(prices: np.ndarray, window: int, chunk_rows: int = 4096) -> np.ndarray:
+        """Max drawdown of every ``window + 1``-price window, evaluated in row chunks to bound memory."""
+        windows = np.lib.stride_tricks.sliding_window_view(prices, window + 1)
+        out = np.empty(len(windows))
+        for start in range(0, len(windows), chunk_rows):
+            chunk = windows[start:start + chunk_rows]
+            running_max = np.maximum.accumulate(chunk, axis=1)
+            out[start:start + len(chunk)] = (chunk / running_max - 1).min(axis=1)
+        return out
+
+    @staticmethod
+    def calculate_rolling_metrics(
+            prices: pd.Series,
+            windows: Sequence[int] = (21, 63, 252),
+            risk_free_rate: float = 0.0,
+            periods_per_year: Optional[int] = None,
+            return_type: str = "log",
+            ddof: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Rolling annualised volatility, Sharpe ratio and max drawdown for several window lengths in one pass.
+
+        ``window`` counts returns, so each row matches the scalar helpers applied to the last ``window + 1`` prices.
+        Volatility and Sharpe come from cumulative sums of returns and squared returns; drawdown from a running
+        maximum over sliding windows. Columns are named ``volatility_<w>``, ``sharpe_<w>`` and ``max_drawdown_<w>``;
+        rows without a full window are NaN.
+        """
+        if prices is None or len(prices) < 2:
+            raise ValueError("Need at least two price observations")
+
+        s = prices.dropna().astype(float)
+        if len(s) < 2:
+            raise ValueError("Insufficient non-NaN data")
+
+        ppy = periods_per_year or CalcHelpers.infer_periods_per_year(s.index) or 252
+        values = s.to_numpy()
+        if return_type == "log":
+            returns = np.diff(np.log(values))
+        elif return_type == "simple":
+            returns = values[1:] / values[:-1] - 1
+        else:
+            raise ValueError("return_type must be 'log' or 'simple'")
+
+        rf_periodic = (1 + risk_free_rate) ** (1 / ppy) - 1
+        # Variance is shift invariant; centring first keeps the sum-of-squares formula numerically stable.
+        centre = returns.mean()
+        centred = returns - centre
+
+        columns = {}
+        for window in windows:
+            if window < 2:
+                raise ValueError("windows must be at least 2 returns long")
+
+            series = {name: np.full(len(values), np.nan) for name in ("volatility", "sharpe", "max_drawdown")}
+            if window < len(values):
+                sums = CalcHelpers._rolling_window_sums(centred, window)
+                squares = CalcHelpers._rolling_window_sums(centred ** 2, window)
+                variance = np.clip((squares - sums ** 2 / window) / (window - ddof), 0.0, None)
+                sigma = np.sqrt(variance)
+                mean = sums / window + centre
+
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    series["sharpe"][window:] = (mean - rf_periodic) / sigma * math.sqrt(ppy)
+                series["volatility"][window:] = sigma * math.sqrt(ppy)
+                series["max_drawdown"][window:] = CalcHelpers._rolling_max_drawdown(values, window)
+
+            for name, column in series.items():
+                columns[f"{name}_{window}"] = column
+
+        return pd.DataFrame(columns, index=s.index)
+
     @staticmethod
     def calculate_cagr(
             prices: pd.Series,
@@ -129,18 +208,22 @@ class CalcHelpers:
         elif isinstance(end_date, datetime):
             end_date = pd.Timestamp(end_date)
 
+        # As-of lookups by binary search on the sorted index instead of boolean masks over the whole series.
+        values = s.to_numpy(dtype=float)
+        end_pos = s.index.searchsorted(end_date, side="right") - 1
+
         cagr_dict = {}
         for period in periods:
             start_date = end_date - pd.DateOffset(years=period)
-            s_start = s[s.index <= start_date]
-            if s_start.empty:
+            start_pos = s.index.searchsorted(start_date, side="right") - 1
+            if start_pos < 0:
                 cagr_dict[f"{period}y"] = None
                 continue
 
-            start_price = s_start.iloc[-1]
-            end_price = s[s.index <= end_date].iloc[-1]
+            start_price = values[start_pos]
+            end_price = values[end_pos]
 
-            t = (end_date - s_start.index[-1]).days / 365.25  # actual years
+            t = (end_date - s.index[start_pos]).days / 365.25  # actual years
             if t <= 0:
                 cagr_dict[f"{period}y"] = None
                 continue
@@ -154,48 +237,267 @@ class CalcHelpers:
         return cagr_dict
 
     @staticmethod
-    def forecast_fx_prices(ohlc_history: pd.DataFrame, requested_days: int = 365 * 20) -> pd.DataFrame:
+    def calculate_rolling_cagr(
+            prices: pd.Series,
+            periods: Sequence[int] = (1, 5, 10),
+            as_percent: bool = False,
+            start_date: pd.Timestamp = None,
+            end_date: pd.Timestamp = None,
+    ) -> pd.DataFrame:
+        """
+        CAGR over each of ``periods`` years ending on every observation between ``start_date`` and ``end_date``.
+
+        Each row equals ``calculate_cagr(prices, periods, end_date=<row date>)``; all as-of start prices are found
+        with one vectorized binary search per period. Columns are named ``<n>y``; undefined values are NaN.
+        """
+        if prices is None or len(prices) < 2:
+            raise ValueError("Price series must have at least two observations")
+
+        s = prices.dropna().sort_index()
+        if len(s) < 2:
+            raise ValueError("Insufficient non-NaN data")
+
+        index = pd.DatetimeIndex(s.index)
+        lo = 0 if start_date is None else index.searchsorted(pd.Timestamp(start_date), side="left")
+        hi = len(index) if end_date is None else index.searchsorted(pd.Timestamp(end_date), side="right")
+        values = s.to_numpy(dtype=float)
+        end_dates = index[lo:hi]
+        end_prices = values[lo:hi]
+
+        columns = {}
+        for period in periods:
+            start_pos = index.searchsorted(end_dates - pd.DateOffset(years=period), side="right") - 1
+            found = start_pos >= 0
+            start_pos = np.maximum(start_pos, 0)
+            t = (end_dates - index[start_pos]).days.to_numpy() / 365.25
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cagr = (end_prices / values[start_pos]) ** (1 / t) - 1
+            cagr = np.where(found & (t > 0), cagr, np.nan)
+            if as_percent:
+                cagr *= 100
+            columns[f"{period}y"] = np.round(cagr, 6)
+
+        return pd.DataFrame(columns, index=end_dates)
+
+    @staticmethod
+    def calculate_cross_sectional_metrics(
+            prices: pd.DataFrame,
+            lookback: pd.DateOffset = pd.DateOffset(years=1),
+            cagr_periods: Sequence[int] = (1, 5),
+            risk_free_rate: float = 0.0,
+            periods_per_year: Optional[int] = None,
+            ddof: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Volatility, Sharpe ratio and max drawdown over each column's trailing ``lookback`` plus CAGR for
+        ``cagr_periods``, for every column of an aligned date x symbol price matrix at once.
+
+        Columns may start, end or have gaps at different dates: log returns run between consecutive valid
+        observations of each column and every reduction ignores NaN. The sampling frequency is inferred once from
+        the shared index. Returns one row per column with ``volatility``, ``sharpe_ratio``, ``max_drawdown`` and
+        ``cagr_<n>y`` (NaN where a metric cannot be computed).
+        """
+        if prices is None or prices.empty:
+            raise ValueError("Price matrix must not be empty")
+
+        prices = prices.sort_index()
+        values = prices.to_numpy(dtype=np.float64)
+        dates = pd.DatetimeIndex(prices.index)
+        valid = ~np.isnan(values)
+        rows = np.arange(len(values))[:, None]
+
+        # Position of the latest valid observation at or before each row, per column (-1 before the first).
+        last_valid = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+        has_data = last_valid[-1] >= 0
+        end_pos = np.where(has_data, last_valid[-1], 0)
+        cols = np.arange(values.shape[1])
+        end_prices = values[end_pos, cols]
+        end_dates = dates[end_pos]
+
+        ppy = periods_per_year or CalcHelpers.infer_periods_per_year(dates) or 252
+        start_pos = dates.searchsorted(end_dates - lookback, side="left")
+        in_window = valid & (rows >= start_pos) & (rows <= end_pos)
+
+        # Returns between consecutive valid observations, kept only when both ends fall inside the window.
+        prev_pos = np.vstack([np.full((1, values.shape[1]), -1), last_valid[:-1]])
+        prev_values = values[np.maximum(prev_pos, 0), cols]
+        has_return = in_window & (prev_pos >= start_pos)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.where(has_return, np.log(values / prev_values), np.nan)
+
+        counts = has_return.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.nansum(returns, axis=0) / counts
+            variance = np.nansum((returns - mean) ** 2, axis=0) / (counts - ddof)
+            sigma = np.where(counts > ddof, np.sqrt(variance), np.nan)
+            rf_periodic = (1 + risk_free_rate) ** (1 / ppy) - 1
+            result = {
+                "volatility": sigma * math.sqrt(ppy),
+                "sharpe_ratio": (mean - rf_periodic) / sigma * math.sqrt(ppy),
+            }
+
+            running_max = np.maximum.accumulate(np.where(in_window, values, -np.inf), axis=0)
+            drawdowns = np.where(in_window, values / running_max - 1, np.nan)
+            result["max_drawdown"] = np.where(in_window.sum(axis=0) >= 2, np.nanmin(drawdowns, axis=0), np.nan)
+
+        for period in cagr_periods:
+            as_of = dates.searchsorted(end_dates - pd.DateOffset(years=period), side="right") - 1
+            start_obs = np.where(as_of >= 0, last_valid[np.maximum(as_of, 0), cols], -1)
+            start_prices = np.where(start_obs >= 0, values[np.maximum(start_obs, 0), cols], np.nan)
+            years = (end_dates - dates[np.maximum(start_obs, 0)]).days.to_numpy() / 365.25
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cagr = (end_prices / start_prices) ** (1 / years) - 1
+            result[f"cagr_{period}y"] = np.where((start_obs >= 0) & (years > 0), np.round(cagr, 6), np.nan)
+
+        df = pd.DataFrame(result, index=prices.columns)
+        df.loc[~has_data] = np.nan
+        return df
+
+    @staticmethod
+    def simulate_gbm_ohlc(
+            rng: np.random.Generator,
+            last_close: float,
+            mu: float,
+            sigma: float,
+            high_offsets: np.ndarray,
+            low_offsets: np.ndarray,
+            days: int,
+            paths: int = 1,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Simulate GBM OHLC paths as (paths, days) float64 arrays in a single batch of draws."""
+        z = rng.standard_normal((paths, days))
+        high_draws = rng.choice(high_offsets, size=(paths, days))
+        low_draws = rng.choice(low_offsets, size=(paths, days))
+
+        log_steps = (mu - 0.5 * sigma ** 2) + sigma * z
+        close = last_close * np.exp(np.cumsum(log_steps, axis=1))
+
+        open_ = np.empty_like(close)
+        open_[:, 0] = last_close
+        open_[:, 1:] = close[:, :-1]
+
+        high = np.maximum(np.maximum(open_ * (1 + high_draws), open_), close)
+        low = np.minimum(np.minimum(open_ * (1 + low_draws), open_), close)
+        return open_, high, low, close
+
+    @staticmethod
+    def forecast_fx_prices(
+            ohlc_history: pd.DataFrame,
+            requested_days: int = 365 * 20,
+            seed: int = 42
+    ) -> pd.DataFrame:
         if ohlc_history is None or ohlc_history.empty:
             raise ValueError("Historical OHLC data is required")
 
-        ohlc = ohlc_history[['Open', 'High', 'Low', 'Close']].dropna()
+        ohlc = ohlc_history[['Open', 'High', 'Low', 'Close']].dropna().astype(float)
         if len(ohlc) < 2:
             raise ValueError("At least 2 historical OHLC records are required")
 
         max_days = len(ohlc)
         forecast_days = min(requested_days, max_days)
 
-        close_prices = ohlc['Close'].astype(float)
-        returns = np.log(close_prices / close_prices.shift(1)).dropna()
+        close_prices = ohlc['Close'].to_numpy()
+        open_prices = ohlc['Open'].to_numpy()
+        returns = np.diff(np.log(close_prices))
         mu = returns.mean()
-        sigma = returns.std()
+        sigma = returns.std(ddof=1)
+
+        high_offsets = (ohlc['High'].to_numpy() - open_prices) / open_prices
+        low_offsets = (ohlc['Low'].to_numpy() - open_prices) / open_prices
 
-        high_offsets = (ohlc['High'] - ohlc['Open']) / ohlc['Open']
-        low_offsets = (ohlc['Low'] - ohlc['Open']) / ohlc['Open']
+        rng = np.random.default_rng(seed)
+        open_, high, low, close = CalcHelpers.simulate_gbm_ohlc(
+            rng, close_prices[-1], mu, sigma, high_offsets, low_offsets, forecast_days
+        )
 
         start_date = ohlc.index[-1]
-        forecast_dates = [start_date + timedelta(days=i + 1) for i in range(forecast_days)]
-        forecast_df = pd.DataFrame(index=forecast_dates, columns=['Open', 'High', 'Low', 'Close'])
-        last_close = close_prices.iloc[-1]
-        np.random.seed(42)
-
-        for date in forecast_dates:
-            z = np.random.normal()
-            close_forecast = last_close * np.exp((mu - 0.5 * sigma ** 2) + sigma * z)
-            open_forecast = last_close
-            high_forecast = open_forecast * (1 + np.random.choice(high_offsets))
-            low_forecast = open_forecast * (1 + np.random.choice(low_offsets))
-
-            high_forecast = max(high_forecast, open_forecast, close_forecast)
-            low_forecast = min(low_forecast, open_forecast, close_forecast)
-
-            forecast_df.loc[date] = [
-                round(open_forecast, 6),
-                round(high_forecast, 6),
-                round(low_forecast, 6),
-                round(close_forecast, 6)
-            ]
-
-            last_close = close_forecast
+        forecast_dates = pd.date_range(start=start_date + timedelta(days=1), periods=forecast_days, freq="D")
+        forecast_df = pd.DataFrame(
+            {
+                'Open': open_[0],
+                'High': high[0],
+                'Low': low[0],
+                'Close': close[0],
+            },
+            index=forecast_dates,
+        ).round(6)
 
         return forecast_df
+
+    @staticmethod
+    def _simulate_gbm_close_chunk(
+            seed: int,
+            spawn_key: Tuple[int, int],
+            last_closes: np.ndarray,
+            mu: float,
+            sigma: float,
+            days: int,
+    ) -> np.ndarray:
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=spawn_key))
+        log_steps = (mu - 0.5 * sigma ** 2) + sigma * rng.standard_normal((len(last_closes), days))
+        return last_closes[:, None] * np.exp(np.cumsum(log_steps, axis=1))
+
+    @staticmethod
+    def forecast_fx_ensemble(
+            ohlc_history: pd.DataFrame,
+            requested_days: int = 365 * 20,
+            paths: int = 1000,
+            seed: int = 42,
+            quantiles: Sequence[int] = (5, 25, 50, 75, 95),
+            workers: Optional[int] = None,
+            chunk_paths: int = 2500,
+            block_days: int = 365,
+    ) -> pd.DataFrame:
+        """
+        Monte Carlo GBM forecast returning per-day close quantile bands (p5, p25, ...) and the expected value.
+
+        Paths are simulated as 2-D (paths, days) arrays in blocks of ``block_days`` so that only one block is held
+        in memory at a time. Each (block, chunk) pair draws from its own generator spawned from ``seed``, which
+        keeps the result deterministic whether or not the chunks are spread over a process pool (``workers``).
+        """
+        if ohlc_history is None or ohlc_history.empty:
+            raise ValueError("Historical OHLC data is required")
+        if paths < 1:
+            raise ValueError("paths must be a positive integer")
+
+        close_prices = ohlc_history['Close'].dropna().astype(float).to_numpy()
+        if len(close_prices) < 2:
+            raise ValueError("At least 2 historical OHLC records are required")
+
+        forecast_days = min(requested_days, len(close_prices))
+        returns = np.diff(np.log(close_prices))
+        mu = returns.mean()
+        sigma = returns.std(ddof=1)
+
+        chunk_bounds = [(i, min(i + chunk_paths, paths)) for i in range(0, paths, chunk_paths)]
+        carry = np.full(paths, close_prices[-1])
+        bands = np.empty((forecast_days, len(quantiles)))
+        expected = np.empty(forecast_days)
+
+        executor = ProcessPoolExecutor(max_workers=workers) if workers and len(chunk_bounds) > 1 else None
+        try:
+            for block, day_start in enumerate(range(0, forecast_days, block_days)):
+                days = min(block_days, forecast_days - day_start)
+                args = [
+                    (seed, (block, chunk), carry[lo:hi], mu, sigma, days)
+                    for chunk, (lo, hi) in enumerate(chunk_bounds)
+                ]
+                if executor:
+                    parts = list(executor.map(CalcHelpers._simulate_gbm_close_chunk, *zip(*args)))
+                else:
+                    parts = [CalcHelpers._simulate_gbm_close_chunk(*a) for a in args]
+                closes = np.vstack(parts)
+
+                bands[day_start:day_start + days] = np.percentile(closes, quantiles, axis=0).T
+                expected[day_start:day_start + days] = closes.mean(axis=0)
+                carry = closes[:, -1].copy()
+        finally:
+            if executor:
+                executor.shutdown()
+
+        start_date = ohlc_history.index[-1]
+        forecast_dates = pd.date_range(start=start_date + timedelta(days=1), periods=forecast_days, freq="D")
+        forecast_df = pd.DataFrame(bands, index=forecast_dates, columns=[f"p{q}" for q in quantiles])
+        forecast_df["Expected"] = expected
+
+        return forecast_df.round(6)
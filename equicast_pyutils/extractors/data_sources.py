@@ -0,0 +1,351 @@
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from equicast_pyutils.extractors.exceptions import NoDataError
+from equicast_pyutils.extractors.http_pool import SessionPool, get_default_pool
+from equicast_pyutils.extractors.response_cache import DEFAULT_TTLS, SQLiteResponseCache, cache_key
+
+_STATEMENTS = ("financials", "balance_sheet", "cash_flow")
+
+
+class DataSource:
+    """
+    Market-data backend behind the extractors and GetHelpers.
+
+    Sources answer per-symbol requests (history, info, dividends and the financial statements) and bulk history
+    downloads. ``ticker(symbol)`` returns the yf.Ticker-like object the extractors call, so swapping the source
+    swaps every upstream call without touching the extraction logic.
+    """
+
+    def history(self, symbol: str, period: Optional[str] = None, interval: str = "1d", start=None, end=None):
+        raise NotImplementedError("Subclasses must implement history().")
+
+    def info(self, symbol: str) -> dict:
+        raise NotImplementedError("Subclasses must implement info().")
+
+    def dividends(self, symbol: str) -> pd.Series:
+        raise NotImplementedError("Subclasses must implement dividends().")
+
+    def statement(self, symbol: str, name: str) -> pd.DataFrame:
+        """One of the financial statements: "financials", "balance_sheet" or "cash_flow"."""
+        raise NotImplementedError("Subclasses must implement statement().")
+
+    def ticker(self, symbol: str):
+        return SourceTicker(self, symbol)
+
+    def download(self, symbols: List[str], interval: str = "1d", period: Optional[str] = None, start=None, end=None):
+        """History for many symbols as one frame with (symbol, field) columns, like yf.download(group_by="ticker")."""
+        histories = {}
+        for symbol in symbols:
+            try:
+                history = self.history(symbol, period=period, interval=interval, start=start, end=end)
+            except NoDataError:
+                continue
+            if not history.empty:
+                histories[symbol] = history
+
+        if not histories:
+            return pd.DataFrame()
+        return pd.concat(histories, axis=1)
+
+    def download_errors(self) -> Dict[str, str]:
+        """Per-symbol error messages of the last ``download`` call, when the backend reports them."""
+        return {}
+
+    @staticmethod
+    def slice_history(history: pd.DataFrame, period: str = None) -> pd.DataFrame:
+        """Cut a yfinance-style period ("5d", "1mo", "1y", "ytd", "max") from the tail of a longer history frame."""
+        if not period or period == "max" or history.empty:
+            return history
+
+        last_date = history.index[-1]
+        if period == "ytd":
+            start = pd.Timestamp(year=last_date.year, month=1, day=1, tz=last_date.tz)
+        else:
+            match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+            if not match:
+                raise ValueError(f"Unsupported period: {period}")
+
+            count, unit = int(match.group(1)), match.group(2)
+            if unit == "d":
+                return history.iloc[-count:]
+
+            offsets = {
+                "wk": pd.DateOffset(weeks=count),
+                "mo": pd.DateOffset(months=count),
+                "y": pd.DateOffset(years=count),
+            }
+            start = last_date - offsets[unit]
+
+        return history.iloc[history.index.searchsorted(start, side="left"):]
+
+    @staticmethod
+    def slice_range(history: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+        """Rows with ``start <= date < end`` (yfinance treats ``end`` as exclusive)."""
+        index = history.index
+
+        def position(value, default):
+            if value is None:
+                return default
+            value = pd.Timestamp(value)
+            if index.tz is not None and value.tz is None:
+                value = value.tz_localize(index.tz)
+            elif index.tz is None and value.tz is not None:
+                value = value.tz_convert(None)
+            return index.searchsorted(value, side="left")
+
+        return history.iloc[position(start, 0):position(end, len(index))]
+
+
+class SourceTicker:
+    """yf.Ticker-shaped view of one symbol on a DataSource."""
+
+    def __init__(self, source: DataSource, symbol: str):
+        self.source = source
+        self.ticker = symbol
+
+    def history(self, period=None, interval="1d", start=None, end=None, **kwargs):
+        return self.source.history(self.ticker, period=period, interval=interval, start=start, end=end)
+
+    @property
+    def info(self):
+        return self.source.info(self.ticker)
+
+    def get_info(self):
+        return self.source.info(self.ticker)
+
+    @property
+    def dividends(self):
+        return self.source.dividends(self.ticker)
+
+    @property
+    def financials(self):
+        return self.source.statement(self.ticker, "financials")
+
+    def get_financials(self):
+        return self.financials
+
+    @property
+    def balance_sheet(self):
+        return self.source.statement(self.ticker, "balance_sheet")
+
+    def get_balance_sheet(self):
+        return self.balance_sheet
+
+    @property
+    def cash_flow(self):
+        return self.source.statement(self.ticker, "cash_flow")
+
+    def get_cash_flow(self):
+        return self.cash_flow
+
+
+class YFinanceSource(DataSource):
+    """
+    Yahoo Finance through yfinance (the default source). Tickers and bulk downloads share the HTTP session of
+    ``pool``, the process-wide SessionPool unless one is given.
+    """
+
+    def __init__(self, pool: Optional[SessionPool] = None):
+        self._pool = pool
+
+    @property
+    def pool(self) -> SessionPool:
+        return self._pool or get_default_pool()
+
+    def ticker(self, symbol: str):
+        return self.pool.ticker(symbol)
+
+    def history(self, symbol, period=None, interval="1d", start=None, end=None):
+        if period:
+            return self.ticker(symbol).history(period=period, interval=interval)
+        return self.ticker(symbol).history(start=start, end=end, interval=interval)
+
+    def info(self, symbol):
+        return self.ticker(symbol).info
+
+    def dividends(self, symbol):
+        return self.ticker(symbol).dividends
+
+    def statement(self, symbol, name):
+        return getattr(self.ticker(symbol), name)
+
+    def download(self, symbols, interval="1d", period=None, start=None, end=None):
+        session = self.pool.session
+        if period or not (start or end):
+            return yf.download(
+                symbols, period=period or "max", interval=interval, group_by="ticker", auto_adjust=True,
+                actions=False, threads=True, progress=False, multi_level_index=True, session=session,
+            )
+        return yf.download(
+            symbols, start=start, end=end, interval=interval, group_by="ticker", auto_adjust=True,
+            actions=False, threads=True, progress=False, multi_level_index=True, session=session,
+        )
+
+    def download_errors(self):
+        return dict(getattr(yf.shared, "_ERRORS", {}) or {})
+
+
+class MirrorSource(DataSource):
+    """
+    Local mirror of bulk-loaded data under ``root``, one file per symbol and endpoint::
+
+        root/history/<symbol>.parquet      OHLCV indexed by date (full history; periods and ranges are sliced)
+        root/dividends/<symbol>.parquet    "Dividends" indexed by date
+        root/<statement>/<symbol>.parquet  financials / balance_sheet / cash_flow
+        root/info/<symbol>.json
+
+    ``fmt="csv"`` stores the tabular endpoints as CSV instead. Files are read once per process and kept in memory.
+    Only daily bars are mirrored, so ``interval`` is ignored.
+    """
+
+    def __init__(self, root: str, fmt: str = "parquet"):
+        if fmt not in ("parquet", "csv"):
+            raise ValueError("fmt must be 'parquet' or 'csv'")
+        self.root = Path(root)
+        self.fmt = fmt
+        self._loaded: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, endpoint: str, symbol: str) -> Path:
+        suffix = "json" if endpoint == "info" else self.fmt
+        return self.root / endpoint / f"{symbol}.{suffix}"
+
+    def _read(self, endpoint: str, symbol: str):
+        path = self._path(endpoint, symbol)
+        if not path.exists():
+            raise NoDataError(f"No mirrored {endpoint} for {symbol}.")
+
+        if endpoint == "info":
+            return json.loads(path.read_text(encoding="utf-8"))
+
+        if self.fmt == "parquet":
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_csv(path, index_col=0)
+            if endpoint not in _STATEMENTS:
+                df.index = pd.to_datetime(df.index, utc=True)
+
+        if endpoint in _STATEMENTS:
+            df.columns = pd.to_datetime(df.columns)
+        return df
+
+    def _load(self, endpoint: str, symbol: str):
+        key = (endpoint, symbol)
+        with self._lock:
+            if key in self._loaded:
+                return self._loaded[key]
+
+        value = self._read(endpoint, symbol)
+        with self._lock:
+            self._loaded[key] = value
+        return value
+
+    def save(self, endpoint: str, symbol: str, value):
+        """Store one endpoint for a symbol (a history/statement frame, a dividends series or an info dict)."""
+        path = self._path(endpoint, symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if endpoint == "info":
+            path.write_text(json.dumps(value, default=str), encoding="utf-8")
+        else:
+            df = value.to_frame(name="Dividends") if isinstance(value, pd.Series) else value.copy()
+            if endpoint in _STATEMENTS:
+                df.columns = [str(c) for c in df.columns]
+            if self.fmt == "parquet":
+                df.to_parquet(path, engine="pyarrow")
+            else:
+                df.to_csv(path)
+
+        with self._lock:
+            self._loaded.pop((endpoint, symbol), None)
+
+    def history(self, symbol, period=None, interval="1d", start=None, end=None):
+        history = self._load("history", symbol)
+        if period:
+            return self.slice_history(history, period)
+        return self.slice_range(history, start, end)
+
+    def info(self, symbol):
+        return dict(self._load("info", symbol))
+
+    def dividends(self, symbol):
+        return self._load("dividends", symbol)["Dividends"]
+
+    def statement(self, symbol, name):
+        return self._load(name, symbol)
+
+
+class RecordReplaySource(DataSource):
+    """
+    Records every response of ``inner`` into a SQLite file, or replays them without touching the network.
+
+    With ``inner`` set, calls go to ``inner`` and are recorded (re-recording overwrites). Without ``inner`` the
+    source replays, raising NoDataError (never retried) for requests that were never recorded.
+    """
+
+    def __init__(self, path: str, inner: Optional[DataSource] = None):
+        self.inner = inner
+        # Recordings never expire and are never evicted.
+        never = float("inf")
+        self._store = SQLiteResponseCache(
+            path, max_bytes=2 ** 62, default_ttl=never, ttls={endpoint: never for endpoint in DEFAULT_TTLS}
+        )
+
+    @property
+    def replaying(self) -> bool:
+        return self.inner is None
+
+    def _call(self, endpoint: str, key: str, fetch):
+        if self.replaying:
+            value = self._store.get(endpoint, key)
+            if value is None:
+                raise NoDataError(f"No recorded {endpoint} response for {key}.")
+            return value
+
+        value = fetch()
+        self._store.set(endpoint, key, value)
+        return value
+
+    def history(self, symbol, period=None, interval="1d", start=None, end=None):
+        return self._call(
+            "history", cache_key(symbol, interval, period, start, end),
+            lambda: self.inner.history(symbol, period=period, interval=interval, start=start, end=end),
+        )
+
+    def info(self, symbol):
+        return self._call("info", cache_key(symbol), lambda: self.inner.info(symbol))
+
+    def dividends(self, symbol):
+        return self._call("dividends", cache_key(symbol), lambda: self.inner.dividends(symbol))
+
+    def statement(self, symbol, name):
+        return self._call(name, cache_key(symbol), lambda: self.inner.statement(symbol, name))
+
+    def download(self, symbols, interval="1d", period=None, start=None, end=None):
+        return self._call(
+            "download", cache_key(",".join(symbols), interval, period, start, end),
+            lambda: self.inner.download(symbols, interval=interval, period=period, start=start, end=end),
+        )
+
+    def download_errors(self):
+        return {} if self.replaying else self.inner.download_errors()
+
+
+_default_source: DataSource = YFinanceSource()
+
+
+def set_default_source(source: DataSource):
+    """Install the process-wide data source used by extractors that are not given one explicitly."""
+    global _default_source
+    _default_source = source
+
+
+def get_default_source() -> DataSource:
+    return _default_source
@@ -0,0 +1,10 @@
+class NoDataError(ValueError):
+    """The upstream answered, but has no data for the symbol. Retrying will not help."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Calls to a host are short-circuited after repeated failures."""
+
+
+class DelistedSymbolError(NoDataError):
+    """The symbol is in the delisted registry and is not due for a re-check."""
@@ -1,14 +1,20 @@
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 import pandas as pd
 import yfinance as yf
 
 from equicast_pyutils.extractors.calc_helpers import CalcHelpers
+from equicast_pyutils.extractors.data_sources import DataSource, get_default_source
+from equicast_pyutils.extractors.exceptions import DelistedSymbolError, NoDataError
 from equicast_pyutils.extractors.get_helpers import GetHelpers
+from equicast_pyutils.extractors.memoize import memoize, amemoize
+from equicast_pyutils.extractors.price_context import PriceContext
 from equicast_pyutils.extractors.safe_helpers import SafeHelpers
-from equicast_pyutils.models import OHLCModel, MetadataModel
+from equicast_pyutils.extractors.symbol_registry import anot_blocked, get_default_registry, not_blocked
+from equicast_pyutils.models import ExportableModel, OHLCModel, OHLCSeries, MetadataModel, ForecastBandSeries
 from equicast_pyutils.models.fx import FxPriceModel, FxProfileModel, FxFundamentalModel, FxCalculationModel, \
     FxForecastModel
 
@@ -20,7 +26,10 @@ class FxDataExtractor:
     period: Optional[str] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+    source: Optional[DataSource] = field(default=None, repr=False)
     _yf_obj: yf.Ticker = field(default=None, init=False, repr=False)
+    _unblocked: bool = field(default=False, init=False, repr=False)
+    _memo: dict = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self):
         if self.period and (self.start_date or self.end_date):
@@ -38,52 +47,110 @@ class FxDataExtractor:
             elif self.start_date is None and self.end_date is None:
                 self.period = "max"
 
+    @staticmethod
+    def symbol_for(from_currency: str, to_currency: str) -> str:
+        if from_currency == "USD":
+            return f"{to_currency}=X"
+        return f"{from_currency}{to_currency}=X"
+
+    @property
+    def pair(self) -> str:
+        return f"{self.from_currency}{self.to_currency}"
+
+    @property
+    def symbol(self) -> str:
+        return self.symbol_for(self.from_currency, self.to_currency)
+
     @property
     def yf_obj(self):
         if self._yf_obj is None:
-            if self.from_currency == "USD":
-                ticker = f"{self.to_currency}=X"
-            else:
-                ticker = f"{self.from_currency}{self.to_currency}=X"
-
+            ticker = self.symbol
             try:
-                self._yf_obj = yf.Ticker(ticker)
+                self._yf_obj = (self.source or get_default_source()).ticker(ticker)
             except Exception as e:
                 raise ValueError(f"Failed to create yfinance object for {ticker}: {e}")
         return self._yf_obj
 
-    def extract_fx_prices(self) -> FxPriceModel:
+    def _ensure_not_blocked(self):
+        """Raise DelistedSymbolError for a pair in the delisted registry (checked once per extractor)."""
+        registry = get_default_registry()
+        if registry is None or self._unblocked:
+            return
+        registry.ensure_not_blocked(self.symbol, self.yf_obj)
+        self._unblocked = True
+
+    async def _aensure_not_blocked(self):
+        registry = get_default_registry()
+        if registry is None or self._unblocked:
+            return
+        await registry.aensure_not_blocked(self.symbol, self.yf_obj)
+        self._unblocked = True
+
+    def _mark_delisted(self, price_range: dict):
+        """Record a pair whose (non-incremental) history request came back empty."""
+        registry = get_default_registry()
+        if registry is not None and not price_range.get("start"):
+            registry.mark(self.symbol, reason="No price history.")
+
+    def _price_range(self) -> dict:
         if self.period:
-            history = GetHelpers.get_history(self.yf_obj, period=self.period)
-        else:
-            history = GetHelpers.get_history(self.yf_obj, start=self.start_date, end=self.end_date)
-
-        ohlc_list = []
-        for date, row in history.iterrows():
-            ohlc = OHLCModel(
-                date=date.to_pydatetime(),
-                open=row["Open"],
-                high=row["High"],
-                low=row["Low"],
-                close=row["Close"],
-                adj_close=row["Adj Close"] if "Adj Close" in row else None,
-                volume=int(row["Volume"]) if not pd.isna(row["Volume"]) else None,
-            )
-            ohlc_list.append(ohlc)
+            return {"period": self.period}
+        return {"start": self.start_date, "end": self.end_date}
+
+    @memoize("history")
+    @not_blocked
+    def _get_history(self, **kwargs):
+        try:
+            return GetHelpers.get_history(self.yf_obj, **kwargs)
+        except DelistedSymbolError:
+            raise
+        except NoDataError:
+            self._mark_delisted(kwargs)
+            raise
+
+    @amemoize("history")
+    @anot_blocked
+    async def _aget_history(self, **kwargs):
+        try:
+            return await GetHelpers.aget_history(self.yf_obj, **kwargs)
+        except DelistedSymbolError:
+            raise
+        except NoDataError:
+            self._mark_delisted(kwargs)
+            raise
 
+    @memoize("info")
+    @not_blocked
+    def _get_info(self):
+        return GetHelpers.get_info(self.yf_obj)
+
+    @amemoize("info")
+    @anot_blocked
+    async def _aget_info(self):
+        return await GetHelpers.aget_info(self.yf_obj)
+
+    def extract_fx_prices(self, since: Optional[datetime] = None) -> FxPriceModel:
+        """Extract prices for the configured range, or only the bars from ``since`` onwards for incremental runs."""
+        price_range = {"start": since, "end": None} if since is not None else self._price_range()
+        history = self._get_history(**price_range)
+
+        return self.price_model_from_history(history)
+
+    def price_model_from_history(self, history: pd.DataFrame) -> FxPriceModel:
         metadata = MetadataModel(source="yfinance")
         fx_price = FxPriceModel(
             from_currency=self.from_currency,
             to_currency=self.to_currency,
-            prices=ohlc_list,
+            prices=OHLCSeries.from_history(history),
             metadata=metadata,
         )
 
         return fx_price
 
     def extract_fx_profile(self) -> FxProfileModel:
-        info = GetHelpers.get_info(self.yf_obj)
+        return self.profile_model_from_info(self._get_info())
 
+    def profile_model_from_info(self, info: dict) -> FxProfileModel:
         metadata = MetadataModel(source="yfinance")
         fx_profile = FxProfileModel(
             from_currency=self.from_currency,
@@ -98,46 +165,60 @@ class FxDataExtractor:
         return fx_profile
 
     def extract_fx_fundamentals(self) -> FxFundamentalModel:
-        info = GetHelpers.get_info(self.yf_obj)
+        info = self._get_info()
+
+        return self.fundamental_model_from(
+            info,
+            day_history=lambda: self._get_history(period="5d"),
+            year_history=lambda: self._get_history(period="1y"),
+        )
+
+    def fundamental_model_from(
+            self,
+            info: dict,
+            day_history: Callable[[], pd.DataFrame],
+            year_history: Callable[[], pd.DataFrame],
+    ) -> FxFundamentalModel:
+        """
+        Build the fundamentals from ``info``, falling back to prices only for the keys it lacks. The histories are
+        passed as callables so that they are only fetched (or sliced) when a fallback needs them.
+        """
+
+        def day_value(key, parameter):
+            return SafeHelpers.safe_float(SafeHelpers.safe_get_lazy(
+                info, key, lambda: GetHelpers.price_from_history(day_history(), period="1d", parameter=parameter)
+            ))
+
+        def year_value(key, parameter):
+            return SafeHelpers.safe_float(SafeHelpers.safe_get_lazy(
+                info, key, lambda: GetHelpers.price_from_history(year_history(), period="1y", parameter=parameter)
+            ))
+
+        def moving_average(key, window):
+            return SafeHelpers.safe_float(SafeHelpers.safe_get_lazy(
+                info, key, lambda: year_history()["Close"].tail(window).mean()
+            ))
 
         day = OHLCModel(
-            low=SafeHelpers.safe_float(
-                SafeHelpers.safe_get(info, "dayLow",
-                                     GetHelpers.get_price_at_period(self.yf_obj, period="1d", parameter="low"))
-            ),
-            high=SafeHelpers.safe_float(
-                SafeHelpers.safe_get(info, "dayHigh",
-                                     GetHelpers.get_price_at_period(self.yf_obj, period="1d", parameter="high"))
-            ),
-            open=SafeHelpers.safe_float(
-                SafeHelpers.safe_get(info, "open",
-                                     GetHelpers.get_price_at_period(self.yf_obj, period="1d", parameter="open"))
-            ),
-            close=SafeHelpers.safe_float(
-                SafeHelpers.safe_get(info, "currentPrice",
-                                     GetHelpers.get_price_at_period(self.yf_obj, period="1d", parameter="close"))
-            )
+            low=day_value("dayLow", "low"),
+            high=day_value("dayHigh", "high"),
+            open=day_value("open", "open"),
+            close=day_value("currentPrice", "close"),
         )
 
         year = OHLCModel(
-            low=SafeHelpers.safe_float(
-                SafeHelpers.safe_get(info, "fiftyTwoWeekLow",
-                                     GetHelpers.get_price_at_period(self.yf_obj, period="1y", parameter="low"))
-            ),
-            high=SafeHelpers.safe_float(
-                SafeHelpers.safe_get(info, "fiftyTwoWeekHigh",
-                                     GetHelpers.get_price_at_period(self.yf_obj, period="1y", parameter="high"))
-            ),
-            open=GetHelpers.get_price_at_period(self.yf_obj, period="1y", parameter="open"),
-            close=GetHelpers.get_price_at_period(self.yf_obj, period="1y", parameter="close")
+            low=year_value("fiftyTwoWeekLow", "low"),
+            high=year_value("fiftyTwoWeekHigh", "high"),
+            open=GetHelpers.price_from_history(year_history(), period="1y", parameter="open"),
+            close=GetHelpers.price_from_history(year_history(), period="1y", parameter="close"),
         )
 
         metadata = MetadataModel(source="yfinance")
         fx_fundamental = FxFundamentalModel(
             from_currency=self.from_currency,
             to_currency=self.to_currency,
-            ma50=SafeHelpers.safe_float(SafeHelpers.safe_get(info, "fiftyDayAverage", None)),
-            ma200=SafeHelpers.safe_float(SafeHelpers.safe_get(info, "twoHundredDayAverage", None)),
+            ma50=moving_average("fiftyDayAverage", 50),
+            ma200=moving_average("twoHundredDayAverage", 200),
             day=day,
             year=year,
             metadata=metadata,
@@ -146,13 +227,18 @@ class FxDataExtractor:
         return fx_fundamental
 
     def extract_fx_calculations(self) -> FxCalculationModel:
-        history_1y = GetHelpers.get_history(self.yf_obj, period="1y")
-        history_max = GetHelpers.get_history(self.yf_obj, period="max")
+        return self.calculation_model_from_history(self._get_history(period="1y"), self._get_history(period="max"))
 
-        volatility = CalcHelpers.calculate_volatility(history_1y["Close"], return_type="log")
-        sharpe_ratio = CalcHelpers.calculate_sharpe_ratio(history_1y["Close"], risk_free_rate=0.0, return_type="log")
-        max_drawdown = CalcHelpers.calculate_max_drawdown(history_1y["Close"])
-        cagr = CalcHelpers.calculate_cagr(history_max["Close"], periods=[1, 5])
+    def calculation_model_from_history(
+            self,
+            history_1y: pd.DataFrame,
+            history_max: pd.DataFrame,
+    ) -> FxCalculationModel:
+        context = PriceContext(history_1y["Close"], return_type="log", risk_free_rate=0.0)
+        volatility = context.volatility
+        sharpe_ratio = context.sharpe_ratio
+        max_drawdown = context.max_drawdown
+        cagr = PriceContext(history_max["Close"]).cagr(periods=[1, 5])
 
         metadata = MetadataModel(source="yfinance")
 
@@ -169,28 +255,118 @@ class FxDataExtractor:
 
         return model
 
-    def extract_fx_forecast(self) -> FxForecastModel:
-        history = GetHelpers.get_history(self.yf_obj, period="max")
-
-        forecast = CalcHelpers.forecast_fx_prices(history, requested_days=365 * 20)
-        ohlc_list = []
-        for date, row in forecast.iterrows():
-            ohlc = OHLCModel(
-                date=date.to_pydatetime(),
-                open=row["Open"],
-                high=row["High"],
-                low=row["Low"],
-                close=row["Close"],
-            )
-            ohlc_list.append(ohlc)
+    def extract_fx_forecast(
+            self,
+            paths: Optional[int] = None,
+            seed: int = 42,
+            workers: Optional[int] = None
+    ) -> FxForecastModel:
+        history = self._get_history(period="max")
+        return self.forecast_model_from_history(history, paths=paths, seed=seed, workers=workers)
+
+    def forecast_model_from_history(
+            self,
+            history: pd.DataFrame,
+            paths: Optional[int] = None,
+            seed: int = 42,
+            workers: Optional[int] = None
+    ) -> FxForecastModel:
+        if paths:
+            return self._extract_fx_forecast_ensemble(history, paths=paths, seed=seed, workers=workers)
 
+        forecast = CalcHelpers.forecast_fx_prices(history, requested_days=365 * 20, seed=seed)
         metadata = MetadataModel(source="yfinance")
         model = FxForecastModel(
             from_currency=self.from_currency,
             to_currency=self.to_currency,
-            prices=ohlc_list,
+            prices=OHLCSeries.from_history(forecast),
             model="GBM (Geometric Brownian Motion)",
             metadata=metadata,
         )
 
         return model
+
+    def extract_all(
+            self,
+            paths: Optional[int] = None,
+            seed: int = 42,
+            workers: Optional[int] = None
+    ) -> Dict[str, ExportableModel]:
+        """
+        Every FX product ("prices", "profile", "fundamentals", "calculations", "forecast") from one max-history
+        fetch and one info fetch; the price range, 5d/1y windows and fallbacks are all sliced locally.
+        """
+        history = self._get_history(period="max")
+        info = self._get_info()
+
+        if self.period:
+            prices = GetHelpers.slice_history(history, self.period)
+        else:
+            prices = DataSource.slice_range(history, self.start_date, self.end_date)
+        history_5d = GetHelpers.slice_history(history, "5d")
+        history_1y = GetHelpers.slice_history(history, "1y")
+
+        return {
+            "prices": self.price_model_from_history(prices),
+            "profile": self.profile_model_from_info(info),
+            "fundamentals": self.fundamental_model_from(info, lambda: history_5d, lambda: history_1y),
+            "calculations": self.calculation_model_from_history(history_1y, history),
+            "forecast": self.forecast_model_from_history(history, paths=paths, seed=seed, workers=workers),
+        }
+
+    def _extract_fx_forecast_ensemble(self, history, paths: int, seed: int, workers: Optional[int]) -> FxForecastModel:
+        forecast = CalcHelpers.forecast_fx_ensemble(
+            history, requested_days=365 * 20, paths=paths, seed=seed, workers=workers
+        )
+        bands = ForecastBandSeries.from_forecast(forecast)
+
+        metadata = MetadataModel(source="yfinance")
+        model = FxForecastModel(
+            from_currency=self.from_currency,
+            to_currency=self.to_currency,
+            bands=bands,
+            paths=paths,
+            model="GBM Monte Carlo (Geometric Brownian Motion)",
+            metadata=metadata,
+        )
+
+        return model
+
+    async def aextract_fx_prices(self) -> FxPriceModel:
+        """Fetch off the event loop (bounded by AsyncHelpers), then build the model from the fetched response."""
+        return self.price_model_from_history(await self._aget_history(**self._price_range()))
+
+    async def aextract_fx_profile(self) -> FxProfileModel:
+        return self.profile_model_from_info(await self._aget_info())
+
+    async def aextract_fx_fundamentals(self) -> FxFundamentalModel:
+        info, history_5d, history_1y = await asyncio.gather(
+            self._aget_info(), self._aget_history(period="5d"), self._aget_history(period="1y")
+        )
+        return self.fundamental_model_from(info, lambda: history_5d, lambda: history_1y)
+
+    async def aextract_fx_calculations(self) -> FxCalculationModel:
+        history_1y, history_max = await asyncio.gather(
+            self._aget_history(period="1y"), self._aget_history(period="max")
+        )
+        return self.calculation_model_from_history(history_1y, history_max)
+
+    async def aextract_all(
+            self,
+            paths: Optional[int] = None,
+            seed: int = 42,
+            workers: Optional[int] = None
+    ) -> Dict[str, ExportableModel]:
+        await asyncio.gather(self._aget_history(period="max"), self._aget_info())
+        return await asyncio.to_thread(self.extract_all, paths=paths, seed=seed, workers=workers)
+
+    async def aextract_fx_forecast(
+            self,
+            paths: Optional[int] = None,
+            seed: int = 42,
+            workers: Optional[int] = None
+    ) -> FxForecastModel:
+        history = await self._aget_history(period="max")
+        return await asyncio.to_thread(
+            self.forecast_model_from_history, history, paths=paths, seed=seed, workers=workers
+        )
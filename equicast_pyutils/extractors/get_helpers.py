@@ -1,47 +1,196 @@
-import random
-import time
 from dataclasses import dataclass
 
-from equicast_pyutils.extractors.retry import retry
+import pandas as pd
+
+from equicast_pyutils.extractors.async_helpers import AsyncHelpers
+from equicast_pyutils.extractors.data_sources import DataSource, get_default_source
+from equicast_pyutils.extractors.exceptions import NoDataError
+from equicast_pyutils.extractors.history_range import get_default_ranges
+from equicast_pyutils.extractors.metrics import timed
+from equicast_pyutils.extractors.rate_limiter import rate_limited
+from equicast_pyutils.extractors.response_cache import get_default_cache, cache_key
+from equicast_pyutils.extractors.retry import retry, async_retry
+from equicast_pyutils.extractors.symbol_registry import get_default_registry
 
 
 @dataclass
 class GetHelpers:
     @staticmethod
-    @retry(delay=2)
+    def _cached(endpoint, yf_obj, params, fetch):
+        cache = get_default_cache()
+        if cache is None:
+            return fetch()
+
+        key = cache_key(getattr(yf_obj, "ticker", yf_obj), *params)
+        return cache.get_or_fetch(endpoint, key, fetch)
+
+    @staticmethod
+    async def _acached(endpoint, yf_obj, params, fetch):
+        cache = get_default_cache()
+        if cache is None:
+            return await fetch()
+
+        key = cache_key(getattr(yf_obj, "ticker", yf_obj), *params)
+        value = cache.get(endpoint, key)
+        if value is None:
+            value = await fetch()
+            cache.set(endpoint, key, value)
+        return value
+
+    @staticmethod
     def get_history(yf_obj, interval="1d", period=None, start=None, end=None):
-        time.sleep(random.uniform(0.1, 0.5))
-        if period:
-            data = yf_obj.history(period=period, interval=interval)
-        else:
-            data = yf_obj.history(start=start, end=end, interval=interval)
+        # A cached "no data" answer is raised here, before the rate limiter is involved.
+        get_default_ranges().ensure_has_data(getattr(yf_obj, "ticker", str(yf_obj)), interval)
+        return GetHelpers._cached(
+            "history", yf_obj, (interval, period, start, end),
+            lambda: GetHelpers._get_history(yf_obj, interval=interval, period=period, start=start, end=end)
+        )
+
+    @staticmethod
+    async def aget_history(yf_obj, interval="1d", period=None, start=None, end=None):
+        get_default_ranges().ensure_has_data(getattr(yf_obj, "ticker", str(yf_obj)), interval)
+        return await GetHelpers._acached(
+            "history", yf_obj, (interval, period, start, end),
+            lambda: GetHelpers._aget_history(yf_obj, interval=interval, period=period, start=start, end=end)
+        )
+
+    @staticmethod
+    @retry(delay=2)
+    def _get_history(yf_obj, interval="1d", period=None, start=None, end=None):
+        return GetHelpers._fetch_history(yf_obj, interval=interval, period=period, start=start, end=end)
+
+    @staticmethod
+    @async_retry(delay=2)
+    async def _aget_history(yf_obj, interval="1d", period=None, start=None, end=None):
+        return await AsyncHelpers.run(
+            GetHelpers._fetch_history, yf_obj, interval=interval, period=period, start=start, end=end
+        )
 
-        fallback_periods = ["20y", "15y", "10y", "5y", "1y"]
-        for fallback in fallback_periods:
-            if data.empty:
-                data = yf_obj.history(period=fallback, interval=interval)
-                print(f"⏳ No data found. Fallback to {fallback}.")
+    @staticmethod
+    @rate_limited
+    @timed("history")
+    def _fetch_history(yf_obj, interval="1d", period=None, start=None, end=None):
+        return get_default_ranges().fetch(yf_obj, period=period, interval=interval, start=start, end=end)
+
+    @staticmethod
+    def get_history_bulk(symbols, interval="1d", period=None, start=None, end=None, source: DataSource = None):
+        """
+        Fetch price history for many symbols with one bulk download per call.
+
+        Returns a dict of symbol -> DataFrame for symbols with data and a dict of symbol -> error message for the
+        rest. Symbols already present in the default response cache are not downloaded again, and symbols in the
+        delisted registry are only downloaded when their re-check is due. ``source`` defaults to the process-wide
+        data source.
+        """
+        source = source or get_default_source()
+        cache = get_default_cache()
+        registry = get_default_registry()
+        params = (interval, period, start, end)
+        histories, errors = {}, {}
+
+        pending = []
+        for symbol in dict.fromkeys(symbols):
+            if registry is not None and registry.is_blocked(symbol):
+                errors[symbol] = f"{symbol} is {registry.entry(symbol)['status']} (registry)."
+                continue
+
+            history = cache.get("history", cache_key(symbol, *params)) if cache else None
+            if history is None:
+                pending.append(symbol)
             else:
-                break
+                histories[symbol] = history
 
-        if data.empty:
-            raise ValueError("No historical data found for the specified ticker.")
+        if not pending:
+            return histories, errors
 
-        return data
+        try:
+            data = GetHelpers._download_history(
+                pending, interval=interval, period=period, start=start, end=end, source=source
+            )
+        except Exception as e:
+            return histories, {**errors, **{symbol: str(e) for symbol in pending}}
+
+        download_errors = source.download_errors()
+        due = set(registry.due(pending)) if registry is not None else set()
+        for symbol in pending:
+            history = GetHelpers._split_download(data, symbol)
+            if history is None or history.empty:
+                errors[symbol] = download_errors.get(symbol) or "No historical data found for the specified ticker."
+                # An empty incremental window (start=...) only means no new bars, e.g. over a weekend; yfinance
+                # still calls that "possibly delisted", so only full-range requests may list a symbol.
+                if registry is not None and not start and (symbol in due or "delisted" in errors[symbol].lower()):
+                    registry.mark(symbol, reason=errors[symbol])
+                continue
+
+            if symbol in due:
+                registry.clear(symbol)
+            histories[symbol] = history
+            if cache:
+                cache.set("history", cache_key(symbol, *params), history)
+
+        return histories, errors
 
     @staticmethod
     @retry(delay=2)
+    @rate_limited(tokens=lambda symbols, *args, **kwargs: len(symbols))
+    @timed("download")
+    def _download_history(symbols, interval="1d", period=None, start=None, end=None, source: DataSource = None):
+        data = (source or get_default_source()).download(
+            symbols, interval=interval, period=period, start=start, end=end
+        )
+        if data is None or data.empty:
+            raise NoDataError("No historical data found for the specified tickers.")
+
+        return data
+
+    @staticmethod
+    def _split_download(data: pd.DataFrame, symbol: str):
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                return None
+            history = data[symbol]
+        else:
+            history = data
+
+        return history.dropna(how="all")
+
+    @staticmethod
     def get_info(yf_obj):
-        time.sleep(random.uniform(0.1, 0.5))
+        return GetHelpers._cached("info", yf_obj, (), lambda: GetHelpers._get_info(yf_obj))
+
+    @staticmethod
+    async def aget_info(yf_obj):
+        return await GetHelpers._acached("info", yf_obj, (), lambda: GetHelpers._aget_info(yf_obj))
+
+    @staticmethod
+    @retry(delay=2)
+    def _get_info(yf_obj):
+        return GetHelpers._fetch_info(yf_obj)
+
+    @staticmethod
+    @async_retry(delay=2)
+    async def _aget_info(yf_obj):
+        return await AsyncHelpers.run(GetHelpers._fetch_info, yf_obj)
+
+    @staticmethod
+    @rate_limited
+    @timed("info")
+    def _fetch_info(yf_obj):
         info = yf_obj.info
         if not info or len(info) < 5:
             info = yf_obj.get_info()
 
         if not info or len(info) < 5:
-            raise ValueError("No info found for the specified ticker.")
+            raise NoDataError("No info found for the specified ticker.")
 
+        get_default_ranges().note_info(getattr(yf_obj, "ticker", str(yf_obj)), info)
         return info
 
+    @staticmethod
+    def slice_history(history: pd.DataFrame, period: str = None) -> pd.DataFrame:
+        """Cut a yfinance-style period ("5d", "1mo", "1y", "ytd", "max") from the tail of a longer history frame."""
+        return DataSource.slice_history(history, period)
+
     @staticmethod
     def get_price_at_period(yf_obj, period: str = "1d", parameter: str = "close"):
         param_map = {
@@ -57,6 +206,22 @@ class GetHelpers:
 
         u_period = "5d" if period == "1d" else period
         history = GetHelpers.get_history(yf_obj, period=u_period)
+        return GetHelpers.price_from_history(history, period=period, parameter=parameter)
+
+    @staticmethod
+    def price_from_history(history: pd.DataFrame, period: str = "1d", parameter: str = "close"):
+        """Latest (period "1d") or first (any other period) value of ``parameter`` in an already fetched history."""
+        param_map = {
+            "close": ["Adj Close", "Close"],
+            "open": ["Open"],
+            "low": ["Low"],
+            "high": ["High"],
+        }
+
+        parameter = parameter.lower()
+        if parameter not in param_map:
+            raise ValueError(f"Unsupported parameter: {parameter}")
+
         if history.empty:
             return None
 
@@ -69,11 +234,16 @@ class GetHelpers:
 
     @staticmethod
     def check_delisted(yf_obj, info=None, history=None):
+        registry = get_default_registry()
+        symbol = getattr(yf_obj, "ticker", None)
+        if registry is not None and symbol and registry.is_blocked(symbol):
+            return True
+
         try:
             if info is None:
                 info = yf_obj.info if yf_obj else {}
             if history is None and yf_obj:
-                history = yf_obj.history(period="1y")
+                history = yf_obj.history(period="5d")
 
             is_delisted = False
 
@@ -88,7 +258,12 @@ class GetHelpers:
             # Case 3: Explicit signal
             if info.get("quoteType", "").lower() == "none":
                 is_delisted = True
-
-            return is_delisted
         except Exception:
             return True
+
+        if registry is not None and symbol:
+            if is_delisted:
+                registry.mark(symbol, reason="No info or price history.")
+            else:
+                registry.clear(symbol)
+        return is_delisted
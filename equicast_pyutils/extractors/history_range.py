@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional, Set
+
+import pandas as pd
+
+from equicast_pyutils.extractors.data_sources import DataSource
+from equicast_pyutils.extractors.exceptions import NoDataError
+from equicast_pyutils.extractors.metrics import increment, observe
+from equicast_pyutils.extractors.response_cache import PARTIAL, cache_key, get_default_cache
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryRanges:
+    """
+    What is known about the history range of each symbol: its first trade date (from info), whether a plain "max"
+    request for it comes back empty, and whether it had no data at all.
+
+    When a history request comes back empty, ``fetch`` retries once from the first trade date, or with a single
+    ``probe_period`` request when that date is unknown, instead of walking "20y" → "1y". A probe's window is cut
+    to the requested period and returned, but it is never remembered here and is tagged ``PARTIAL`` so that the
+    response cache does not store it either; it cannot narrow later "max" requests. A symbol that is still empty is
+    recorded as such for ``negative_ttl`` seconds; callers check ``ensure_has_data`` before taking a rate-limiter
+    token so that the cached answer costs nothing. First trade dates and negative results are also written to the
+    default response cache, so an on-disk cache carries them across processes.
+    """
+
+    def __init__(self, negative_ttl: float = 6 * 3600, probe_period: str = "10y"):
+        self.negative_ttl = negative_ttl
+        self.probe_period = probe_period
+        self._first_trades: Dict[str, pd.Timestamp] = {}
+        self._max_empty: Set[tuple] = set()
+        self._empty: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def note_info(self, symbol: str, info: dict):
+        """Take the first trade date from an info response (``firstTradeDateMilliseconds``/``...EpochUtc``)."""
+        try:
+            if info.get("firstTradeDateMilliseconds"):
+                first = pd.Timestamp(info["firstTradeDateMilliseconds"], unit="ms", tz="UTC")
+            elif info.get("firstTradeDateEpochUtc"):
+                first = pd.Timestamp(info["firstTradeDateEpochUtc"], unit="s", tz="UTC")
+            else:
+                return
+        except Exception:
+            return
+
+        first = first.normalize()
+        with self._lock:
+            if self._first_trades.get(symbol) == first:
+                return
+            self._first_trades[symbol] = first
+
+        cache = get_default_cache()
+        if cache is not None:
+            cache.set("history_range", cache_key(symbol), first)
+
+    def first_trade_date(self, symbol: str) -> Optional[pd.Timestamp]:
+        with self._lock:
+            first = self._first_trades.get(symbol)
+        if first is not None:
+            return first
+
+        cache = get_default_cache()
+        return cache.get("history_range", cache_key(symbol)) if cache is not None else None
+
+    def mark_empty(self, symbol: str, interval: str):
+        with self._lock:
+            self._empty[(symbol, interval)] = time.time()
+
+        cache = get_default_cache()
+        if cache is not None:
+            cache.set("history_empty", cache_key(symbol, interval), time.time())
+
+    def is_empty(self, symbol: str, interval: str) -> bool:
+        with self._lock:
+            marked = self._empty.get((symbol, interval))
+        if marked is None:
+            cache = get_default_cache()
+            marked = cache.get("history_empty", cache_key(symbol, interval)) if cache is not None else None
+        return marked is not None and time.time() - marked <= self.negative_ttl
+
+    def ensure_has_data(self, symbol: str, interval: str = "1d"):
+        """Raise NoDataError for a symbol recorded as empty, without any upstream call."""
+        if self.is_empty(symbol, interval):
+            increment("negative_hits", endpoint="history", ticker=symbol)
+            raise NoDataError(f"No historical data found for {symbol} (cached negative result).")
+
+    def forget(self, symbol: str):
+        with self._lock:
+            self._first_trades.pop(symbol, None)
+            self._max_empty = {key for key in self._max_empty if key[0] != symbol}
+            for key in [k for k in self._empty if k[0] == symbol]:
+                del self._empty[key]
+
+    def fetch(self, yf_obj, period=None, interval="1d", start=None, end=None):
+        """
+        One ``yf_obj.history`` call, plus at most one retry when it comes back empty. A "max" request for a symbol
+        whose "max" answer was empty before goes straight to its first trade date. An explicit ``start`` (an
+        incremental fetch) is never widened.
+        """
+        symbol = getattr(yf_obj, "ticker", str(yf_obj))
+        first = self.first_trade_date(symbol) if not start else None
+        with self._lock:
+            skip_max = period == "max" and first is not None and (symbol, interval) in self._max_empty
+
+        depth = 0
+        if skip_max:
+            data = yf_obj.history(start=first, end=end, interval=interval)
+        else:
+            if period:
+                data = yf_obj.history(period=period, interval=interval)
+            else:
+                data = yf_obj.history(start=start, end=end, interval=interval)
+
+            if data.empty and not start:
+                depth = 1
+                if first is not None:
+                    logger.info("⏳ No data found for %s. Retrying from its first trade date %s.", symbol, first.date())
+                    data = DataSource.slice_history(yf_obj.history(start=first, end=end, interval=interval), period)
+                    if period == "max" and not data.empty:
+                        with self._lock:
+                            self._max_empty.add((symbol, interval))
+                else:
+                    logger.info("⏳ No data found for %s. Probing %s.", symbol, self.probe_period)
+                    data = DataSource.slice_history(yf_obj.history(period=self.probe_period, interval=interval), period)
+                    data.attrs[PARTIAL] = True
+        observe("fallback_depth", depth, endpoint="history", ticker=symbol)
+
+        if data.empty:
+            if not start:
+                self.mark_empty(symbol, interval)
+            raise NoDataError("No historical data found for the specified ticker.")
+
+        return data
+
+
+_default_ranges = HistoryRanges()
+
+
+def set_default_ranges(ranges: HistoryRanges):
+    """Install the process-wide history range registry used by GetHelpers and the extractors."""
+    global _default_ranges
+    _default_ranges = ranges
+
+
+def get_default_ranges() -> HistoryRanges:
+    return _default_ranges
@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import yfinance as yf
+from curl_cffi import CurlOpt
+from curl_cffi import requests as curl_requests
+
+
+class SessionPool:
+    """
+    One keep-alive HTTP session shared by every yf.Ticker in the process, plus a registry of those tickers.
+
+    The session is a curl_cffi session impersonating a browser (yfinance rejects anything else). Each thread gets
+    its own curl handle that keeps up to ``pool_size`` connections alive, so TLS handshakes and Yahoo's
+    cookie/crumb negotiation happen once instead of once per ticker object. ``ticker(symbol)`` hands out one
+    yf.Ticker per symbol, rebuilt after ``ticker_ttl`` seconds so that yfinance's own per-object caches (info,
+    quotes) do not go stale in long-lived processes, and at most ``max_tickers`` are kept.
+
+    Both the session and the tickers are created on first use and live as long as the pool, so a warm container
+    that keeps the module-level default pool reuses its open connections.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = 32,
+            impersonate: str = "chrome",
+            timeout: float = 30.0,
+            ticker_ttl: float = 3600.0,
+            max_tickers: int = 4096,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.pool_size = pool_size
+        self.impersonate = impersonate
+        self.timeout = timeout
+        self.ticker_ttl = ticker_ttl
+        self.max_tickers = max_tickers
+        self._session = None
+        self._tickers: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = curl_requests.Session(
+                        impersonate=self.impersonate,
+                        timeout=self.timeout,
+                        curl_options={CurlOpt.MAXCONNECTS: self.pool_size},
+                    )
+        return self._session
+
+    def ticker(self, symbol: str) -> yf.Ticker:
+        session = self.session
+        now = time.monotonic()
+        with self._lock:
+            entry = self._tickers.get(symbol)
+            if entry is not None and now - entry[0] <= self.ticker_ttl:
+                self._tickers.move_to_end(symbol)
+                return entry[1]
+
+            ticker = yf.Ticker(symbol, session=session)
+            self._tickers[symbol] = (now, ticker)
+            self._tickers.move_to_end(symbol)
+            while len(self._tickers) > self.max_tickers:
+                self._tickers.popitem(last=False)
+            return ticker
+
+    def forget(self, symbol: str):
+        with self._lock:
+            self._tickers.pop(symbol, None)
+
+    def close(self):
+        """Drop every ticker and close the session; the next call opens a new one."""
+        with self._lock:
+            self._tickers.clear()
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+_default_pool: Optional[SessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def set_default_pool(pool: Optional[SessionPool]):
+    """Install the process-wide session pool (None falls back to a default one on next use)."""
+    global _default_pool
+    _default_pool = pool
+
+
+def get_default_pool() -> SessionPool:
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = SessionPool()
+    return _default_pool
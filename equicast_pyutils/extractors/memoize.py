@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from functools import wraps
+from typing import Tuple
+
+_claims_lock = threading.Lock()
+
+
+def memo_key(name, *args, **kwargs):
+    return name, args, tuple(sorted(kwargs.items()))
+
+
+def _claim(memo, key) -> Tuple[Future, bool]:
+    """
+    The in-flight future of one memo entry, shared by ``memoize`` and ``amemoize``, and whether the caller created
+    it (and so has to fetch the value and resolve it).
+    """
+    with _claims_lock:
+        future = memo.get(("in_flight", key))
+        if future is not None:
+            return future, False
+        future = memo[("in_flight", key)] = Future()
+        return future, True
+
+
+def _resolve(memo, key, future: Future, value=None, error: BaseException = None):
+    if error is None:
+        memo[key] = value
+        future.set_result(value)
+    elif isinstance(error, Exception):
+        future.set_exception(error)
+    else:
+        future.cancel()
+    memo.pop(("in_flight", key), None)
+
+
+def memoize(name):
+    """
+    Cache the result of an extractor method on the instance (``self._memo``) for the lifetime of the object.
+
+    Concurrent callers of the same key (e.g. the fetch fan-out in ``extract_fundamentals``) wait for the first one
+    instead of fetching again, and share its result or error. Failures are not cached.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = memo_key(name, *args, **kwargs)
+            if key in self._memo:
+                return self._memo[key]
+
+            future, owner = _claim(self._memo, key)
+            if not owner:
+                return future.result()
+
+            try:
+                value = func(self, *args, **kwargs)
+            except BaseException as e:
+                _resolve(self._memo, key, future, error=e)
+                raise
+            _resolve(self._memo, key, future, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def amemoize(name):
+    """
+    Coroutine counterpart of ``memoize`` sharing the same ``self._memo`` entries and in-flight futures, so concurrent
+    coroutines and threads asking for the same key fetch it once. A coroutine waits on the in-flight future through
+    ``asyncio.wrap_future`` (shielded, so that a cancelled waiter does not cancel it for the others), which keeps
+    the event loop free while another caller fetches.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = memo_key(name, *args, **kwargs)
+            if key in self._memo:
+                return self._memo[key]
+
+            future, owner = _claim(self._memo, key)
+            if not owner:
+                return await asyncio.shield(asyncio.wrap_future(future))
+
+            try:
+                value = await func(self, *args, **kwargs)
+            except BaseException as e:
+                _resolve(self._memo, key, future, error=e)
+                raise
+            _resolve(self._memo, key, future, value)
+            return value
+
+        return wrapper
+
+    return decorator
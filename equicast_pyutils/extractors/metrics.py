@@ -0,0 +1,208 @@
+import bisect
+import logging
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency histogram bucket upper bounds, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf"))
+
+
+class MetricsSink:
+    """
+    Receives hot-path measurements. ``increment`` is used for counters (retries, cache hits, errors) and
+    ``observe`` for distributions (latency, sleep time, fallback depth); both carry string tags such as
+    ``endpoint`` and ``ticker``.
+    """
+
+    def increment(self, name: str, value: float = 1.0, tags: Optional[Dict[str, str]] = None):
+        raise NotImplementedError("Subclasses must implement increment().")
+
+    def observe(self, name: str, value: float, tags: Optional[Dict[str, str]] = None):
+        raise NotImplementedError("Subclasses must implement observe().")
+
+
+class InMemoryMetrics(MetricsSink):
+    """Thread-safe in-process stats: counters plus bucketed histograms (count, sum, min, max) per name and tags."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counters: Counter = Counter()
+        self.histograms: Dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, tags) -> tuple:
+        return (name,) + tuple(sorted((tags or {}).items()))
+
+    def increment(self, name, value=1.0, tags=None):
+        with self._lock:
+            self.counters[self._key(name, tags)] += value
+
+    def observe(self, name, value, tags=None):
+        key = self._key(name, tags)
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = {
+                    "count": 0, "sum": 0.0, "min": value, "max": value, "buckets": [0] * len(self.buckets)
+                }
+            hist["count"] += 1
+            hist["sum"] += value
+            hist["min"] = min(hist["min"], value)
+            hist["max"] = max(hist["max"], value)
+            hist["buckets"][min(bisect.bisect_left(self.buckets, value), len(self.buckets) - 1)] += 1
+
+    def counter(self, name: str, **tags) -> float:
+        """Sum of a counter over every tag set matching ``tags``."""
+        with self._lock:
+            return sum(v for k, v in self.counters.items() if k[0] == name and set(tags.items()) <= set(k[1:]))
+
+    def histogram(self, name: str, **tags) -> dict:
+        """Histograms of ``name`` matching ``tags``, merged into one ``count``/``sum``/``min``/``max``/``buckets``."""
+        merged = {"count": 0, "sum": 0.0, "min": None, "max": None, "buckets": [0] * len(self.buckets)}
+        with self._lock:
+            for key, hist in self.histograms.items():
+                if key[0] != name or not set(tags.items()) <= set(key[1:]):
+                    continue
+                merged["count"] += hist["count"]
+                merged["sum"] += hist["sum"]
+                merged["min"] = hist["min"] if merged["min"] is None else min(merged["min"], hist["min"])
+                merged["max"] = hist["max"] if merged["max"] is None else max(merged["max"], hist["max"])
+                merged["buckets"] = [a + b for a, b in zip(merged["buckets"], hist["buckets"])]
+        return merged
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "counters": {self._format(k): v for k, v in self.counters.items()},
+                "histograms": {self._format(k): {**h, "buckets": list(h["buckets"])}
+                               for k, h in self.histograms.items()},
+            }
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    @staticmethod
+    def _format(key: tuple) -> str:
+        tags = ",".join(f"{k}={v}" for k, v in key[1:])
+        return f"{key[0]}{{{tags}}}"
+
+
+class LoggingMetricsSink(MetricsSink):
+    """Writes every measurement to a logger (DEBUG by default)."""
+
+    def __init__(self, log: logging.Logger = logger, level: int = logging.DEBUG):
+        self.log = log
+        self.level = level
+
+    def increment(self, name, value=1.0, tags=None):
+        self.log.log(self.level, "metric %s +%s %s", name, value, tags or {})
+
+    def observe(self, name, value, tags=None):
+        self.log.log(self.level, "metric %s =%.6f %s", name, value, tags or {})
+
+
+class CallbackMetricsSink(MetricsSink):
+    """Forwards every measurement to ``callback(kind, name, value, tags)``, e.g. to push to an exporter."""
+
+    def __init__(self, callback: Callable[[str, str, float, Dict[str, str]], None]):
+        self.callback = callback
+
+    def increment(self, name, value=1.0, tags=None):
+        self.callback("counter", name, value, tags or {})
+
+    def observe(self, name, value, tags=None):
+        self.callback("histogram", name, value, tags or {})
+
+
+_default_metrics: Optional[MetricsSink] = None
+
+
+def set_default_metrics(sink: Optional[MetricsSink]):
+    """Install the process-wide metrics sink (None disables instrumentation)."""
+    global _default_metrics
+    _default_metrics = sink
+
+
+def get_default_metrics() -> Optional[MetricsSink]:
+    return _default_metrics
+
+
+def increment(name: str, value: float = 1.0, **tags):
+    sink = _default_metrics
+    if sink is not None:
+        sink.increment(name, value, {k: str(v) for k, v in tags.items() if v is not None})
+
+
+def observe(name: str, value: float, **tags):
+    sink = _default_metrics
+    if sink is not None:
+        sink.observe(name, value, {k: str(v) for k, v in tags.items() if v is not None})
+
+
+def ticker_of(args) -> Optional[str]:
+    """Best-effort ticker of a call: ``self.ticker`` for extractor methods, ``yf_obj.ticker`` for GetHelpers."""
+    if args:
+        ticker = getattr(args[0], "ticker", None)
+        if isinstance(ticker, str):
+            return ticker
+    return None
+
+
+def timed(endpoint: str):
+    """
+    Record the latency of every call as ``latency{endpoint,ticker}`` and failures as ``errors{...}``. Apply it
+    directly to the upstream call, inside ``retry`` and ``rate_limited``, so that every attempt is measured and
+    backoff or limiter waits (already recorded as ``sleep_seconds``) are not counted again.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _default_metrics is None:
+                return func(*args, **kwargs)
+
+            ticker = ticker_of(args)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                increment("errors", endpoint=endpoint, ticker=ticker)
+                raise
+            finally:
+                observe("latency", time.perf_counter() - start, endpoint=endpoint, ticker=ticker)
+
+        return wrapper
+
+    return decorator
+
+
+def atimed(endpoint: str):
+    """Coroutine counterpart of ``timed``."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _default_metrics is None:
+                return await func(*args, **kwargs)
+
+            ticker = ticker_of(args)
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                increment("errors", endpoint=endpoint, ticker=ticker)
+                raise
+            finally:
+                observe("latency", time.perf_counter() - start, endpoint=endpoint, ticker=ticker)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,127 @@
+import math
+from functools import cached_property
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from equicast_pyutils.extractors.calc_helpers import CalcHelpers
+
+
+class PriceContext:
+    """
+    One price series prepared once for many risk metrics.
+
+    Cleaning, returns and the sampling frequency are computed on first use and cached, as is every metric built on
+    them, so asking for volatility, Sharpe, Sortino, Calmar, drawdown and CAGR together costs one pass over the
+    data. Values match the corresponding ``CalcHelpers.calculate_*`` helpers.
+    """
+
+    def __init__(
+            self,
+            prices: pd.Series,
+            periods_per_year: Optional[int] = None,
+            return_type: str = "log",
+            risk_free_rate: float = 0.0,
+            ddof: int = 1,
+    ):
+        if prices is None or len(prices) < 2:
+            raise ValueError("Need at least two price observations")
+        if return_type not in ("log", "simple"):
+            raise ValueError("return_type must be 'log' or 'simple'")
+
+        self._raw = prices
+        self._periods_per_year = periods_per_year
+        self.return_type = return_type
+        self.risk_free_rate = risk_free_rate
+        self.ddof = ddof
+
+    @cached_property
+    def prices(self) -> pd.Series:
+        s = self._raw.dropna().astype(float).sort_index()
+        if len(s) < 2:
+            raise ValueError("Insufficient non-NaN data")
+        return s
+
+    @cached_property
+    def values(self) -> np.ndarray:
+        return self.prices.to_numpy()
+
+    @cached_property
+    def periods_per_year(self) -> int:
+        return self._periods_per_year or CalcHelpers.infer_periods_per_year(self.prices.index) or 252
+
+    @cached_property
+    def returns(self) -> np.ndarray:
+        if self.return_type == "log":
+            return np.diff(np.log(self.values))
+        return self.values[1:] / self.values[:-1] - 1
+
+    @cached_property
+    def rf_periodic(self) -> float:
+        return (1 + self.risk_free_rate) ** (1 / self.periods_per_year) - 1
+
+    @cached_property
+    def excess_returns(self) -> np.ndarray:
+        return self.returns - self.rf_periodic
+
+    @cached_property
+    def sigma(self) -> float:
+        """Per-period standard deviation of returns."""
+        return float(np.std(self.returns, ddof=self.ddof))
+
+    @cached_property
+    def downside_deviation(self) -> float:
+        """Annualised root mean square of the excess returns below zero."""
+        downside = np.minimum(self.excess_returns, 0.0)
+        return float(np.sqrt(np.mean(downside ** 2)) * math.sqrt(self.periods_per_year))
+
+    @cached_property
+    def volatility(self) -> float:
+        return self.sigma * math.sqrt(self.periods_per_year)
+
+    @cached_property
+    def sharpe_ratio(self) -> float:
+        return float(self.excess_returns.mean() / self.sigma * math.sqrt(self.periods_per_year))
+
+    @cached_property
+    def sortino_ratio(self) -> Optional[float]:
+        if self.downside_deviation == 0:
+            return None
+        return float(self.excess_returns.mean() * self.periods_per_year / self.downside_deviation)
+
+    @cached_property
+    def drawdowns(self) -> np.ndarray:
+        return self.values / np.maximum.accumulate(self.values) - 1
+
+    @cached_property
+    def max_drawdown(self) -> float:
+        return float(self.drawdowns.min())
+
+    @cached_property
+    def annualized_return(self) -> Optional[float]:
+        """Compound annual growth rate over the whole series."""
+        years = (self.prices.index[-1] - self.prices.index[0]).days / 365.25
+        if years <= 0:
+            return None
+        return float((self.values[-1] / self.values[0]) ** (1 / years) - 1)
+
+    @cached_property
+    def calmar_ratio(self) -> Optional[float]:
+        if self.annualized_return is None or self.max_drawdown == 0:
+            return None
+        return self.annualized_return / abs(self.max_drawdown)
+
+    def cagr(self, periods: List[int] = (1, 2, 5, 10, 15, 20), as_percent: bool = False) -> Dict[str, float]:
+        return CalcHelpers.calculate_cagr(self.prices, periods=list(periods), as_percent=as_percent)
+
+    def metrics(self) -> Dict[str, Optional[float]]:
+        return {
+            "volatility": self.volatility,
+            "sharpe_ratio": self.sharpe_ratio,
+            "sortino_ratio": self.sortino_ratio,
+            "calmar_ratio": self.calmar_ratio,
+            "max_drawdown": self.max_drawdown,
+            "downside_deviation": self.downside_deviation,
+            "annualized_return": self.annualized_return,
+        }
@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from equicast_pyutils.extractors import metrics
+
+logger = logging.getLogger(__name__)
+
+
+# Transport failures: socket, timeout, DNS and HTTP errors (requests and curl_cffi exceptions are OSErrors).
+TRANSIENT_ERRORS = (OSError,)
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """Whether an upstream exception means we are being rate limited (HTTP 429 / YFRateLimitError)."""
+    message = str(exc).lower()
+    return "ratelimit" in type(exc).__name__.lower() or "too many requests" in message or "429" in message
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether an exception says the host is struggling (throttling or transport), not that the request is bad."""
+    return isinstance(exc, TRANSIENT_ERRORS) or is_throttle_error(exc)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every extractor in the process, with AIMD rate adaptation.
+
+    The rate grows by ``increase`` tokens/second after each successful call and is multiplied by ``decrease`` after
+    a failure (and the bucket drained on throttling). Calls reserve tokens up front and sleep off any deficit, so
+    a bulk request costing several tokens simply waits longer. Passing ``lock_path`` keeps the bucket in a
+    file guarded by ``fcntl.flock`` so that several processes share one budget.
+    """
+
+    def __init__(
+            self,
+            rate: float = 4.0,
+            burst: float = 8.0,
+            min_rate: float = 0.5,
+            max_rate: float = 20.0,
+            increase: float = 0.1,
+            decrease: float = 0.5,
+            lock_path: Optional[str] = None,
+    ):
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("rate limits must satisfy 0 < min_rate <= rate <= max_rate")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.lock_path = lock_path if fcntl is not None else None
+        if lock_path and fcntl is None:
+            logger.warning("⚠️ File locking is not available on this platform, rate limiter is process-local.")
+
+        self._lock = threading.Lock()
+        self._local_state = {"rate": rate, "tokens": burst, "updated": time.monotonic()}
+        if self.lock_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.lock_path)), exist_ok=True)
+
+    @property
+    def rate(self) -> float:
+        with self._state() as state:
+            return state["rate"]
+
+    @contextmanager
+    def _state(self):
+        with self._lock:
+            if not self.lock_path:
+                yield self._local_state
+                return
+
+            with open(self.lock_path, "a+", encoding="utf-8") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    if not state:
+                        state = {"rate": self._local_state["rate"], "tokens": self.burst, "updated": time.time()}
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _now(self) -> float:
+        # Wall clock when the state is shared across processes, monotonic otherwise.
+        return time.time() if self.lock_path else time.monotonic()
+
+    def _reserve(self, tokens: float) -> float:
+        with self._state() as state:
+            now = self._now()
+            state["tokens"] = min(self.burst, state["tokens"] + (now - state["updated"]) * state["rate"])
+            state["updated"] = now
+            state["tokens"] -= tokens
+            return max(0.0, -state["tokens"] / state["rate"])
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available and return the number of seconds waited."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self):
+        with self._state() as state:
+            state["rate"] = min(self.max_rate, state["rate"] + self.increase)
+
+    def on_error(self, exc: Optional[BaseException] = None):
+        with self._state() as state:
+            state["rate"] = max(self.min_rate, state["rate"] * self.decrease)
+            if exc is not None and is_throttle_error(exc):
+                state["tokens"] = min(state["tokens"], 0.0)
+
+
+_default_rate_limiter = RateLimiter()
+
+
+def set_default_rate_limiter(limiter: RateLimiter):
+    """Replace the process-wide rate limiter shared by GetHelpers and the extractors."""
+    global _default_rate_limiter
+    _default_rate_limiter = limiter
+
+
+def get_default_rate_limiter() -> RateLimiter:
+    return _default_rate_limiter
+
+
+def rate_limited(func=None, *, tokens=1.0):
+    """
+    Take ``tokens`` from the default rate limiter before each call and feed the outcome back into it. Only
+    throttling and transport errors slow the limiter down; deterministic answers such as NoDataError do not.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            limiter = get_default_rate_limiter()
+            cost = tokens(*args, **kwargs) if callable(tokens) else tokens
+            waited = limiter.acquire(cost)
+            if waited:
+                metrics.observe("sleep_seconds", waited, reason="rate_limit", ticker=metrics.ticker_of(args))
+            try:
+                result = f(*args, **kwargs)
+            except Exception as e:
+                if is_transient_error(e):
+                    limiter.on_error(e)
+                raise
+            limiter.on_success()
+            return result
+
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
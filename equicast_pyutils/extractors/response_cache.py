@@ -0,0 +1,270 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import wraps
+from typing import Any, Dict, Optional, Tuple
+
+from equicast_pyutils.extractors import metrics
+
+DEFAULT_TTLS = {
+    "info": 24 * 3600,
+    "history": 12 * 3600,
+    "dividends": 24 * 3600,
+    "financials": 7 * 24 * 3600,
+    "balance_sheet": 7 * 24 * 3600,
+    "cash_flow": 7 * 24 * 3600,
+    "history_range": 7 * 24 * 3600,
+}
+
+# Frames tagged with ``frame.attrs[PARTIAL] = True`` stand in for a fuller answer (e.g. a probe window returned for
+# a "max" request) and are never stored.
+PARTIAL = "equicast_partial"
+
+
+def cache_key(symbol, *params) -> str:
+    return "|".join(str(p) for p in (symbol,) + params)
+
+
+class ResponseCache:
+    """Base class for pluggable upstream response caches with per-endpoint TTLs and hit/miss counters."""
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 24 * 3600):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, endpoint: str, key: str) -> Any:
+        """Return the cached value, or None on a miss or an expired entry."""
+        entry = self._load(endpoint, key)
+        if entry is not None:
+            created, value = entry
+            if time.time() - created <= self.ttl(endpoint):
+                self.hits[endpoint] += 1
+                metrics.increment("cache_hits", endpoint=endpoint, ticker=key.split("|", 1)[0])
+                return value
+            self._delete(endpoint, key)
+
+        self.misses[endpoint] += 1
+        metrics.increment("cache_misses", endpoint=endpoint, ticker=key.split("|", 1)[0])
+        return None
+
+    def set(self, endpoint: str, key: str, value: Any):
+        if value is None or getattr(value, "attrs", {}).get(PARTIAL):
+            return
+        self._store(endpoint, key, time.time(), value)
+
+    def get_or_fetch(self, endpoint: str, key: str, fetch):
+        value = self.get(endpoint, key)
+        if value is None:
+            value = fetch()
+            self.set(endpoint, key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": sum(self.hits.values()),
+            "misses": sum(self.misses.values()),
+            "endpoints": {
+                endpoint: {"hits": self.hits[endpoint], "misses": self.misses[endpoint]}
+                for endpoint in sorted(set(self.hits) | set(self.misses))
+            },
+        }
+
+    def clear(self):
+        raise NotImplementedError("Subclasses must implement clear().")
+
+    def _load(self, endpoint: str, key: str) -> Optional[Tuple[float, Any]]:
+        raise NotImplementedError("Subclasses must implement _load().")
+
+    def _store(self, endpoint: str, key: str, created: float, value: Any):
+        raise NotImplementedError("Subclasses must implement _store().")
+
+    def _delete(self, endpoint: str, key: str):
+        raise NotImplementedError("Subclasses must implement _delete().")
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU response cache bounded by entry count."""
+
+    def __init__(self, max_entries: int = 1024, **kwargs):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, endpoint, key):
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is not None:
+                self._entries.move_to_end((endpoint, key))
+            return entry
+
+    def _store(self, endpoint, key, created, value):
+        with self._lock:
+            self._entries[(endpoint, key)] = (created, value)
+            self._entries.move_to_end((endpoint, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, endpoint, key):
+        with self._lock:
+            self._entries.pop((endpoint, key), None)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """On-disk response cache in a single SQLite file, evicting least recently used entries above ``max_bytes``."""
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "endpoint TEXT NOT NULL, key TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL, "
+            "size INTEGER NOT NULL, payload BLOB NOT NULL, PRIMARY KEY (endpoint, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete every expired entry and return how many were removed."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            endpoints = [row[0] for row in self._conn.execute("SELECT DISTINCT endpoint FROM responses")]
+            for endpoint in endpoints:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ? AND created < ?", (endpoint, now - self.ttl(endpoint))
+                )
+                removed += cursor.rowcount
+            self._conn.commit()
+        return removed
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _load(self, endpoint, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created, payload FROM responses WHERE endpoint = ? AND key = ?", (endpoint, key)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE endpoint = ? AND key = ?", (time.time(), endpoint, key)
+            )
+            self._conn.commit()
+
+        try:
+            return row[0], pickle.loads(row[1])
+        except Exception:
+            self._delete(endpoint, key)
+            return None
+
+    def _store(self, endpoint, key, created, value):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (endpoint, key, created, accessed, size, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (endpoint, key, created, created, len(payload), payload),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _delete(self, endpoint, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE endpoint = ? AND key = ?", (endpoint, key))
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT endpoint, key, size FROM responses ORDER BY accessed").fetchall()
+        for endpoint, key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE endpoint = ? AND key = ?", (endpoint, key))
+            total -= size
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def set_default_cache(cache: Optional[ResponseCache]):
+    """Install the process-wide response cache used by GetHelpers and the extractors (None disables caching)."""
+    global _default_cache
+    _default_cache = cache
+
+
+def get_default_cache() -> Optional[ResponseCache]:
+    return _default_cache
+
+
+def _method_cache_key(self, args, kwargs) -> str:
+    return cache_key(self.ticker, *args, *(f"{k}={v}" for k, v in sorted(kwargs.items())))
+
+
+def cached(endpoint):
+    """Serve an extractor method from the default response cache, keyed by ``self.ticker`` and the call arguments."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = get_default_cache()
+            if cache is None:
+                return func(self, *args, **kwargs)
+
+            key = _method_cache_key(self, args, kwargs)
+            return cache.get_or_fetch(endpoint, key, lambda: func(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def acached(endpoint):
+    """Coroutine counterpart of ``cached`` sharing the same cache entries."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = get_default_cache()
+            if cache is None:
+                return await func(self, *args, **kwargs)
+
+            key = _method_cache_key(self, args, kwargs)
+            value = cache.get(endpoint, key)
+            if value is None:
+                value = await func(self, *args, **kwargs)
+                cache.set(endpoint, key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -1,26 +1,243 @@
+import asyncio
+import logging
 import random
+import threading
 import time
 from functools import wraps
+from typing import Dict, Optional
 
+from equicast_pyutils.extractors import metrics
+from equicast_pyutils.extractors.exceptions import NoDataError, CircuitOpenError
+from equicast_pyutils.extractors.rate_limiter import TRANSIENT_ERRORS, is_throttle_error
+
+logger = logging.getLogger(__name__)
+
+NON_RETRYABLE = (NoDataError, CircuitOpenError)
+
+
+class RetryBudget:
+    """Caps the total number of retries across all calls in a run (``limit=None`` means unlimited)."""
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def consume(self) -> bool:
+        with self._lock:
+            if self.limit is not None and self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+    def reset(self):
+        with self._lock:
+            self.used = 0
+
+
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive failures and rejects calls until ``reset_timeout`` seconds have
+    passed; the next call is then let through as a trial that closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 10, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def before_call(self, host: str = ""):
+        if self.is_open:
+            raise CircuitOpenError(f"❌ Circuit open for {host or 'host'} after {self.failures} consecutive failures.")
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+_default_retry_budget = RetryBudget()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    with _circuit_breakers_lock:
+        if host not in _circuit_breakers:
+            _circuit_breakers[host] = CircuitBreaker()
+        return _circuit_breakers[host]
+
+
+def set_circuit_breaker(host: str, breaker: CircuitBreaker):
+    with _circuit_breakers_lock:
+        _circuit_breakers[host] = breaker
+
+
+def set_default_retry_budget(budget: RetryBudget):
+    global _default_retry_budget
+    _default_retry_budget = budget
+
+
+def get_default_retry_budget() -> RetryBudget:
+    return _default_retry_budget
+
+
+class _RetryPolicy:
+    def __init__(self, max_retries, delay, backoff, jitter, max_delay, retry_on, give_up_on, host, budget):
+        if max_retries < 1:
+            raise ValueError("max_retries must be at least 1 (it counts attempts, including the first)")
+
+        self.max_retries = max_retries
+        self.delay = delay
+        self.backoff = backoff
+        self.jitter = jitter
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.give_up_on = give_up_on
+        self.host = host
+        self.budget = budget
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return get_circuit_breaker(self.host)
+
+    def before_attempt(self):
+        self.breaker.before_call(self.host)
+
+    def on_success(self):
+        self.breaker.record_success()
+
+    def is_retryable(self, exc: Exception) -> bool:
+        retryable = isinstance(exc, self.retry_on) or is_throttle_error(exc)
+        if isinstance(exc, self.give_up_on) or not retryable:
+            # The host answered, it is the request that cannot succeed.
+            self.breaker.record_success()
+            return False
+        self.breaker.record_failure()
+        return True
+
+    def next_delay(self, attempt: int) -> Optional[float]:
+        """Delay before the next attempt, or None when attempts or the retry budget are exhausted."""
+        if attempt + 1 >= self.max_retries or self.breaker.is_open:
+            return None
+        if not (self.budget or get_default_retry_budget()).consume():
+            return None
+
+        c_delay = min(self.delay * self.backoff ** attempt, self.max_delay)
+        if self.jitter:
+            c_delay += random.uniform(0.1, 0.5)
+        return c_delay
+
+
+def _record_retry(func, args, c_delay: float):
+    ticker = metrics.ticker_of(args)
+    logger.info("⏳ Retrying %s%s in %.2f seconds...", func.__name__, f" for {ticker}" if ticker else "", c_delay)
+    metrics.increment("retries", function=func.__name__, ticker=ticker)
+    metrics.observe("sleep_seconds", c_delay, reason="retry", ticker=ticker)
+
+
+def retry(
+        max_retries=5,
+        delay=0.0,
+        backoff=2.0,
+        jitter=True,
+        max_delay=60.0,
+        retry_on=TRANSIENT_ERRORS,
+        give_up_on=NON_RETRYABLE,
+        host="yahoo",
+        budget: Optional[RetryBudget] = None,
+):
+    """
+    Retry with exponential backoff (``delay * backoff ** attempt``, capped at ``max_delay``, plus jitter), making
+    at most ``max_retries`` attempts in total (at least 1).
+
+    Only ``retry_on`` exceptions (by default network and HTTP transport errors) and throttling errors are retried;
+    anything else, such as an empty answer or a programming error, and anything in ``give_up_on`` is raised
+    immediately. Retries draw from the run-wide retry budget, and repeated failures open the circuit breaker for
+    ``host`` so that later calls fail fast with CircuitOpenError. When all attempts fail a RuntimeError is raised,
+    chained to the last exception.
+    """
 
-def retry(max_retries=5, delay=0.0, backoff=2.0, jitter=True, max_delay=60.0):
     def decorator(func):
+        policy = _RetryPolicy(max_retries, delay, backoff, jitter, max_delay, retry_on, give_up_on, host, budget)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            e_attempt = kwargs.get("attempt", 0)
-            for i_retry in range(max_retries):
+            last_exc = None
+            for attempt in range(max_retries):
+                policy.before_attempt()
                 try:
-                    return func(*args, **kwargs)
-                except Exception:
-                    c_delay = delay + e_attempt * (e_attempt + 1) // 2
-                    c_delay = min(c_delay, max_delay)
-                    if jitter:
-                        j_factor = random.uniform(0.1, 0.5)
-                        c_delay += j_factor
-
-                    print(f"⏳ Retrying in {c_delay:.2f} seconds...")
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    if not policy.is_retryable(e):
+                        raise
+                    last_exc = e
+                    c_delay = policy.next_delay(attempt)
+                    if c_delay is None:
+                        break
+                    _record_retry(func, args, c_delay)
                     time.sleep(c_delay)
-            raise RuntimeError(f"❌ {func.__name__} failed after {max_retries} retries.")
+                else:
+                    policy.on_success()
+                    return result
+            metrics.increment("retries_exhausted", function=func.__name__, ticker=metrics.ticker_of(args))
+            raise RuntimeError(f"❌ {func.__name__} failed after {attempt + 1} attempts.") from last_exc
+
+        return wrapper
+
+    return decorator
+
+
+def async_retry(
+        max_retries=5,
+        delay=0.0,
+        backoff=2.0,
+        jitter=True,
+        max_delay=60.0,
+        retry_on=TRANSIENT_ERRORS,
+        give_up_on=NON_RETRYABLE,
+        host="yahoo",
+        budget: Optional[RetryBudget] = None,
+):
+    """Coroutine counterpart of ``retry`` that waits with ``asyncio.sleep`` instead of blocking the thread."""
+
+    def decorator(func):
+        policy = _RetryPolicy(max_retries, delay, backoff, jitter, max_delay, retry_on, give_up_on, host, budget)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exc = None
+            for attempt in range(max_retries):
+                policy.before_attempt()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    if not policy.is_retryable(e):
+                        raise
+                    last_exc = e
+                    c_delay = policy.next_delay(attempt)
+                    if c_delay is None:
+                        break
+                    _record_retry(func, args, c_delay)
+                    await asyncio.sleep(c_delay)
+                else:
+                    policy.on_success()
+                    return result
+            metrics.increment("retries_exhausted", function=func.__name__, ticker=metrics.ticker_of(args))
+            raise RuntimeError(f"❌ {func.__name__} failed after {attempt + 1} attempts.") from last_exc
 
         return wrapper
 
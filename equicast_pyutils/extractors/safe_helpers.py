@@ -11,6 +11,16 @@ class SafeHelpers:
         except Exception:
             return default
 
+    @staticmethod
+    def safe_get_lazy(info, key, fallback):
+        """Like safe_get, but only calls ``fallback()`` when the key is missing."""
+        try:
+            if key in info:
+                return info[key]
+        except Exception:
+            pass
+        return fallback()
+
     @staticmethod
     def safe_float(val, default: float = 0.0):
         try:
@@ -1,13 +1,25 @@
+import asyncio
 import math
-import random
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Callable, Optional
 
+import pandas as pd
 import yfinance as yf
 
-from equicast_pyutils.extractors.retry import retry
+from equicast_pyutils.extractors.async_helpers import AsyncHelpers
+from equicast_pyutils.extractors.data_sources import DataSource, get_default_source
+from equicast_pyutils.extractors.exceptions import DelistedSymbolError, NoDataError
+from equicast_pyutils.extractors.get_helpers import GetHelpers
+from equicast_pyutils.extractors.history_range import get_default_ranges
+from equicast_pyutils.extractors.memoize import memoize, amemoize
+from equicast_pyutils.extractors.metrics import timed
+from equicast_pyutils.extractors.rate_limiter import rate_limited
+from equicast_pyutils.extractors.response_cache import cached, acached
+from equicast_pyutils.extractors.retry import retry, async_retry
+from equicast_pyutils.extractors.symbol_registry import anot_blocked, get_default_registry, not_blocked
 from equicast_pyutils.models.stock import StockPriceModel, CompanyProfileModel, CompanyAddressModel, DividendModel, \
     CompanyOfficerModel, FundamentalsModel, OHLCModel
 
@@ -16,8 +28,12 @@ from equicast_pyutils.models.stock import StockPriceModel, CompanyProfileModel,
 class StockDataExtractor:
     """Stock Data Extractor"""
     ticker: str
+    source: Optional[DataSource] = field(default=None, repr=False)
     _yf_obj: yf.Ticker = field(default=None, init=False, repr=False)
     _is_delisted: bool = field(default=False, init=False)
+    _unblocked: bool = field(default=False, init=False, repr=False)
+    max_workers: int = field(default=5, repr=False)
+    _memo: dict = field(default_factory=dict, init=False, repr=False)
 
     @property
     def is_delisted(self):
@@ -25,38 +41,61 @@ class StockDataExtractor:
 
     @property
     def yf_obj(self):
-        """Lazy initialisation of yfinance object."""
+        """Lazy initialisation of the ticker object on the configured (or default) data source."""
         if self._yf_obj is None:
             try:
-                self._yf_obj = yf.Ticker(self.ticker)
+                self._yf_obj = (self.source or get_default_source()).ticker(self.ticker)
             except Exception as e:
                 raise ValueError(f"Failed to create yfinance object for {self.ticker}: {e}")
         return self._yf_obj
 
-    def _check_delisted(self, info=None, history=None):
+    def _ensure_not_blocked(self):
+        """Raise DelistedSymbolError for a symbol in the delisted registry (checked once per extractor)."""
+        registry = get_default_registry()
+        if registry is None or self._unblocked:
+            return
         try:
-            if info is None:
-                info = self._yf_obj.info if self._yf_obj else {}
-            if history is None and self._yf_obj:
-                history = self._yf_obj.history(period="1y")
+            registry.ensure_not_blocked(self.ticker, self.yf_obj)
+        except DelistedSymbolError:
+            self._is_delisted = True
+            raise
+        self._unblocked = True
+
+    async def _aensure_not_blocked(self):
+        registry = get_default_registry()
+        if registry is None or self._unblocked:
+            return
+        try:
+            await registry.aensure_not_blocked(self.ticker, self.yf_obj)
+        except DelistedSymbolError:
+            self._is_delisted = True
+            raise
+        self._unblocked = True
 
-            is_delisted = False
+    def _check_delisted(self, info=None, history=None):
+        """
+        Decide from responses that were already fetched, without any upstream call of its own: the info response
+        after ``_fetch_info``, or the empty history after ``_fetch_full_history``.
+        """
+        is_delisted = False
 
-            # Case 1: Empty info
-            if not info or len(info) < 5:
-                is_delisted = True
+        # Case 1: Empty info
+        if info is not None and (not info or len(info) < 5):
+            is_delisted = True
 
-            # Case 2: No price history at all
-            if history is not None and history.empty:
-                is_delisted = True
+        # Case 2: No price history at all
+        if history is not None and history.empty:
+            is_delisted = True
 
-            # Case 3: Explicit signal
-            if info.get("quoteType", "").lower() == "none":
-                is_delisted = True
+        # Case 3: Explicit signal
+        if info and str(info.get("quoteType", "")).lower() == "none":
+            is_delisted = True
 
-            self._is_delisted = is_delisted
-        except Exception:
-            self._is_delisted = True
+        self._is_delisted = self._is_delisted or is_delisted
+
+        registry = get_default_registry()
+        if is_delisted and registry is not None:
+            registry.mark(self.ticker, reason="No info or price history.")
 
     def _safe_get(self, info, key, default=None):
         try:
@@ -64,6 +103,15 @@ class StockDataExtractor:
         except Exception:
             return default
 
+    def _safe_get_lazy(self, info, key, fallback):
+        """Like _safe_get, but only calls ``fallback()`` when the key is missing."""
+        try:
+            if key in info:
+                return info[key]
+        except Exception:
+            pass
+        return fallback()
+
     def _safe_float(self, val, default: float = 0.0):
         try:
             val = float(val)
@@ -82,100 +130,178 @@ class StockDataExtractor:
         except Exception:
             return default
 
-    @retry(delay=2)
     def _get_history(self, period="1y", interval="1d"):
-        time.sleep(random.uniform(0.1, 0.5))
-        data = self.yf_obj.history(period=period, interval=interval)
+        return GetHelpers.slice_history(self._get_full_history(interval=interval), period)
 
-        fallback_periods = ["20y", "15y", "10y", "5y", "1y"]
-        for fallback in fallback_periods:
-            if data.empty:
-                data = self.yf_obj.history(period=fallback, interval=interval)
-                print(f"⏳ No data found. Fallback to {fallback}.")
-            else:
-                break
+    @memoize("history")
+    @cached("history")
+    @not_blocked
+    @retry(delay=2)
+    def _get_full_history(self, interval="1d"):
+        # A cached "no data" answer is raised here, before the rate limiter is involved.
+        get_default_ranges().ensure_has_data(self.ticker, interval)
+        return self._fetch_full_history(interval=interval)
+
+    @amemoize("history")
+    @acached("history")
+    @anot_blocked
+    @async_retry(delay=2)
+    async def _aget_full_history(self, interval="1d"):
+        get_default_ranges().ensure_has_data(self.ticker, interval)
+        return await AsyncHelpers.run(self._fetch_full_history, interval=interval)
+
+    @rate_limited
+    @timed("history")
+    def _fetch_full_history(self, interval="1d"):
+        try:
+            return get_default_ranges().fetch(self.yf_obj, period="max", interval=interval)
+        except NoDataError:
+            self._check_delisted(history=pd.DataFrame())
+            raise
+
+    @memoize("history_since")
+    @cached("history")
+    @not_blocked
+    @retry(delay=2)
+    def _get_history_since(self, start, interval="1d"):
+        return self._fetch_history_since(start, interval=interval)
 
+    @rate_limited
+    @timed("history")
+    def _fetch_history_since(self, start, interval="1d"):
+        data = self.yf_obj.history(start=start, interval=interval)
         if data.empty:
-            self._check_delisted(history=data)
-            raise ValueError("No historical data found for the specified ticker.")
+            raise NoDataError("No historical data found for the specified ticker.")
 
         return data
 
+    @memoize("dividends")
+    @cached("dividends")
+    @not_blocked
     @retry(delay=2)
     def _get_dividends(self):
-        time.sleep(random.uniform(0.1, 0.5))
+        return self._fetch_dividends()
+
+    @amemoize("dividends")
+    @acached("dividends")
+    @anot_blocked
+    @async_retry(delay=2)
+    async def _aget_dividends(self):
+        return await AsyncHelpers.run(self._fetch_dividends)
+
+    @rate_limited
+    @timed("dividends")
+    def _fetch_dividends(self):
         return self.yf_obj.dividends
 
+    @memoize("info")
+    @cached("info")
+    @not_blocked
     @retry(delay=2)
     def _get_info(self):
-        time.sleep(random.uniform(0.1, 0.5))
+        return self._fetch_info()
+
+    @amemoize("info")
+    @acached("info")
+    @anot_blocked
+    @async_retry(delay=2)
+    async def _aget_info(self):
+        return await AsyncHelpers.run(self._fetch_info)
+
+    @rate_limited
+    @timed("info")
+    def _fetch_info(self):
         info = self.yf_obj.info
         if not info or len(info) < 5:
             info = self.yf_obj.get_info()
 
         if not info or len(info) < 5:
-            raise ValueError("No info found for the specified ticker.")
+            raise NoDataError("No info found for the specified ticker.")
 
+        get_default_ranges().note_info(self.ticker, info)
         self._check_delisted(info=info)
         return info
 
+    @memoize("financials")
+    @cached("financials")
+    @not_blocked
     @retry(delay=2)
     def _get_financials(self):
-        time.sleep(random.uniform(0.1, 0.5))
+        return self._fetch_financials()
+
+    @amemoize("financials")
+    @acached("financials")
+    @anot_blocked
+    @async_retry(delay=2)
+    async def _aget_financials(self):
+        return await AsyncHelpers.run(self._fetch_financials)
+
+    @rate_limited
+    @timed("financials")
+    def _fetch_financials(self):
         financials = self.yf_obj.financials
         if financials.empty:
             financials = self.yf_obj.get_financials()
 
         return financials
 
+    @memoize("balance_sheet")
+    @cached("balance_sheet")
+    @not_blocked
     @retry(delay=2)
     def _get_balance_sheet(self):
-        time.sleep(random.uniform(0.1, 0.5))
+        return self._fetch_balance_sheet()
+
+    @amemoize("balance_sheet")
+    @acached("balance_sheet")
+    @anot_blocked
+    @async_retry(delay=2)
+    async def _aget_balance_sheet(self):
+        return await AsyncHelpers.run(self._fetch_balance_sheet)
+
+    @rate_limited
+    @timed("balance_sheet")
+    def _fetch_balance_sheet(self):
         balance_sheet = self.yf_obj.balance_sheet
         if balance_sheet.empty:
             balance_sheet = self.yf_obj.get_balance_sheet()
 
         return balance_sheet
 
+    @memoize("cash_flow")
+    @cached("cash_flow")
+    @not_blocked
     @retry(delay=2)
     def _get_cash_flow(self):
-        time.sleep(random.uniform(0.1, 0.5))
+        return self._fetch_cash_flow()
+
+    @amemoize("cash_flow")
+    @acached("cash_flow")
+    @anot_blocked
+    @async_retry(delay=2)
+    async def _aget_cash_flow(self):
+        return await AsyncHelpers.run(self._fetch_cash_flow)
+
+    @rate_limited
+    @timed("cash_flow")
+    def _fetch_cash_flow(self):
         cash_flow = self.yf_obj.cash_flow
         if cash_flow.empty:
             cash_flow = self.yf_obj.get_cash_flow()
 
         return cash_flow
 
-    def _get_price_at_period(self, period: str = "1d", parameter: str = "close"):
-        param_map = {
-            "close": ["Adj Close", "Close"],
-            "open": ["Open"],
-            "low": ["Low"],
-            "high": ["High"],
-        }
-
-        parameter = parameter.lower()
-        if parameter not in param_map:
-            raise ValueError(f"Unsupported parameter: {parameter}")
-
-        u_period = "5d" if period == "1d" else period
-        history = self._get_history(period=u_period)
-        if history.empty:
-            return None
-
-        first_row = history.iloc[-1] if period == "1d" else history.iloc[0]
-        for col in param_map[parameter]:
-            if col in history.columns:
-                return float(first_row[col])
+    def extract_stock_price_data(self, since: datetime = None) -> StockPriceModel:
+        """Extract the full price history, or only the bars from ``since`` onwards for incremental runs."""
+        history = self._get_history(period="max") if since is None else self._get_history_since(since)
+        info = self._get_info()
+        currency = self._safe_get(info, "currency", "")
 
-        return None
+        return self.price_model_from_history(history, currency=currency)
 
-    def extract_stock_price_data(self) -> StockPriceModel:
-        history = self._get_history(period="max")
+    def price_model_from_history(self, history, currency: str = "") -> StockPriceModel:
         price_col = "Adj Close" if "Adj Close" in history.columns else "Close"
-        prices_dict = {d.strftime("%Y-%m-%d"): float(p) for d, p in history[price_col].items()}
-        info = self._get_info()
-        currency = self._safe_get(info, "currency", "")
+        prices_dict = {d.strftime("%Y-%m-%d"): float(p) for d, p in history[price_col].dropna().items()}
 
         return StockPriceModel(
             ticker=self.ticker,
@@ -184,9 +310,10 @@ class StockDataExtractor:
         )
 
     def extract_dividends(self):
-        dividends = self._get_dividends()
+        return self.dividend_model_from(self._get_dividends(), self._get_info())
+
+    def dividend_model_from(self, dividends, info: dict) -> DividendModel:
         prices_dict = {d.strftime("%Y-%m-%d"): float(p) for d, p in dividends.items()}
-        info = self._get_info()
         currency = self._safe_get(info, "currency", "")
 
         return DividendModel(
@@ -536,7 +663,9 @@ class StockDataExtractor:
         return None
 
     def extract_company_profile(self):
-        info = self._get_info()
+        return self.profile_model_from_info(self._get_info())
+
+    def profile_model_from_info(self, info: dict) -> CompanyProfileModel:
         model = CompanyProfileModel(ticker=self.ticker)
         model.name = self._safe_get(info, "longName", "")
         model.quote_type = self._safe_get(info, "quoteType", "").upper()
@@ -575,37 +704,88 @@ class StockDataExtractor:
 
         return model
 
+    def _prefetch(self, fetches, optional=()):
+        """
+        Run independent upstream fetches concurrently on a pool of at most ``max_workers`` threads and wait for all
+        of them. Errors of ``fetches`` are raised; errors of ``optional`` fetches are left to the later caller.
+        """
+        calls = list(fetches) + list(optional)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(calls)))) as executor:
+            futures = [executor.submit(call) for call in calls]
+
+        for future in futures[:len(fetches)]:
+            future.result()
+
     def extract_fundamentals(self):
-        info = self._get_info()
-        financials = self._get_financials()
-        balance_sheet = self._get_balance_sheet()
-        cash_flow = self._get_cash_flow()
+        # The four statements plus the history behind the day/52-week fallbacks, fetched at the same time.
+        self._prefetch(
+            [self._get_info, self._get_financials, self._get_balance_sheet, self._get_cash_flow],
+            optional=[lambda: self._get_full_history(interval="1d")],
+        )
+
+        return self.fundamentals_model_from(
+            self._get_info(),
+            self._get_financials(),
+            self._get_balance_sheet(),
+            self._get_cash_flow(),
+            history=lambda: self._get_full_history(interval="1d"),
+        )
+
+    def fundamentals_model_from(
+            self,
+            info: dict,
+            financials: pd.DataFrame,
+            balance_sheet: pd.DataFrame,
+            cash_flow: pd.DataFrame,
+            history: Callable[[], pd.DataFrame],
+    ) -> FundamentalsModel:
+        """
+        Build the fundamentals from already fetched responses. ``history`` returns the full daily history; it is a
+        callable so that the sync path only fetches it when a price fallback needs it.
+        """
+
+        def price_at(period, parameter):
+            window = GetHelpers.slice_history(history(), "5d" if period == "1d" else period)
+            return GetHelpers.price_from_history(window, period=period, parameter=parameter)
+
         quote_type = self._safe_get(info, "quoteType", "")
         model = FundamentalsModel(ticker=self.ticker)
         model.currency = self._safe_get(info, "currency", "")
         model.day = OHLCModel(
             low=self._safe_float(
-                self._safe_get(info, "dayLow", self._get_price_at_period(period="1d", parameter="low"))
+                self._safe_get_lazy(
+                    info, "dayLow", lambda: price_at(period="1d", parameter="low")
+                )
             ),
             high=self._safe_float(
-                self._safe_get(info, "dayHigh", self._get_price_at_period(period="1d", parameter="high"))
+                self._safe_get_lazy(
+                    info, "dayHigh", lambda: price_at(period="1d", parameter="high")
+                )
             ),
             open=self._safe_float(
-                self._safe_get(info, "open", self._get_price_at_period(period="1d", parameter="open"))
+                self._safe_get_lazy(
+                    info, "open", lambda: price_at(period="1d", parameter="open")
+                )
             ),
             close=self._safe_float(
-                self._safe_get(info, "currentPrice", self._get_price_at_period(period="1d", parameter="close"))
+                self._safe_get_lazy(
+                    info, "currentPrice", lambda: price_at(period="1d", parameter="close")
+                )
             )
         )
         model.one_year = OHLCModel(
             low=self._safe_float(
-                self._safe_get(info, "fiftyTwoWeekLow", self._get_price_at_period(period="1y", parameter="low"))
+                self._safe_get_lazy(
+                    info, "fiftyTwoWeekLow", lambda: price_at(period="1y", parameter="low")
+                )
             ),
             high=self._safe_float(
-                self._safe_get(info, "fiftyTwoWeekHigh", self._get_price_at_period(period="1y", parameter="high"))
+                self._safe_get_lazy(
+                    info, "fiftyTwoWeekHigh", lambda: price_at(period="1y", parameter="high")
+                )
             ),
-            open=self._get_price_at_period(period="1y", parameter="open"),
-            close=self._get_price_at_period(period="1y", parameter="close")
+            open=price_at(period="1y", parameter="open"),
+            close=price_at(period="1y", parameter="close")
         )
         model.trailing_pe = (
             self._safe_float(self._safe_get(info, "trailingPE", ""))
@@ -650,3 +830,25 @@ class StockDataExtractor:
         model.free_cash_flow_per_share = self._get_free_cash_flow_per_share(info=info, cash_flow=cash_flow)
 
         return model
+
+    async def aextract_stock_price_data(self) -> StockPriceModel:
+        """Fetch off the event loop (bounded by AsyncHelpers), then build the model from the gathered responses."""
+        history, info = await asyncio.gather(self._aget_full_history(interval="1d"), self._aget_info())
+        return self.price_model_from_history(history, currency=self._safe_get(info, "currency", ""))
+
+    async def aextract_dividends(self) -> DividendModel:
+        dividends, info = await asyncio.gather(self._aget_dividends(), self._aget_info())
+        return self.dividend_model_from(dividends, info)
+
+    async def aextract_company_profile(self) -> CompanyProfileModel:
+        return self.profile_model_from_info(await self._aget_info())
+
+    async def aextract_fundamentals(self) -> FundamentalsModel:
+        info, financials, balance_sheet, cash_flow, history = await asyncio.gather(
+            self._aget_info(),
+            self._aget_financials(),
+            self._aget_balance_sheet(),
+            self._aget_cash_flow(),
+            self._aget_full_history(interval="1d"),
+        )
+        return self.fundamentals_model_from(info, financials, balance_sheet, cash_flow, history=lambda: history)
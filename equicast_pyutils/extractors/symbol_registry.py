@@ -0,0 +1,207 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import wraps
+from typing import Dict, Iterable, List, Optional
+
+from equicast_pyutils.extractors.async_helpers import AsyncHelpers
+from equicast_pyutils.extractors.exceptions import DelistedSymbolError
+from equicast_pyutils.extractors.metrics import increment
+from equicast_pyutils.extractors.rate_limiter import rate_limited
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 3600
+
+
+class SymbolRegistry:
+    """
+    Persistent record of symbols found delisted or unknown, kept in a SQLite file (``":memory:"`` for one process).
+
+    The extractors consult it before fetching: a blocked symbol fails with DelistedSymbolError at no upstream cost
+    until its next re-check. Re-checks are one cheap ``history(period="5d")`` probe, scheduled ``recheck_after``
+    seconds after it is first recorded and backing off by ``backoff`` after every failed check, up to ``max_recheck``.
+    A symbol that answers the probe is removed; entries not checked for ``expire_after`` seconds are purged.
+    """
+
+    def __init__(
+            self,
+            path: str = ":memory:",
+            recheck_after: float = DAY,
+            backoff: float = 2.0,
+            max_recheck: float = 30 * DAY,
+            expire_after: float = 180 * DAY,
+    ):
+        self.path = path
+        self.recheck_after = recheck_after
+        self.backoff = backoff
+        self.max_recheck = max_recheck
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS symbols ("
+            "symbol TEXT PRIMARY KEY, status TEXT NOT NULL, reason TEXT NOT NULL, first_seen REAL NOT NULL, "
+            "last_checked REAL NOT NULL, checks INTEGER NOT NULL, next_check REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _interval(self, checks: int) -> float:
+        return min(self.recheck_after * self.backoff ** max(checks - 1, 0), self.max_recheck)
+
+    def mark(self, symbol: str, status: str = "delisted", reason: str = ""):
+        """Block a symbol, or record one more failed check of a blocked symbol (pushing its next re-check out)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT first_seen, checks FROM symbols WHERE symbol = ?", (symbol,)).fetchone()
+            first_seen, checks = (row[0], row[1] + 1) if row else (now, 1)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO symbols (symbol, status, reason, first_seen, last_checked, checks, next_check) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (symbol, status, reason, first_seen, now, checks, now + self._interval(checks)),
+            )
+            self._conn.commit()
+        logger.info("🪦 %s marked %s (check %d). %s", symbol, status, checks, reason)
+
+    def clear(self, symbol: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM symbols WHERE symbol = ?", (symbol,))
+            self._conn.commit()
+
+    def entry(self, symbol: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, reason, first_seen, last_checked, checks, next_check FROM symbols WHERE symbol = ?",
+                (symbol,),
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("status", "reason", "first_seen", "last_checked", "checks", "next_check")
+        return {"symbol": symbol, **dict(zip(keys, row))}
+
+    def is_blocked(self, symbol: str) -> bool:
+        """Whether the symbol is known dead and not yet due for a re-check."""
+        entry = self.entry(symbol)
+        return entry is not None and time.time() < entry["next_check"]
+
+    def due(self, symbols: Optional[Iterable[str]] = None) -> List[str]:
+        """Recorded symbols whose re-check is due, optionally restricted to ``symbols``."""
+        with self._lock:
+            rows = self._conn.execute("SELECT symbol FROM symbols WHERE next_check <= ?", (time.time(),)).fetchall()
+        due = [row[0] for row in rows]
+        if symbols is not None:
+            wanted = set(symbols)
+            due = [symbol for symbol in due if symbol in wanted]
+        return due
+
+    def purge_expired(self) -> int:
+        """Delete entries not checked for ``expire_after`` seconds and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM symbols WHERE last_checked < ?", (time.time() - self.expire_after,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    @staticmethod
+    @rate_limited
+    def probe(yf_obj) -> bool:
+        """One cheap upstream call: whether the symbol still has any recent bars."""
+        history = yf_obj.history(period="5d")
+        return history is not None and not history.empty
+
+    def ensure_not_blocked(self, symbol: str, yf_obj):
+        """
+        Gate for the extractors: raise DelistedSymbolError for a recorded symbol that is not due for a re-check, and
+        probe one that is due (removing it when it answers).
+        """
+        entry = self._blocking_entry(symbol)
+        if entry is not None:
+            self._settle(entry, self.probe(yf_obj))
+
+    async def aensure_not_blocked(self, symbol: str, yf_obj):
+        """Coroutine counterpart of ``ensure_not_blocked``; a due probe runs in the worker pool, off the event loop."""
+        entry = self._blocking_entry(symbol)
+        if entry is not None:
+            self._settle(entry, await AsyncHelpers.run(self.probe, yf_obj))
+
+    def _blocking_entry(self, symbol: str) -> Optional[Dict]:
+        """The entry of a symbol that is due for a re-check; raises for one that is not, None for an unknown one."""
+        entry = self.entry(symbol)
+        if entry is not None and time.time() < entry["next_check"]:
+            increment("registry_hits", ticker=symbol)
+            raise DelistedSymbolError(f"{symbol} is {entry['status']}: {entry['reason'] or 'no data'}.")
+        return entry
+
+    def _settle(self, entry: Dict, alive: bool):
+        symbol = entry["symbol"]
+        if alive:
+            logger.info("✅ %s answered its re-check and is no longer %s.", symbol, entry["status"])
+            self.clear(symbol)
+            return
+
+        self.mark(symbol, entry["status"], entry["reason"])
+        raise DelistedSymbolError(f"{symbol} is {entry['status']}: {entry['reason'] or 'no data'}.")
+
+    def recheck(self, ticker_for, symbols: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """
+        Probe every due symbol (``ticker_for(symbol)`` gives its yf.Ticker-like object), e.g. from a nightly job.
+        Returns symbol -> whether it is alive again.
+        """
+        results = {}
+        for symbol in self.due(symbols):
+            try:
+                self.ensure_not_blocked(symbol, ticker_for(symbol))
+                results[symbol] = True
+            except DelistedSymbolError:
+                results[symbol] = False
+        return results
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def not_blocked(func):
+    """
+    Call ``self._ensure_not_blocked()`` before an extractor fetch method, so that a registry hit fails before the
+    retry loop and the rate limiter are reached.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._ensure_not_blocked()
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def anot_blocked(func):
+    """Coroutine counterpart of ``not_blocked``, awaiting ``self._aensure_not_blocked()``."""
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        await self._aensure_not_blocked()
+        return await func(self, *args, **kwargs)
+
+    return wrapper
+
+
+_default_registry: Optional[SymbolRegistry] = None
+
+
+def set_default_registry(registry: Optional[SymbolRegistry]):
+    """Install the process-wide delisted-symbol registry (None disables it)."""
+    global _default_registry
+    _default_registry = registry
+
+
+def get_default_registry() -> Optional[SymbolRegistry]:
+    return _default_registry
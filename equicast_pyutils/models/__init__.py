@@ -1,10 +1,18 @@
 __all__ = [
     "fx",
     "ExportableModel",
+    "ForecastBandModel",
+    "ForecastBandSeries",
     "OHLCModel",
-    "MetadataModel"
+    "OHLCSeries",
+    "MetadataModel",
+    "ParquetDatasetWriter"
 ]
 
 from .base import ExportableModel
+from .dataset_writer import ParquetDatasetWriter
+from .forecast_band_model import ForecastBandModel
+from .forecast_band_series import ForecastBandSeries
 from .metadata_model import MetadataModel
 from .ohlc_model import OHLCModel
+from .ohlc_series import OHLCSeries
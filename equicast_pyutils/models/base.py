@@ -1,10 +1,17 @@
 import json
 import os
 from dataclasses import asdict, dataclass
+from pathlib import Path
 
 import pandas as pd
 
 
+def _json_default(obj):
+    if hasattr(obj, "_to_json_compatible"):
+        return obj._to_json_compatible()
+    return str(obj)
+
+
 @dataclass
 class ExportableModel:
     """Base class to provide JSON and Parquet export capabilities."""
@@ -17,7 +24,7 @@ class ExportableModel:
     def to_json(self, filepath: str = None, indent: int = 4) -> str:
         """Export object to JSON string or file."""
         data = asdict(self)
-        json_str = json.dumps(data, indent=indent, default=str)
+        json_str = json.dumps(data, indent=indent, default=_json_default)
 
         if filepath:
             with open(filepath, "w", encoding="utf-8") as f:
@@ -30,6 +37,15 @@ class ExportableModel:
         os.makedirs(base_folder, exist_ok=True)
         df.to_parquet(os.path.join(base_folder, filename), index=False, engine="pyarrow")
 
+    @staticmethod
+    def _write_year_partitions(df: pd.DataFrame, folder: Path, filename: str):
+        """Write one Parquet file per calendar year of the ``date`` column, under ``folder/year=YYYY/``."""
+        years = df['date'].dt.year.to_numpy()
+        for year, group in df.groupby(years, sort=False):
+            year_folder = folder / f"year={year}"
+            year_folder.mkdir(parents=True, exist_ok=True)
+            group.to_parquet(year_folder / filename, index=False, engine="pyarrow")
+
     def _to_dataframe(self) -> pd.DataFrame:
         """Convert object to a DataFrame (must be implemented by subclass)."""
         raise NotImplementedError("Subclasses must implement _to_dataframe().")
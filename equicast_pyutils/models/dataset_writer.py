@@ -0,0 +1,126 @@
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from equicast_pyutils.models.base import ExportableModel
+
+# Partition column -> model attribute holding its value.
+_PARTITION_ATTRIBUTES = {"fx": "pair", "ticker": "ticker"}
+
+
+@dataclass
+class ParquetDatasetWriter:
+    """
+    Writes many models as one hive-partitioned Parquet dataset (e.g. ``fx=EURUSD/year=2024/<filename>``) in a
+    single pass. Rows from all models are converted to Arrow once, split per partition and written in parallel,
+    each file first to a temporary name and then renamed into place so readers never see partial files.
+
+    ``upsert`` merges new rows into the partitions they fall in (replacing rows with the same date) and leaves every
+    other file untouched; ``last_dates`` reports the latest stored date per symbol for incremental fetches.
+    """
+    base_folder: str
+    filename: str = "part-0.parquet"
+    partition_cols: Tuple[str, ...] = ("fx", "year")
+    row_group_size: int = 128 * 1024
+    max_workers: int = 8
+
+    def _partition_value(self, model: ExportableModel, column: str):
+        return getattr(model, _PARTITION_ATTRIBUTES.get(column, column))
+
+    def _to_dataframe(self, models: Iterable[ExportableModel]) -> pd.DataFrame:
+        frames = []
+        for model in models:
+            df = model._to_dataframe()
+            if df.empty:
+                continue
+            for column in self.partition_cols:
+                if column != "year":
+                    df[column] = self._partition_value(model, column)
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        if "year" in self.partition_cols:
+            if "date" not in df.columns:
+                raise ValueError("Partitioning by year requires a 'date' column")
+            df["year"] = pd.to_datetime(df["date"]).dt.year
+        return df
+
+    def _partition_path(self, key) -> Path:
+        key = key if isinstance(key, tuple) else (key,)
+        folder = Path(self.base_folder)
+        for column, value in zip(self.partition_cols, key):
+            folder = folder / f"{column}={value}"
+        return folder / self.filename
+
+    def _write_file(self, table: pa.Table, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+        try:
+            pq.write_table(table, tmp_path, row_group_size=self.row_group_size)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return path
+
+    def _merge_existing(self, table: pa.Table, path: Path, key: str) -> pa.Table:
+        if not path.exists():
+            return table
+        df = pd.concat([pq.ParquetFile(path).read().to_pandas(), table.to_pandas()], ignore_index=True)
+        df = df.drop_duplicates(subset=key, keep="last").sort_values(key, ignore_index=True)
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    def write_dataframe(self, df: pd.DataFrame, upsert: bool = False, key: str = "date") -> List[Path]:
+        """Write a frame that already carries the partition columns; returns the files written."""
+        if df.empty:
+            return []
+
+        partition_cols = list(self.partition_cols)
+        indices = df.groupby(partition_cols, sort=False).indices
+        table = pa.Table.from_pandas(df.drop(columns=partition_cols), preserve_index=False)
+
+        def write_partition(item):
+            partition, rows = item
+            path = self._partition_path(partition)
+            part = table.take(pa.array(rows))
+            if upsert:
+                part = self._merge_existing(part, path, key)
+            return self._write_file(part, path)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(write_partition, indices.items()))
+
+    def write(self, models: Iterable[ExportableModel]) -> List[Path]:
+        """Write every model into the dataset, replacing the partitions they cover; returns the files written."""
+        return self.write_dataframe(self._to_dataframe(models))
+
+    def upsert(self, models: Iterable[ExportableModel], key: str = "date") -> List[Path]:
+        """Merge every model into the partitions it touches, keeping the newest row per ``key``."""
+        return self.write_dataframe(self._to_dataframe(models), upsert=True, key=key)
+
+    def last_dates(self) -> Dict[str, pd.Timestamp]:
+        """Latest stored date per value of the first partition column, reading only the newest file of each."""
+        column = self.partition_cols[0]
+        result = {}
+        for folder in Path(self.base_folder).glob(f"{column}=*"):
+            if "year" in self.partition_cols:
+                files = sorted(folder.glob(f"year=*/{self.filename}"), key=lambda p: int(p.parent.name[5:]))
+            else:
+                files = [folder / self.filename] if (folder / self.filename).exists() else []
+            if not files:
+                continue
+
+            dates = pq.ParquetFile(files[-1]).read(columns=["date"]).column("date").to_pandas()
+            if not dates.empty:
+                result[folder.name[len(column) + 1:]] = pd.to_datetime(dates).max()
+        return result
@@ -0,0 +1,29 @@
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+
+from equicast_pyutils.models import ExportableModel
+
+
+@dataclass
+class ForecastBandModel(ExportableModel):
+    date: Optional[datetime] = None
+    p5: Optional[float] = None
+    p25: Optional[float] = None
+    p50: Optional[float] = None
+    p75: Optional[float] = None
+    p95: Optional[float] = None
+    expected: Optional[float] = None
+
+    @property
+    def empty(self) -> bool:
+        return self.date is None
+
+    def _to_dataframe(self) -> pd.DataFrame:
+        data = asdict(self)
+        if data['date']:
+            data['date'] = data['date'].isoformat()
+        df = pd.DataFrame([data])
+        return df
@@ -0,0 +1,122 @@
+from collections.abc import Sequence
+from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from equicast_pyutils.models.forecast_band_model import ForecastBandModel
+from equicast_pyutils.models.ohlc_series import _columns_equal, _float_column, _optional_float
+
+_BAND_COLUMNS = ("p5", "p25", "p50", "p75", "p95", "expected")
+
+
+class ForecastBandSeries(Sequence):
+    """
+    Columnar forecast bands: a datetime64[ns] (UTC) index plus float64 p5/p25/p50/p75/p95/expected arrays. Behaves
+    like a read-only list of ForecastBandModel, in the same way OHLCSeries does for OHLCModel, but is built from
+    an ensemble forecast frame without creating one object per day.
+    """
+
+    __slots__ = ("dates",) + _BAND_COLUMNS + ("tz",)
+
+    def __init__(
+            self,
+            dates=None,
+            p5=None,
+            p25=None,
+            p50=None,
+            p75=None,
+            p95=None,
+            expected=None,
+            tz: Optional[str] = None,
+    ):
+        self.dates = np.asarray(dates if dates is not None else [], dtype="datetime64[ns]")
+        length = len(self.dates)
+        self.p5 = _float_column(p5, length)
+        self.p25 = _float_column(p25, length)
+        self.p50 = _float_column(p50, length)
+        self.p75 = _float_column(p75, length)
+        self.p95 = _float_column(p95, length)
+        self.expected = _float_column(expected, length)
+        self.tz = tz
+
+    @classmethod
+    def from_forecast(cls, forecast: pd.DataFrame) -> "ForecastBandSeries":
+        """Build from a ``CalcHelpers.forecast_fx_ensemble`` frame (p5 ... p95/Expected), reusing its buffers."""
+        index = pd.DatetimeIndex(forecast.index)
+        tz = str(index.tz) if index.tz is not None else None
+
+        return cls(
+            dates=index.as_unit("ns").values,
+            **{col: forecast[col].to_numpy(dtype=np.float64, copy=False) for col in _BAND_COLUMNS[:-1]},
+            expected=forecast["Expected"].to_numpy(dtype=np.float64, copy=False),
+            tz=tz,
+        )
+
+    @classmethod
+    def from_models(cls, models: Iterable[ForecastBandModel]) -> "ForecastBandSeries":
+        models = list(models)
+        index = pd.DatetimeIndex([m.date for m in models]) if models else pd.DatetimeIndex([])
+        tz = str(index.tz) if index.tz is not None else None
+
+        return cls(
+            dates=index.as_unit("ns").values,
+            **{col: [np.nan if getattr(m, col) is None else getattr(m, col) for m in models] for col in _BAND_COLUMNS},
+            tz=tz,
+        )
+
+    def _export_columns(self) -> Dict[str, object]:
+        """Whole-column export view: UTC timestamps and bands rounded to 6 dp."""
+        return {
+            'date': pd.DatetimeIndex(self.dates, tz="UTC"),
+            **{col: np.round(getattr(self, col), 6) for col in _BAND_COLUMNS},
+        }
+
+    def _to_json_compatible(self) -> List[dict]:
+        return [asdict(band) for band in self]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return ForecastBandSeries(
+                dates=self.dates[item],
+                **{col: getattr(self, col)[item] for col in _BAND_COLUMNS},
+                tz=self.tz,
+            )
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("ForecastBandSeries index out of range")
+
+        date = pd.Timestamp(self.dates[item])
+        if self.tz:
+            date = date.tz_localize("UTC").tz_convert(self.tz)
+
+        return ForecastBandModel(
+            date=date.to_pydatetime(),
+            **{col: _optional_float(getattr(self, col)[item]) for col in _BAND_COLUMNS},
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, list):
+            return list(self) == other
+        if not isinstance(other, ForecastBandSeries):
+            return NotImplemented
+        return (
+                self.tz == other.tz
+                and np.array_equal(self.dates, other.dates)
+                and all(_columns_equal(getattr(self, c), getattr(other, c)) for c in _BAND_COLUMNS)
+        )
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "ForecastBandSeries(length=0)"
+        return f"ForecastBandSeries(length={len(self)}, start={self[0].date}, end={self[-1].date}, tz={self.tz})"
@@ -0,0 +1,204 @@
+from collections.abc import Sequence
+from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from equicast_pyutils.models.ohlc_model import OHLCModel
+
+_FLOAT_COLUMNS = ("open", "high", "low", "close")
+
+
+def _float_column(values, length: int) -> np.ndarray:
+    if values is None:
+        return np.full(length, np.nan)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _volume_column(values) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """int64 volumes plus a validity mask (None when every value is known); missing values are stored as 0."""
+    if values is None:
+        return None, None
+    if isinstance(values, np.ndarray) and values.dtype == np.int64:
+        return values, None
+
+    column = pd.to_numeric(pd.Series(values), errors="coerce")
+    missing = column.isna().to_numpy()
+    volume = column.fillna(0).astype(np.int64).to_numpy()
+    return volume, (~missing if missing.any() else None)
+
+
+def _optional_float(value) -> Optional[float]:
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+def _columns_equal(a: Optional[np.ndarray], b: Optional[np.ndarray], equal_nan: bool = True) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return np.array_equal(a, b, equal_nan=equal_nan)
+
+
+class OHLCSeries(Sequence):
+    """
+    Columnar OHLC time series: a datetime64[ns] (UTC) index plus float64 open/high/low/close/adj_close and int64
+    volume arrays. Unknown volumes (NaN or None, e.g. for FX pairs) are kept apart from zero volumes by
+    ``volume_valid`` (None when every volume is known) and come back as None. Behaves like a read-only list of
+    OHLCModel for existing callers, but is built from a history frame without creating one object per row.
+    """
+
+    __slots__ = ("dates", "open", "high", "low", "close", "adj_close", "volume", "volume_valid", "tz")
+
+    def __init__(
+            self,
+            dates=None,
+            open=None,
+            high=None,
+            low=None,
+            close=None,
+            adj_close=None,
+            volume=None,
+            tz: Optional[str] = None,
+    ):
+        self.dates = np.asarray(dates if dates is not None else [], dtype="datetime64[ns]")
+        length = len(self.dates)
+        self.open = _float_column(open, length)
+        self.high = _float_column(high, length)
+        self.low = _float_column(low, length)
+        self.close = _float_column(close, length)
+        self.adj_close = None if adj_close is None else _float_column(adj_close, length)
+        self.volume, self.volume_valid = _volume_column(volume)
+        self.tz = tz
+
+    @classmethod
+    def from_history(cls, history: pd.DataFrame) -> "OHLCSeries":
+        """Build from a yfinance-style frame (Open/High/Low/Close[/Adj Close][/Volume]), reusing its buffers."""
+        index = pd.DatetimeIndex(history.index)
+        tz = str(index.tz) if index.tz is not None else None
+
+        volume = history["Volume"].to_numpy() if "Volume" in history.columns else None
+
+        return cls(
+            dates=index.as_unit("ns").values,
+            open=history["Open"].to_numpy(dtype=np.float64, copy=False),
+            high=history["High"].to_numpy(dtype=np.float64, copy=False),
+            low=history["Low"].to_numpy(dtype=np.float64, copy=False),
+            close=history["Close"].to_numpy(dtype=np.float64, copy=False),
+            adj_close=(
+                history["Adj Close"].to_numpy(dtype=np.float64, copy=False) if "Adj Close" in history.columns else None
+            ),
+            volume=volume,
+            tz=tz,
+        )
+
+    @classmethod
+    def from_models(cls, models: Iterable[OHLCModel]) -> "OHLCSeries":
+        models = list(models)
+        index = pd.DatetimeIndex([m.date for m in models]) if models else pd.DatetimeIndex([])
+        tz = str(index.tz) if index.tz is not None else None
+        has_adj_close = any(m.adj_close is not None for m in models)
+        has_volume = any(m.volume is not None for m in models)
+
+        return cls(
+            dates=index.as_unit("ns").values,
+            **{col: [np.nan if getattr(m, col) is None else getattr(m, col) for m in models]
+               for col in _FLOAT_COLUMNS},
+            adj_close=[np.nan if m.adj_close is None else m.adj_close for m in models] if has_adj_close else None,
+            volume=[m.volume for m in models] if has_volume else None,
+            tz=tz,
+        )
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        index = pd.DatetimeIndex(self.dates, tz="UTC") if self.tz else pd.DatetimeIndex(self.dates)
+        return index.tz_convert(self.tz) if self.tz else index
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the series as a yfinance-style frame indexed by date."""
+        data = {"Open": self.open, "High": self.high, "Low": self.low, "Close": self.close}
+        if self.adj_close is not None:
+            data["Adj Close"] = self.adj_close
+        if self.volume is not None:
+            data["Volume"] = self._nullable_volume()
+        return pd.DataFrame(data, index=self.index, copy=False)
+
+    def _nullable_volume(self):
+        """The volume column, as a pandas Int64 array with NA for unknown values when there are any."""
+        if self.volume_valid is None:
+            return self.volume
+        return pd.arrays.IntegerArray(self.volume, ~self.volume_valid)
+
+    def _export_columns(self) -> Dict[str, object]:
+        """Whole-column export view: UTC timestamps, prices rounded to 6 dp and the (low + high) / 2 average."""
+        return {
+            'date': pd.DatetimeIndex(self.dates, tz="UTC"),
+            'open': np.round(self.open, 6),
+            'high': np.round(self.high, 6),
+            'low': np.round(self.low, 6),
+            'close': np.round(self.close, 6),
+            'average': np.round((self.low + self.high) / 2, 6),
+        }
+
+    def _to_json_compatible(self) -> List[dict]:
+        return [asdict(ohlc) for ohlc in self]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return OHLCSeries(
+                dates=self.dates[item],
+                open=self.open[item],
+                high=self.high[item],
+                low=self.low[item],
+                close=self.close[item],
+                adj_close=None if self.adj_close is None else self.adj_close[item],
+                volume=None if self.volume is None else self._nullable_volume()[item],
+                tz=self.tz,
+            )
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("OHLCSeries index out of range")
+
+        date = pd.Timestamp(self.dates[item])
+        if self.tz:
+            date = date.tz_localize("UTC").tz_convert(self.tz)
+
+        return OHLCModel(
+            date=date.to_pydatetime(),
+            open=_optional_float(self.open[item]),
+            high=_optional_float(self.high[item]),
+            low=_optional_float(self.low[item]),
+            close=_optional_float(self.close[item]),
+            adj_close=None if self.adj_close is None else _optional_float(self.adj_close[item]),
+            volume=(
+                None if self.volume is None or (self.volume_valid is not None and not self.volume_valid[item])
+                else int(self.volume[item])
+            ),
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, list):
+            return list(self) == other
+        if not isinstance(other, OHLCSeries):
+            return NotImplemented
+        return (
+                self.tz == other.tz
+                and np.array_equal(self.dates, other.dates)
+                and all(_columns_equal(getattr(self, c), getattr(other, c)) for c in _FLOAT_COLUMNS + ("adj_close",))
+                and _columns_equal(self.volume, other.volume, equal_nan=False)
+                and _columns_equal(self.volume_valid, other.volume_valid, equal_nan=False)
+        )
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "OHLCSeries(length=0)"
+        return f"OHLCSeries(length={len(self)}, start={self[0].date}, end={self[-1].date}, tz={self.tz})"
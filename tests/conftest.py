@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from equicast_pyutils.extractors.history_range import HistoryRanges, get_default_ranges, set_default_ranges
+from equicast_pyutils.extractors.rate_limiter import RateLimiter, get_default_rate_limiter, set_default_rate_limiter
+
+
+def _linear_history(bars=600, tz="UTC"):
+    """Business-day OHLCV frame from 2022-01-03 whose close climbs linearly from 100 to 160."""
+    idx = pd.date_range("2022-01-03", periods=bars, freq="B", tz=tz)
+    close = np.linspace(100.0, 160.0, bars)
+    return pd.DataFrame(
+        {"Open": close - 1, "High": close + 2, "Low": close - 2, "Close": close, "Volume": 1000}, index=idx
+    )
+
+
+def _random_walk_history(bars=500, seed=0):
+    """Business-day OHLCV frame from 2020-01-01 (Europe/London) following a seeded log-normal random walk."""
+    rng = np.random.default_rng(seed)
+    close = 1.2 * np.exp(np.cumsum(rng.normal(0, 0.005, bars)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, bars))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, bars))
+    idx = pd.date_range("2020-01-01", periods=bars, freq="B", tz="Europe/London")
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close, "Volume": 0}, index=idx)
+
+
+class FakeTicker:
+    """Stands in for yf.Ticker: a fixed linear history, an equity info dict and one-line statements."""
+
+    def __init__(self, ticker="TEST", info=None, bars=600):
+        self.ticker = ticker
+        self.info = info if info is not None else {
+            "quoteType": "EQUITY",
+            "currency": "USD",
+            "exchange": "NMS",
+            "longName": "Test Corp",
+            "marketCap": 1_000_000,
+        }
+        self.calls = {"history": 0}
+        self._history = _linear_history(bars, tz="America/New_York")
+        self.financials = self.balance_sheet = self.cash_flow = pd.DataFrame({"2024": [1.0]}, index=["Total Revenue"])
+        self.dividends = pd.Series([0.5], index=self._history.index[-1:])
+
+    def history(self, period=None, interval="1d", start=None, end=None, **kwargs):
+        self.calls["history"] += 1
+        return self._history.copy()
+
+    def get_info(self):
+        return self.info
+
+
+class CountingLimiter(RateLimiter):
+    """RateLimiter that counts the tokens taken."""
+    acquired = 0
+
+    def acquire(self, tokens=1.0):
+        self.acquired += 1
+        return super().acquire(tokens)
+
+
+@pytest.fixture
+def make_history():
+    return _linear_history
+
+
+@pytest.fixture
+def make_random_history():
+    return _random_walk_history
+
+
+@pytest.fixture
+def fake_ticker():
+    return FakeTicker
+
+
+@pytest.fixture
+def counting_limiter():
+    return CountingLimiter
+
+
+@pytest.fixture(autouse=True)
+def unthrottled():
+    limiter = get_default_rate_limiter()
+    set_default_rate_limiter(RateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0))
+    yield
+    set_default_rate_limiter(limiter)
+
+
+@pytest.fixture(autouse=True)
+def fresh_history_ranges():
+    ranges = get_default_ranges()
+    set_default_ranges(HistoryRanges())
+    yield
+    set_default_ranges(ranges)
@@ -0,0 +1,133 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+import yfinance as yf
+
+from equicast_pyutils.extractors import BatchFxDataExtractor, BatchStockDataExtractor, DataSource, FxMatrixExtractor
+from equicast_pyutils.extractors.symbol_registry import SymbolRegistry, set_default_registry
+from equicast_pyutils.models import MetadataModel, OHLCSeries, ParquetDatasetWriter
+from equicast_pyutils.models.fx import FxPriceModel
+
+
+def test_update_fx_prices_fetches_from_last_stored_date(tmp_path, monkeypatch, make_history):
+    calls = []
+    history = make_history(400)
+
+    def download(symbols, start=None, end=None, period=None, **kwargs):
+        calls.append((tuple(symbols), start, period))
+        window = history if start is None else history[history.index.date >= start]
+        return pd.concat({symbol: window for symbol in symbols}, axis=1)
+
+    monkeypatch.setattr(yf, "download", download)
+    writer = ParquetDatasetWriter(str(tmp_path), filename="prices.parquet")
+    stale = OHLCSeries.from_history(history[:-5])
+    writer.write([FxPriceModel("GBP", "USD", prices=stale, metadata=MetadataModel(source="yfinance"))])
+    old_file = tmp_path / "fx=GBPUSD" / "year=2022" / "prices.parquet"
+    old_mtime = old_file.stat().st_mtime_ns
+
+    result = BatchFxDataExtractor(pairs=[("GBP", "USD"), ("EUR", "USD")]).update_fx_prices(writer)
+
+    assert sorted(calls) == [(("EURUSD=X",), None, "max"), (("GBPUSD=X",), stale.index[-1].date(), None)]
+    assert len(result.models["GBPUSD"].prices) == 6
+    assert old_file.stat().st_mtime_ns == old_mtime
+    stored = pd.read_parquet(tmp_path / "fx=GBPUSD")
+    assert len(stored) == 400 and stored["date"].is_unique
+    assert writer.last_dates() == {"EURUSD": history.index[-1], "GBPUSD": history.index[-1]}
+
+
+def test_empty_incremental_bulk_window_does_not_list_pairs(tmp_path, make_history):
+    history = make_history(400)
+
+    class WeekendSource(DataSource):
+        downloads = []
+
+        def download(self, symbols, start=None, **kwargs):
+            self.downloads.append(tuple(symbols))
+            # Only EURUSD=X has a bar after the last stored date; GBPUSD=X has none yet.
+            return pd.concat({"EURUSD=X": history.iloc[-1:]}, axis=1)
+
+        def download_errors(self):
+            return {"GBPUSD=X": "possibly delisted; no price data found (start=2023-07-13)"}
+
+    writer = ParquetDatasetWriter(str(tmp_path / "prices"), filename="prices.parquet")
+    stored = OHLCSeries.from_history(history[:-1])
+    writer.write([FxPriceModel(a, "USD", prices=stored, metadata=MetadataModel(source="yfinance"))
+                  for a in ("GBP", "EUR")])
+    registry = SymbolRegistry(str(tmp_path / "registry.sqlite"))
+    source = WeekendSource()
+
+    try:
+        set_default_registry(registry)
+        extractor = BatchFxDataExtractor(pairs=[("GBP", "USD"), ("EUR", "USD")], source=source)
+        first = extractor.update_fx_prices(writer)
+        second = extractor.update_fx_prices(writer)
+    finally:
+        set_default_registry(None)
+
+    assert registry.entry("GBPUSD=X") is None
+    assert "GBPUSD=X" in source.downloads[1] and "registry" not in second.errors["GBPUSD"]
+    assert sorted(first.models) == ["EURUSD"]
+
+
+def test_fx_matrix_derives_crosses_from_usd_legs(monkeypatch, make_history):
+    calls = []
+    history = make_history(400)
+    rates = {"EUR=X": 0.9, "GBP=X": 0.8, "JPY=X": 150.0}
+
+    def download(symbols, **kwargs):
+        calls.append(tuple(symbols))
+        legs = {}
+        for symbol in symbols:
+            leg = history * rates[symbol]
+            legs[symbol] = leg.iloc[10:] if symbol == "JPY=X" else leg
+        return pd.concat(legs, axis=1)
+
+    monkeypatch.setattr(yf, "download", download)
+    result = FxMatrixExtractor(currencies=["USD", "EUR", "GBP", "JPY"]).extract_fx_prices()
+
+    assert calls == [("EUR=X", "GBP=X", "JPY=X")]
+    assert len(result.models) == 12 and not result.errors
+    eurgbp = result.models["EURGBP"].prices
+    assert np.allclose(eurgbp.close, 0.8 / 0.9)
+    assert (eurgbp.high >= np.maximum(eurgbp.open, eurgbp.close)).all()
+    assert (eurgbp.low <= np.minimum(eurgbp.open, eurgbp.close)).all()
+    assert np.allclose(result.models["GBPUSD"].prices.close, 1 / (history["Close"] * 0.8))
+    assert np.allclose(result.models["USDJPY"].prices.close, history["Close"].iloc[10:] * 150.0)
+    assert len(result.models["EURJPY"].prices) == 390
+
+
+def test_batch_stock_prices_split_one_download_per_ticker(make_history):
+    history = make_history(400)
+
+    class BulkSource(DataSource):
+        downloads, infos = [], []
+        currencies = {"AAA": "USD", "BBB": "GBp", "CCC": None}
+        barrier = threading.Barrier(3, timeout=5)
+
+        def download(self, symbols, **kwargs):
+            self.downloads.append(tuple(symbols))
+            return pd.concat({s: history * (i + 1) for i, s in enumerate(symbols) if s != "DDD"}, axis=1)
+
+        def download_errors(self):
+            return {"DDD": "possibly delisted; no price data found"}
+
+        def info(self, symbol):
+            # The three lookups can only all pass the barrier if they run at the same time.
+            self.barrier.wait()
+            self.infos.append(symbol)
+            return {"quoteType": "EQUITY", "currency": self.currencies[symbol], "exchange": "X", "longName": symbol,
+                    "marketCap": 1}
+
+    source = BulkSource()
+    result = BatchStockDataExtractor(
+        tickers=["AAA", "BBB", "CCC", "DDD", "EEE"], currencies={"EEE": "EUR"}, source=source
+    ).extract_stock_price_data()
+
+    assert source.downloads == [("AAA", "BBB", "CCC", "DDD", "EEE")]
+    assert sorted(source.infos) == ["AAA", "BBB", "CCC"]
+    assert {t: m.currency for t, m in result.models.items()} == {"AAA": "USD", "BBB": "GBp", "EEE": "EUR"}
+    assert result.models["BBB"].ticker == "BBB" and len(result.models["BBB"].prices) == 400
+    assert list(result.models["BBB"].prices.values())[-1] == pytest.approx(history["Close"].iloc[-1] * 2)
+    assert sorted(result.errors) == ["CCC", "DDD"] and "currency" in result.errors["CCC"]
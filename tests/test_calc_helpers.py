@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from equicast_pyutils.extractors.calc_helpers import CalcHelpers
+from equicast_pyutils.extractors.price_context import PriceContext
+
+
+def test_forecast_fx_prices_is_vectorized_and_deterministic(make_random_history):
+    history = make_random_history()
+    forecast = CalcHelpers.forecast_fx_prices(history, requested_days=365)
+
+    assert len(forecast) == 365
+    assert all(dtype == np.float64 for dtype in forecast.dtypes)
+    assert isinstance(forecast.index, pd.DatetimeIndex)
+    assert forecast.index[0] == history.index[-1] + pd.Timedelta(days=1)
+    assert (forecast["High"] >= forecast[["Open", "Close"]].max(axis=1)).all()
+    assert (forecast["Low"] <= forecast[["Open", "Close"]].min(axis=1)).all()
+    assert forecast["Open"].iloc[0] == round(history["Close"].iloc[-1], 6)
+    pd.testing.assert_frame_equal(forecast, CalcHelpers.forecast_fx_prices(history, requested_days=365))
+
+
+def test_forecast_fx_ensemble_bands_are_ordered_and_deterministic(make_random_history):
+    history = make_random_history()
+    serial = CalcHelpers.forecast_fx_ensemble(history, requested_days=400, paths=300, chunk_paths=100, block_days=150)
+    pooled = CalcHelpers.forecast_fx_ensemble(
+        history, requested_days=400, paths=300, chunk_paths=100, block_days=150, workers=2
+    )
+
+    assert list(serial.columns) == ["p5", "p25", "p50", "p75", "p95", "Expected"]
+    assert len(serial) == 400
+    assert (serial["p5"] <= serial["p25"]).all() and (serial["p75"] <= serial["p95"]).all()
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_rolling_metrics_match_scalar_helpers(make_random_history):
+    close = make_random_history(600)["Close"]
+    rolling = CalcHelpers.calculate_rolling_metrics(close, windows=(20, 252), risk_free_rate=0.02)
+
+    assert rolling.shape == (600, 6)
+    assert rolling["volatility_252"].iloc[:252].isna().all()
+    for end in (252, 400, 599):
+        window = close.iloc[end - 252:end + 1]
+        row = rolling.iloc[end]
+        assert np.isclose(row["volatility_252"], CalcHelpers.calculate_volatility(window, periods_per_year=252))
+        assert np.isclose(
+            row["sharpe_252"], CalcHelpers.calculate_sharpe_ratio(window, risk_free_rate=0.02, periods_per_year=252)
+        )
+        assert np.isclose(row["max_drawdown_252"], CalcHelpers.calculate_max_drawdown(window))
+
+
+def test_cross_sectional_metrics_match_per_pair_helpers(make_random_history):
+    full = make_random_history(1500, seed=1)["Close"]
+    short = make_random_history(700, seed=2)["Close"].iloc[200:]
+    gappy = make_random_history(1500, seed=3)["Close"].iloc[::2]
+    matrix = pd.concat({"A": full, "B": short, "C": gappy}, axis=1)
+
+    metrics = CalcHelpers.calculate_cross_sectional_metrics(matrix, cagr_periods=(1, 5), periods_per_year=252)
+
+    for name, series in (("A", full), ("B", short), ("C", gappy)):
+        window = series[series.index >= series.index[-1] - pd.DateOffset(years=1)]
+        row = metrics.loc[name]
+        assert np.isclose(row["volatility"], CalcHelpers.calculate_volatility(window, periods_per_year=252))
+        assert np.isclose(row["sharpe_ratio"], CalcHelpers.calculate_sharpe_ratio(window, periods_per_year=252))
+        assert np.isclose(row["max_drawdown"], CalcHelpers.calculate_max_drawdown(window))
+        cagr = CalcHelpers.calculate_cagr(series, periods=[1, 5])
+        assert row["cagr_1y"] == cagr["1y"]
+        assert (np.isnan(row["cagr_5y"]) and cagr["5y"] is None) or row["cagr_5y"] == cagr["5y"]
+
+
+def test_rolling_cagr_matches_point_in_time_cagr(make_random_history):
+    close = make_random_history(2000)["Close"]
+    rolling = CalcHelpers.calculate_rolling_cagr(close, periods=(1, 5), start_date=close.index[300])
+
+    assert len(rolling) == 1700
+    for end in (close.index[300], close.index[1500], close.index[-1]):
+        expected = CalcHelpers.calculate_cagr(close, periods=[1, 5], end_date=end)
+        assert rolling.loc[end, "1y"] == expected["1y"]
+        assert (np.isnan(rolling.loc[end, "5y"]) and expected["5y"] is None) or rolling.loc[end, "5y"] == expected["5y"]
+
+
+def test_price_context_matches_helpers_and_caches_returns(make_random_history):
+    close = make_random_history(600)["Close"]
+    context = PriceContext(close, risk_free_rate=0.02)
+
+    assert np.isclose(context.volatility, CalcHelpers.calculate_volatility(close))
+    assert np.isclose(context.sharpe_ratio, CalcHelpers.calculate_sharpe_ratio(close, risk_free_rate=0.02))
+    assert np.isclose(context.max_drawdown, CalcHelpers.calculate_max_drawdown(close))
+    assert context.cagr(periods=[1]) == CalcHelpers.calculate_cagr(close, periods=[1])
+    assert context.returns is context.returns
+    assert context.downside_deviation > 0
+    assert np.isclose(context.calmar_ratio, context.annualized_return / abs(context.max_drawdown))
+    assert set(context.metrics()) >= {"volatility", "sharpe_ratio", "sortino_ratio", "calmar_ratio", "max_drawdown"}
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from equicast_pyutils.extractors import BatchFxDataExtractor, FxDataExtractor, MirrorSource, RecordReplaySource, \
+    StockDataExtractor, YFinanceSource
+from equicast_pyutils.extractors.exceptions import NoDataError
+from equicast_pyutils.extractors.http_pool import SessionPool
+from equicast_pyutils.extractors.metrics import InMemoryMetrics, set_default_metrics
+from equicast_pyutils.extractors.retry import get_circuit_breaker
+
+
+def _mirror(root, history, fmt="parquet"):
+    mirror = MirrorSource(str(root), fmt=fmt)
+    for symbol in ("TEST", "EURUSD=X", "GBPUSD=X"):
+        mirror.save("history", symbol, history)
+    mirror.save("info", "TEST", {"quoteType": "EQUITY", "currency": "USD", "exchange": "NMS",
+                                 "longName": "Test Corp", "marketCap": 1_000_000})
+    mirror.save("dividends", "TEST", pd.Series([0.5], index=history.index[-1:]))
+    for statement in ("financials", "balance_sheet", "cash_flow"):
+        mirror.save(statement, "TEST", pd.DataFrame({pd.Timestamp("2024-12-31"): [1.0]}, index=["Total Revenue"]))
+    return mirror
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "csv"])
+def test_mirror_source_serves_extractors_from_disk(tmp_path, fmt, make_history):
+    mirror = _mirror(tmp_path, make_history(), fmt)
+
+    extractor = StockDataExtractor(ticker="TEST", source=mirror)
+    prices = extractor.extract_stock_price_data()
+    fundamentals = extractor.extract_fundamentals()
+    batch = BatchFxDataExtractor(pairs=[("EUR", "USD"), ("GBP", "USD")], source=mirror).extract_fx_prices()
+
+    assert len(prices.prices) == 600 and prices.currency == "USD"
+    assert fundamentals.day.close == 160.0
+    assert extractor.extract_dividends().prices == {"2024-04-19": 0.5}
+    assert sorted(batch.models) == ["EURUSD", "GBPUSD"] and not batch.errors
+    assert len(mirror.history("TEST", start="2024-01-01", end="2024-02-01")) == 23
+
+
+def test_record_replay_source_replays_without_the_inner_source(tmp_path, make_history):
+    path = str(tmp_path / "recording.sqlite")
+    inner = _mirror(tmp_path / "m", make_history())
+    recorded = StockDataExtractor(ticker="TEST", source=RecordReplaySource(path, inner=inner))
+    expected = recorded.extract_fundamentals()
+
+    replayed = StockDataExtractor(ticker="TEST", source=RecordReplaySource(path)).extract_fundamentals()
+
+    assert replayed.day == expected.day and replayed.one_year == expected.one_year
+    with pytest.raises(NoDataError):
+        RecordReplaySource(path).info("OTHER")
+
+    metrics = InMemoryMetrics()
+    set_default_metrics(metrics)
+    try:
+        with pytest.raises(NoDataError):
+            StockDataExtractor(ticker="OTHER", source=RecordReplaySource(path))._get_info()
+    finally:
+        set_default_metrics(None)
+    assert metrics.counter("retries") == 0 and not get_circuit_breaker("yahoo").failures
+
+
+def test_fx_extract_all_fetches_history_and_info_once(tmp_path, make_history):
+    frame = make_history()
+    mirror = _mirror(tmp_path, frame)
+    mirror.save("info", "EURUSD=X", {"quoteType": "CURRENCY", "exchange": "CCY", "currency": "USD",
+                                     "longName": "EUR/USD", "region": "US"})
+    calls = []
+    history, info = mirror.history, mirror.info
+    mirror.history = lambda symbol, **kw: calls.append(("history", kw.get("period"))) or history(symbol, **kw)
+    mirror.info = lambda symbol: calls.append(("info", None)) or info(symbol)
+
+    models = FxDataExtractor(from_currency="EUR", to_currency="USD", period="1y", source=mirror).extract_all()
+
+    assert sorted(calls) == [("history", "max"), ("info", None)]
+    separate = FxDataExtractor(from_currency="EUR", to_currency="USD", period="1y", source=mirror)
+    assert models["fundamentals"].day == separate.extract_fx_fundamentals().day
+    assert models["fundamentals"].year == separate.extract_fx_fundamentals().year
+    assert models["fundamentals"].ma50 == pytest.approx(frame["Close"].tail(50).mean())
+    assert len(models["prices"].prices) == len(history("EURUSD=X", period="1y"))
+    assert models["profile"].exchange == "CCY" and models["calculations"].cagr_1y is not None
+
+
+def test_session_pool_shares_one_session_and_one_ticker_per_symbol():
+    pool = SessionPool(pool_size=4)
+    source = YFinanceSource(pool)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tickers = list(executor.map(source.ticker, ["AAPL"] * 16 + ["MSFT"] * 16))
+
+    assert len({id(t) for t in tickers[:16]}) == 1 and tickers[0] is not tickers[-1]
+    assert tickers[0].session is pool.session and tickers[-1].session is pool.session
+    assert StockDataExtractor(ticker="AAPL", source=source).yf_obj is tickers[0]
+
+    pool.ticker_ttl = -1
+    assert pool.ticker("AAPL") is not tickers[0]
+    pool.close()
@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from equicast_pyutils.extractors import FxDataExtractor
+from equicast_pyutils.extractors.data_sources import DataSource
+from equicast_pyutils.extractors.exceptions import DelistedSymbolError, NoDataError
+from equicast_pyutils.extractors.history_range import HistoryRanges, set_default_ranges
+from equicast_pyutils.extractors.rate_limiter import set_default_rate_limiter
+from equicast_pyutils.extractors.symbol_registry import SymbolRegistry, set_default_registry
+
+
+class FakeFxSource(DataSource):
+    def __init__(self, tickers):
+        self.tickers = tickers
+
+    def ticker(self, symbol):
+        return self.tickers[symbol]
+
+
+def test_dead_pairs_are_recorded_and_then_cost_nothing(tmp_path, fake_ticker, counting_limiter):
+    currencies = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+    tickers = {FxDataExtractor.symbol_for("USD", ccy): fake_ticker(FxDataExtractor.symbol_for("USD", ccy))
+               for ccy in currencies}
+    for ticker in tickers.values():
+        ticker._history = ticker._history.iloc[:0]
+    source = FakeFxSource(tickers)
+    path = str(tmp_path / "registry.sqlite")
+
+    try:
+        set_default_registry(SymbolRegistry(path))
+        for ccy in currencies:
+            with pytest.raises(NoDataError):
+                FxDataExtractor(from_currency="USD", to_currency=ccy, period="1y", source=source).extract_fx_prices()
+        calls = sum(ticker.calls["history"] for ticker in tickers.values())
+
+        # A later run: fresh in-process state and a fresh limiter, the registry file is all that is left.
+        set_default_ranges(HistoryRanges())
+        set_default_registry(SymbolRegistry(path))
+        limiter = counting_limiter(rate=8.0, burst=100.0, min_rate=0.5, max_rate=8.0)
+        set_default_rate_limiter(limiter)
+        for ccy in currencies:
+            with pytest.raises(DelistedSymbolError):
+                FxDataExtractor(from_currency="USD", to_currency=ccy, period="1y", source=source).extract_fx_prices()
+
+        assert sum(ticker.calls["history"] for ticker in tickers.values()) == calls
+        assert limiter.acquired == 0 and limiter.rate == 8.0
+    finally:
+        set_default_registry(None)
+
+
+def test_empty_incremental_fetch_does_not_mark_the_pair(tmp_path, fake_ticker):
+    ticker = fake_ticker("EUR=X")
+    ticker._history = ticker._history.iloc[:0]
+    registry = SymbolRegistry(str(tmp_path / "registry.sqlite"))
+
+    try:
+        set_default_registry(registry)
+        extractor = FxDataExtractor(from_currency="USD", to_currency="EUR", source=FakeFxSource({"EUR=X": ticker}))
+        with pytest.raises(NoDataError):
+            extractor.extract_fx_prices(since=pd.Timestamp("2024-06-01", tz="UTC"))
+        assert registry.entry("EUR=X") is None
+    finally:
+        set_default_registry(None)
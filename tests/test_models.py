@@ -0,0 +1,90 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from equicast_pyutils.extractors.calc_helpers import CalcHelpers
+from equicast_pyutils.models import ForecastBandSeries, OHLCModel, OHLCSeries, ParquetDatasetWriter
+from equicast_pyutils.models.fx import FxForecastModel, FxPriceModel
+
+
+def test_ohlc_series_wraps_history_columns_and_behaves_like_a_list(make_history):
+    history = make_history()
+    series = OHLCSeries.from_history(history)
+
+    assert len(series) == len(history)
+    assert np.shares_memory(series.close, history["Close"].to_numpy())
+    assert series.dates.dtype == np.dtype("datetime64[ns]")
+    assert series[-1] == OHLCModel(
+        date=history.index[-1].to_pydatetime(), open=159.0, high=162.0, low=158.0, close=160.0, volume=1000
+    )
+    assert list(series[:2]) == [series[0], series[1]]
+    pd.testing.assert_frame_equal(series.to_frame(), history, check_freq=False)
+
+
+def test_ohlc_series_keeps_unknown_volume_apart_from_zero(make_history):
+    history = make_history(4).astype({"Volume": float})
+    history["Volume"] = [np.nan, 0.0, 5.0, np.nan]
+    series = OHLCSeries.from_history(history)
+
+    assert [bar.volume for bar in series] == [None, 0, 5, None]
+    assert [bar.volume for bar in series[1:]] == [0, 5, None]
+    assert OHLCSeries.from_models(list(series)) == series
+    assert series.to_frame()["Volume"].isna().tolist() == [True, False, False, True]
+    exported = json.loads(FxPriceModel(from_currency="GBP", to_currency="USD", prices=series).to_json())
+    assert [bar["volume"] for bar in exported["prices"]] == [None, 0, 5, None]
+
+
+def test_fx_price_model_accepts_ohlc_lists(make_history):
+    series = OHLCSeries.from_history(make_history(5))
+    model = FxPriceModel(from_currency="GBP", to_currency="USD", prices=list(series))
+
+    assert model.prices == series
+    assert json.loads(model.to_json())["prices"][0]["close"] == series[0].close
+
+
+def test_fx_price_model_exports_native_timestamps_by_year(tmp_path, make_history):
+    model = FxPriceModel(from_currency="GBP", to_currency="USD", prices=OHLCSeries.from_history(make_history()))
+
+    df = model._to_dataframe()
+    model.to_parquet("prices.parquet", str(tmp_path))
+
+    assert str(df["date"].dtype) == "datetime64[ns, UTC]"
+    assert df["average"].iloc[0] == round((model.prices[0].low + model.prices[0].high) / 2, 6)
+    assert sorted(p.name for p in (tmp_path / "fx=GBPUSD").iterdir()) == [f"year={y}" for y in range(2022, 2025)]
+    stored = pd.read_parquet(tmp_path / "fx=GBPUSD" / "year=2022" / "prices.parquet")
+    assert (stored["date"].dt.year == 2022).all()
+
+
+def test_dataset_writer_writes_many_pairs_in_one_pass(tmp_path, make_history):
+    models = [
+        FxPriceModel(from_currency=a, to_currency=b, prices=OHLCSeries.from_history(make_history()))
+        for a, b in (("GBP", "USD"), ("EUR", "USD"), ("USD", "JPY"))
+    ]
+
+    written = ParquetDatasetWriter(str(tmp_path), filename="prices.parquet", row_group_size=100).write(models)
+
+    assert len(written) == 3 * 3
+    assert not list(tmp_path.rglob("*.tmp"))
+    stored = pd.read_parquet(tmp_path / "fx=EURUSD" / "year=2022" / "prices.parquet")
+    expected = models[1]._to_dataframe()
+    expected = expected[expected["date"].dt.year == 2022].reset_index(drop=True)
+    pd.testing.assert_frame_equal(stored, expected, check_dtype=False)
+    assert pd.read_parquet(tmp_path)["fx"].nunique() == 3
+
+
+def test_forecast_bands_are_columnar_and_export_without_band_objects(make_history):
+    forecast = CalcHelpers.forecast_fx_ensemble(make_history(), requested_days=400, paths=50)
+    bands = ForecastBandSeries.from_forecast(forecast)
+    model = FxForecastModel(from_currency="GBP", to_currency="USD", bands=bands, paths=50)
+
+    assert len(bands) == len(forecast)
+    assert np.shares_memory(bands.p50, forecast["p50"].to_numpy())
+    assert bands[-1].expected == forecast["Expected"].iloc[-1]
+    assert FxForecastModel(from_currency="GBP", to_currency="USD", bands=list(bands[:3])).bands == bands[:3]
+
+    df = model._to_dataframe()
+    assert str(df["date"].dtype) == "datetime64[ns, UTC]"
+    assert list(df.columns[2:9]) == ["date", "p5", "p25", "p50", "p75", "p95", "expected"]
+    np.testing.assert_array_equal(df["p95"].to_numpy(), forecast["p95"].to_numpy())
+    assert json.loads(model.to_json())["bands"][0]["p5"] == bands[0].p5
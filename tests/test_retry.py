@@ -0,0 +1,69 @@
+import pytest
+
+from equicast_pyutils.extractors.exceptions import NoDataError, CircuitOpenError
+from equicast_pyutils.extractors.retry import retry, async_retry, RetryBudget, CircuitBreaker, set_circuit_breaker
+
+
+def _flaky(exc, failures):
+    calls = {"n": 0}
+
+    def func():
+        calls["n"] += 1
+        if calls["n"] <= failures:
+            raise exc
+        return "ok"
+
+    return func, calls
+
+
+def test_retry_succeeds_after_transient_failures():
+    func, calls = _flaky(ConnectionError("reset"), failures=2)
+    assert retry(delay=0, jitter=False, host="test-transient")(func)() == "ok"
+    assert calls["n"] == 3
+
+
+def test_retry_does_not_retry_no_data_errors():
+    func, calls = _flaky(NoDataError("No historical data found"), failures=5)
+    with pytest.raises(NoDataError):
+        retry(delay=0, jitter=False, host="test-no-data")(func)()
+    assert calls["n"] == 1
+
+
+def test_retry_chains_last_error_and_respects_budget():
+    func, calls = _flaky(ConnectionError("reset"), failures=10)
+    with pytest.raises(RuntimeError) as info:
+        retry(delay=0, jitter=False, host="test-budget", budget=RetryBudget(limit=2))(func)()
+    assert isinstance(info.value.__cause__, ConnectionError)
+    assert calls["n"] == 3
+
+
+@pytest.mark.parametrize("decorator", [retry, async_retry])
+def test_retry_rejects_zero_attempts(decorator):
+    with pytest.raises(ValueError):
+        decorator(max_retries=0)(lambda: "ok")
+
+
+def test_circuit_breaker_fails_fast_once_open():
+    set_circuit_breaker("test-circuit", CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    func, calls = _flaky(ConnectionError("reset"), failures=10)
+    wrapped = retry(delay=0, jitter=False, host="test-circuit")(func)
+
+    with pytest.raises(RuntimeError):
+        wrapped()
+    with pytest.raises(CircuitOpenError):
+        wrapped()
+    assert calls["n"] == 2
+
+
+@pytest.mark.parametrize("exc", [ValueError("No info found"), KeyError("regularMarketPrice"), TypeError("bad arg")])
+def test_retry_raises_non_transient_errors_immediately(exc):
+    func, calls = _flaky(exc, failures=5)
+    with pytest.raises(type(exc)):
+        retry(delay=0, jitter=False, host="test-non-transient")(func)()
+    assert calls["n"] == 1
+
+
+def test_retry_retries_throttling_errors():
+    func, calls = _flaky(RuntimeError("Too Many Requests. Rate limited."), failures=1)
+    assert retry(delay=0, jitter=False, host="test-throttle")(func)() == "ok"
+    assert calls["n"] == 2
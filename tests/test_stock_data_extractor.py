@@ -0,0 +1,339 @@
+import asyncio
+import threading
+import time
+from dataclasses import asdict
+
+import pandas as pd
+import pytest
+
+from equicast_pyutils.extractors import StockDataExtractor
+from equicast_pyutils.extractors.data_sources import DataSource
+from equicast_pyutils.extractors.exceptions import DelistedSymbolError, NoDataError
+from equicast_pyutils.extractors.get_helpers import GetHelpers
+from equicast_pyutils.extractors.history_range import HistoryRanges, set_default_ranges
+from equicast_pyutils.extractors.metrics import InMemoryMetrics, set_default_metrics
+from equicast_pyutils.extractors.rate_limiter import RateLimiter, rate_limited, set_default_rate_limiter
+from equicast_pyutils.extractors.response_cache import MemoryResponseCache, SQLiteResponseCache, set_default_cache
+from equicast_pyutils.extractors.symbol_registry import SymbolRegistry, set_default_registry
+
+
+def _extractor(fake):
+    extractor = StockDataExtractor(ticker=fake.ticker)
+    extractor._yf_obj = fake
+    return extractor
+
+
+def test_extract_fundamentals_makes_one_history_call(fake_ticker):
+    fake = fake_ticker()
+    extractor = _extractor(fake)
+
+    model = extractor.extract_fundamentals()
+    extractor.extract_stock_price_data()
+
+    assert fake.calls["history"] == 1
+    assert model.day.close == 160.0
+    assert model.one_year.open == GetHelpers.slice_history(fake._history, "1y")["Open"].iloc[0]
+
+
+def test_company_profile_fetches_no_history(fake_ticker):
+    class CountingInfoTicker(fake_ticker):
+        info_calls = 0
+
+        def __getattribute__(self, name):
+            if name == "info":
+                object.__setattr__(self, "info_calls", object.__getattribute__(self, "info_calls") + 1)
+            return super().__getattribute__(name)
+
+    fake = CountingInfoTicker()
+    extractor = _extractor(fake)
+    extractor.extract_company_profile()
+
+    assert fake.calls["history"] == 0 and fake.info_calls == 1 and not extractor.is_delisted
+
+
+def test_response_cache_serves_a_fresh_extractor(tmp_path, fake_ticker):
+    cache = SQLiteResponseCache(str(tmp_path / "responses.sqlite"))
+    set_default_cache(cache)
+    try:
+        fake = fake_ticker()
+        _extractor(fake).extract_stock_price_data()
+        _extractor(fake).extract_stock_price_data()
+    finally:
+        set_default_cache(None)
+
+    assert fake.calls["history"] == 1
+    assert cache.stats()["endpoints"]["history"] == {"hits": 1, "misses": 1}
+    assert cache.stats()["endpoints"]["info"] == {"hits": 1, "misses": 1}
+
+
+def test_async_extraction_prefetches_concurrently(fake_ticker):
+    fakes = [fake_ticker(ticker=f"T{i}") for i in range(20)]
+
+    async def run():
+        return await asyncio.gather(*(_extractor(fake).aextract_fundamentals() for fake in fakes))
+
+    models = asyncio.run(run())
+
+    assert [m.ticker for m in models] == [f.ticker for f in fakes]
+    assert all(m.day.close == 160.0 for m in models)
+
+
+def test_async_extraction_builds_models_without_the_sync_path(monkeypatch, fake_ticker):
+    expected = _extractor(fake_ticker())
+    expected = (expected.extract_fundamentals(), expected.extract_stock_price_data(), expected.extract_dividends())
+
+    def sync_only(*args, **kwargs):
+        raise AssertionError("sync extraction ran on the event loop")
+
+    for name in ("_prefetch", "extract_fundamentals", "extract_stock_price_data", "extract_dividends"):
+        monkeypatch.setattr(StockDataExtractor, name, sync_only)
+    extractor = _extractor(fake_ticker())
+
+    async def run():
+        return await asyncio.gather(
+            extractor.aextract_fundamentals(), extractor.aextract_stock_price_data(), extractor.aextract_dividends()
+        )
+
+    def without_metadata(models):
+        return [{k: v for k, v in asdict(model).items() if k != "metadata"} for model in models]
+
+    assert without_metadata(asyncio.run(run())) == without_metadata(expected)
+
+
+def test_async_and_sync_callers_share_one_in_flight_fetch(fake_ticker):
+    class SlowTicker(fake_ticker):
+        def history(self, *args, **kwargs):
+            time.sleep(0.1)
+            return super().history(*args, **kwargs)
+
+    fake = SlowTicker()
+    extractor = _extractor(fake)
+
+    async def run():
+        return await asyncio.gather(
+            extractor._aget_full_history(interval="1d"),
+            extractor._aget_full_history(interval="1d"),
+            asyncio.to_thread(extractor._get_full_history, interval="1d"),
+            extractor.aextract_stock_price_data(),
+            extractor.aextract_fundamentals(),
+        )
+
+    asyncio.run(run())
+
+    assert fake.calls["history"] == 1
+
+
+def test_rate_limiter_backs_off_and_ramps_up(tmp_path):
+    limiter = RateLimiter(rate=4.0, burst=2.0, increase=1.0, lock_path=str(tmp_path / "bucket.json"))
+
+    assert limiter.acquire() == 0
+    limiter.on_error(RuntimeError("429 Too Many Requests"))
+    assert limiter.rate == 2.0
+    assert limiter.acquire() > 0
+    limiter.on_success()
+    assert limiter.rate == 3.0
+
+
+def test_rate_limiter_ignores_deterministic_errors():
+    limiter = RateLimiter(rate=8.0, burst=100.0, min_rate=0.5, max_rate=8.0)
+    set_default_rate_limiter(limiter)
+
+    @rate_limited
+    def no_data():
+        raise NoDataError("No historical data found for the specified ticker.")
+
+    @rate_limited
+    def reset():
+        raise ConnectionError("reset")
+
+    for _ in range(5):
+        with pytest.raises(NoDataError):
+            no_data()
+    assert limiter.rate == 8.0
+
+    with pytest.raises(ConnectionError):
+        reset()
+    assert limiter.rate == 4.0
+
+
+def test_metrics_record_latency_retries_fallbacks_and_cache_hits(monkeypatch, fake_ticker):
+    class FlakyTicker(fake_ticker):
+        def history(self, *args, **kwargs):
+            if self.calls["history"] == 0:
+                self.calls["history"] += 1
+                raise ConnectionError("reset")
+            return super().history(*args, **kwargs)
+
+    metrics = InMemoryMetrics()
+    set_default_metrics(metrics)
+    set_default_cache(MemoryResponseCache())
+    monkeypatch.setattr("equicast_pyutils.extractors.retry.time.sleep", lambda seconds: None)
+    try:
+        fake = FlakyTicker()
+        _extractor(fake).extract_stock_price_data()
+        _extractor(fake).extract_stock_price_data()
+    finally:
+        set_default_metrics(None)
+        set_default_cache(None)
+
+    # One failed and one successful upstream attempt, each timed on its own.
+    assert metrics.histogram("latency", endpoint="history", ticker="TEST")["count"] == 2
+    assert metrics.counter("errors", endpoint="history", ticker="TEST") == 1
+    assert metrics.counter("retries", ticker="TEST") == 1
+    assert metrics.histogram("sleep_seconds", reason="retry")["count"] == 1
+    assert metrics.histogram("fallback_depth", ticker="TEST")["max"] == 0
+    assert metrics.counter("cache_hits", endpoint="history", ticker="TEST") == 1
+
+
+def test_extract_fundamentals_fetches_concurrently(fake_ticker):
+    # The five upstream calls can only all pass the barrier if they are in flight at the same time; run serially,
+    # the first one times out and breaks it.
+    barrier = threading.Barrier(5, timeout=5)
+    seen = set()
+    lock = threading.Lock()
+
+    def meet(name):
+        with lock:
+            first = name not in seen
+            seen.add(name)
+        if first:
+            barrier.wait()
+
+    class SlowTicker(fake_ticker):
+        def __getattribute__(self, name):
+            if name in ("info", "financials", "balance_sheet", "cash_flow"):
+                meet(name)
+            return super().__getattribute__(name)
+
+        def history(self, *args, **kwargs):
+            meet("history")
+            return super().history(*args, **kwargs)
+
+    fake = SlowTicker()
+    model = _extractor(fake).extract_fundamentals()
+
+    assert seen == {"info", "financials", "balance_sheet", "cash_flow", "history"}
+    assert not barrier.broken
+    assert fake.calls["history"] == 1
+    assert model.day.close == 160.0
+
+
+def test_empty_max_history_is_resolved_with_one_probe(fake_ticker, counting_limiter):
+    class NoMaxTicker(fake_ticker):
+        def history(self, period=None, interval="1d", start=None, end=None, **kwargs):
+            self.calls["history"] += 1
+            if period == "max" or self.ticker == "GONE":
+                return self._history.iloc[:0]
+            return self._history.iloc[self._history.index.searchsorted(start) if start else 0:]
+
+    fake = NoMaxTicker()
+    fake.info["firstTradeDateMilliseconds"] = int(fake._history.index[100].timestamp() * 1000)
+    extractor = _extractor(fake)
+    extractor._get_info()
+
+    assert len(extractor._get_full_history(interval="1d")) == 500 and fake.calls["history"] == 2
+    assert len(_extractor(fake)._fetch_full_history()) == 500 and fake.calls["history"] == 3
+
+    limiter = counting_limiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+    set_default_rate_limiter(limiter)
+    gone = NoMaxTicker(ticker="GONE")
+    with pytest.raises(NoDataError):
+        _extractor(gone)._get_full_history()
+    with pytest.raises(NoDataError):
+        _extractor(gone)._get_full_history()
+    assert gone.calls["history"] == 2 and limiter.acquired == 1
+
+
+def test_probe_window_never_narrows_later_max_requests(fake_ticker):
+    class FlakyMaxTicker(fake_ticker):
+        empty_max = 1
+
+        def history(self, period=None, interval="1d", start=None, end=None, **kwargs):
+            self.calls["history"] += 1
+            if period == "max" and self.empty_max:
+                self.empty_max -= 1
+                return self._history.iloc[:0]
+            return self._history.iloc[-100:] if period == "10y" else self._history.copy()
+
+    fake = FlakyMaxTicker()
+
+    try:
+        set_default_cache(MemoryResponseCache())
+        assert len(_extractor(fake)._get_full_history()) == 100
+        assert len(_extractor(fake)._get_full_history()) == 600 and fake.calls["history"] == 3
+        assert len(_extractor(fake)._get_full_history()) == 600 and fake.calls["history"] == 3
+    finally:
+        set_default_cache(None)
+
+
+def test_probe_window_is_cut_to_the_requested_period(fake_ticker):
+    class NoYearTicker(fake_ticker):
+        def history(self, period=None, interval="1d", start=None, end=None, **kwargs):
+            self.calls["history"] += 1
+            return self._history.iloc[:0] if period == "1y" else self._history.copy()
+
+    fake = NoYearTicker(bars=2500)
+    history = HistoryRanges().fetch(fake, period="1y")
+
+    assert fake.calls["history"] == 2
+    pd.testing.assert_frame_equal(history, GetHelpers.slice_history(fake._history, "1y"))
+    assert history.index[0] >= fake._history.index[-1] - pd.DateOffset(years=1)
+
+
+def test_delisted_registry_persists_and_rechecks(tmp_path, fake_ticker):
+    class FakeSource(DataSource):
+        def ticker(self, symbol):
+            return fake
+
+    fake = fake_ticker(ticker="DEAD")
+    alive = fake._history
+    fake._history = alive.iloc[:0]
+    path = str(tmp_path / "registry.sqlite")
+    try:
+        set_default_registry(SymbolRegistry(path))
+        with pytest.raises(NoDataError):
+            StockDataExtractor(ticker="DEAD", source=FakeSource())._get_full_history()
+        calls = fake.calls["history"]
+
+        # A later run: fresh in-process state, the registry file is all that is left.
+        set_default_ranges(HistoryRanges())
+        registry = SymbolRegistry(path)
+        set_default_registry(registry)
+        extractor = StockDataExtractor(ticker="DEAD", source=FakeSource())
+        with pytest.raises(DelistedSymbolError):
+            extractor._get_full_history()
+        assert extractor.is_delisted and fake.calls["history"] == calls
+
+        fake._history = alive
+        registry._conn.execute("UPDATE symbols SET next_check = 0")
+        assert registry.recheck(lambda symbol: fake) == {"DEAD": True}
+        assert registry.entry("DEAD") is None and fake.calls["history"] == calls + 1
+    finally:
+        set_default_registry(None)
+
+
+def test_async_registry_recheck_probes_off_the_event_loop(fake_ticker):
+    class ThreadRecordingTicker(fake_ticker):
+        probe_threads = []
+
+        def history(self, period=None, *args, **kwargs):
+            if period == "5d":
+                self.probe_threads.append(threading.get_ident())
+            return super().history(period, *args, **kwargs)
+
+    fake = ThreadRecordingTicker()
+    registry = SymbolRegistry()
+    registry.mark(fake.ticker, reason="No price history.")
+    registry._conn.execute("UPDATE symbols SET next_check = 0")
+
+    async def run():
+        return threading.get_ident(), await _extractor(fake)._aget_full_history(interval="1d")
+
+    try:
+        set_default_registry(registry)
+        loop_thread, history = asyncio.run(run())
+    finally:
+        set_default_registry(None)
+
+    assert len(fake.probe_threads) == 1 and fake.probe_threads[0] != loop_thread
+    assert registry.entry(fake.ticker) is None and not history.empty